@@ -8,6 +8,7 @@ from database import db
 from models import Alert
 from price_checker import price_checker
 from email_sender import email_sender
+from event_bus import event_bus
 from services.forex_amd_detector import forex_amd_detector
 
 logger = logging.getLogger(__name__)
@@ -109,6 +110,10 @@ class AlertProcessor:
                 logger.error(f"❌ Error fetching price for {ticker}: {e}")
                 prices[ticker] = None
         
+        # Users whose alert list changed this run; their open dashboards are
+        # notified once at the end instead of polling.
+        changed_users = set()
+        
         for alert in alerts_to_process:
             ticker = alert['ticker']
             current_price = prices.get(ticker)
@@ -119,6 +124,8 @@ class AlertProcessor:
             
             try:
                 Alert.update_price(alert['id'], current_price)
+                if alert['current_price'] is None or float(alert['current_price']) != round(current_price, 2):
+                    changed_users.add(alert['user_id'])
                 logger.debug(f"✅ Updated price in DB for alert #{alert['id']}")
             except Exception as e:
                 logger.error(f"❌ Failed to update price for alert {alert['id']}: {e}")
@@ -247,6 +254,7 @@ class AlertProcessor:
                         logger.error(f"📧 Email failed to send to {alert['user_email']}")
                     
                     Alert.delete_by_id(alert['id'])
+                    changed_users.add(alert['user_id'])
                     logger.info(f"🗑️ Alert #{alert['id']} deleted after trigger")
                     
                     # Mark MA alert as crossed to prevent re-triggering
@@ -264,6 +272,9 @@ class AlertProcessor:
                 except Exception as e:
                     logger.error(f"❌ Error processing triggered alert {alert['id']}: {e}")
         
+        for user_id in changed_users:
+            event_bus.publish(user_id, 'alerts')
+        
         logger.info("✅ Alert processing complete")
     
     def update_ma_alerts(self):
@@ -360,7 +371,7 @@ class AlertProcessor:
     def schedule_forex_amd_detection(self):
         """Schedule forex AMD detection every 15 minutes"""
 
-        def detect_and_alert():
+        def scan():
             run_id = uuid.uuid4().hex[:12]
             run_start = _time.monotonic()
 
@@ -465,6 +476,15 @@ class AlertProcessor:
                 except Exception:
                     pass
 
+        def detect_and_alert():
+            try:
+                scan()
+            finally:
+                # Health and per-user states only change during a run, so
+                # cached snapshots and open debug dashboards refresh once it ends.
+                forex_amd_detector.scans_completed += 1
+                event_bus.broadcast('amd_scan')
+
         self.scheduler.add_job(
             detect_and_alert,
             'interval',
@@ -1,19 +1,36 @@
-from flask import Flask, request, jsonify, render_template_string, redirect, url_for
+from flask import Flask, Response, g, request, render_template, redirect, url_for, stream_with_context
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from werkzeug.exceptions import BadRequest, UnsupportedMediaType
 import logging
 import os
+import queue
+import re
+import threading
 from database import db
-from models import User, Alert
+from models import User, Alert, AlertTrigger, Anomaly
 from price_checker import price_checker
 from alert_processor import alert_processor
 from ticker_fetcher import ticker_fetcher
 from bitcoin_scanner import bitcoin_scanner
+from event_bus import event_bus
 from portfolio_calculator import portfolio_calculator
 from models import Portfolio, Trade
 from portfolio_calculator import portfolio_calculator
 from price_checker import price_checker
+from services.ai_nl_parser import ai_nl_parser
+from services.forex_amd_detector import STATE_NAMES, AMDConfig, forex_amd_detector
+from services.forex_data_provider import forex_data_provider, normalize_symbol
+from schemas import ALERT_TYPES, MA_PERIODS, CreateAlertRequest, TradeInput
+from static_page import StaticPage, asset_url
 import time
-import json
+import hashlib
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +42,39 @@ logger = logging.getLogger(__name__)
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-change-this')
+# Templates are compiled once and kept in jinja_env's cache; never re-stat them.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.globals['asset_url'] = asset_url
+
+# Response compression (brotli preferred, gzip fallback). Bodies that already
+# carry a Content-Encoding (pre-gzipped pages) are left untouched.
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+# Pinned rather than left to the library default so JSON API responses (trade
+# lists are mostly repeated keys) are always covered. Both JS types are listed
+# because which one .js maps to depends on the host's mime.types.
+# text/event-stream stays out, or SSE frames would sit in the compressor's buffer.
+app.config['COMPRESS_MIMETYPES'] = [
+    'application/json', 'text/html', 'text/css', 'text/xml',
+    'text/javascript', 'application/javascript',
+]
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+
+_COMPRESSED_ETAG_SUFFIX = re.compile(r':(?:br|gzip|deflate|zstd)"')
+
+
+@app.before_request
+def strip_compressed_etag_suffix():
+    """Flask-Compress rewrites ETags of compressed bodies to "<tag>:br".
+
+    Strip that suffix from If-None-Match so conditional requests still match
+    the ETag the view (or send_file) computed for the uncompressed body.
+    """
+    inm = request.environ.get('HTTP_IF_NONE_MATCH')
+    if inm and ':' in inm:
+        request.environ['HTTP_IF_NONE_MATCH'] = _COMPRESSED_ETAG_SUFFIX.sub('"', inm)
 
 # Initialize Flask-Login
 login_manager = LoginManager()
@@ -46,6 +96,147 @@ except Exception as _fn_err:
 def load_user(user_id):
     return User.get_by_id(int(user_id))
 
+# ── Static asset caching ──────────────────────────────────────────────────────
+@app.after_request
+def cache_versioned_static(response):
+    """Fingerprinted assets (asset_url(), ?v=<hash>) never change in place."""
+    if request.path.startswith('/static/') and 'v' in request.args and response.status_code == 200:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
+# ── JSON responses ────────────────────────────────────────────────────────────
+# numpy scalars (from yfinance/pandas) and int-keyed dicts serialize the way
+# they did under jsonify(). DB timestamps are naive UTC; OPT_NAIVE_UTC gives
+# them a +00:00 offset so the browser's Date() doesn't read them as local time.
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+
+def _json_default(obj):
+    """orjson fallback for types it does not serialize natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_bytes(obj) -> bytes:
+    """obj serialized with orjson, using the same type handling as fastjson()."""
+    return orjson.dumps(obj, default=_json_default, option=_JSON_OPTIONS)
+
+
+def fastjson(obj, status=200):
+    """jsonify() replacement backed by orjson.
+
+    datetime/date values come out as ISO strings and Decimals as floats, so DB
+    rows can be passed through without per-field conversion.
+    """
+    return Response(
+        json_bytes(obj),
+        status=status,
+        mimetype='application/json',
+    )
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """app.json backed by orjson.
+
+    Blueprints still call jsonify() and request.get_json(); with this they get
+    the same encoder, and the same type handling, as fastjson(). Calls with
+    options orjson has no equivalent for (the session serializer's
+    object_hook/default, tojson's kwargs) go to the stdlib provider.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return json_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        # Skip the str round-trip dumps() needs
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(json_bytes(obj), mimetype='application/json')
+
+
+app.json = OrjsonProvider(app)
+
+
+def json_body():
+    """The request's JSON body parsed with orjson ({} when empty).
+
+    Stands in for request.json: a body that isn't sent as application/json
+    aborts with 415 (so cross-site text/plain form posts are refused) and
+    malformed JSON with 400.
+    """
+    data = request.get_data(cache=False)
+    if not data:
+        return {}
+    if not request.is_json:
+        raise UnsupportedMediaType('Content-Type must be application/json')
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        raise BadRequest('Invalid JSON body') from None
+
+
+def sse_event(event: str, data) -> bytes:
+    """One Server-Sent Events frame with a JSON payload."""
+    return b'event: ' + event.encode() + b'\ndata: ' + json_bytes(data) + b'\n\n'
+
+
+def sse_response(generator):
+    """Streaming text/event-stream response (never buffered or cached)."""
+    resp = Response(stream_with_context(generator), mimetype='text/event-stream')
+    resp.headers['Cache-Control'] = 'no-cache'
+    resp.headers['X-Accel-Buffering'] = 'no'
+    return resp
+
+
+def body_etag(body: bytes) -> str:
+    """Short content hash used as the ETag for pre-serialized bodies."""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def conditional_json(body: bytes, etag: str, max_age=None):
+    """Serve pre-serialized JSON, or an empty 304 if the client has it already.
+
+    Without max_age the client must revalidate every time (cheap: the 304
+    carries no body).
+    """
+    resp = Response(body, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.cache_control.private = True
+    if max_age is None:
+        resp.cache_control.no_cache = True
+    else:
+        resp.cache_control.max_age = max_age
+    return resp.make_conditional(request)
+
+
+def state_etag(*parts) -> str:
+    """ETag derived from the inputs a response is computed from.
+
+    Lets a route answer 304 before building (or serializing) the body, when
+    those inputs are cheap to read and fully determine the output.
+    """
+    return body_etag(repr(parts).encode())
+
+
+def not_modified(etag: str):
+    """Bodiless 304 carrying the same validators conditional_json() sets."""
+    resp = Response(status=304)
+    resp.set_etag(etag)
+    resp.cache_control.private = True
+    resp.cache_control.no_cache = True
+    return resp
+# ─────────────────────────────────────────────────────────────────────────────
+
 # ============================================================================
 # ROUTES - ADD ALL OF THESE
 # ============================================================================
@@ -58,11 +249,11 @@ def index():
 
 @app.route('/health')
 def health():
-    return jsonify({'status': 'ok'}), 200
+    return fastjson({'status': 'ok'}, 200)
 
-@app.route('/login')
-def login_page():
-    html = """
+# The HTML pages below have no template tags and nothing per-user, so each
+# StaticPage is encoded once at import.
+_LOGIN_PAGE = StaticPage("""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -122,12 +313,13 @@ def login_page():
         </script>
     </body>
     </html>
-    """
-    return render_template_string(html)
+""")
 
-@app.route('/register')  
-def register_page():
-    html = """
+@app.route('/login')
+def login_page():
+    return _LOGIN_PAGE.response()
+
+_REGISTER_PAGE = StaticPage("""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -190,13 +382,13 @@ def register_page():
         </script>
     </body>
     </html>
-    """
-    return render_template_string(html)
+""")
 
-@app.route('/dashboard')
-@login_required
-def dashboard():
-    html = """
+@app.route('/register')  
+def register_page():
+    return _REGISTER_PAGE.response()
+
+_DASHBOARD_PAGE = StaticPage("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -230,7 +422,7 @@ def dashboard():
             font-weight: 700;
             cursor: pointer;
             font-size: 15px;
-            transition: all 0.2s ease;
+            transition: box-shadow 0.2s ease, transform 0.2s ease;
             margin-top: 10px;
             box-shadow: 0 4px 24px rgba(91,124,255,0.35), 0 2px 8px rgba(0,0,0,0.2);
         }
@@ -288,10 +480,10 @@ def dashboard():
         .ticker-name   { font-size: 12px; color: #8B92A8; margin-left: 8px; }
         .ticker-type   { font-size: 10px; font-weight: 700; padding: 2px 7px; border-radius: 99px; background: rgba(91,124,255,0.12); color: #5B7CFF; }
         .alert-type-toggle { display: grid; grid-template-columns: 1fr 1fr; gap: 4px; background: rgba(255,255,255,0.04); border: 1px solid rgba(255,255,255,0.08); border-radius: 10px; padding: 4px; margin-bottom: 20px; }
-        .toggle-option { height: 40px; border-radius: 8px; background: transparent; border: none; color: #8B92A8; font-size: 13px; font-weight: 600; transition: all 0.2s; margin: 0; width: auto; cursor: pointer; }
+        .toggle-option { height: 40px; border-radius: 8px; background: transparent; border: none; color: #8B92A8; font-size: 13px; font-weight: 600; transition: background-color 0.2s ease, color 0.2s ease, box-shadow 0.2s ease; margin: 0; width: auto; cursor: pointer; }
         .toggle-option.active { background: #5B7CFF; color: #fff; box-shadow: 0 2px 10px rgba(91,124,255,0.3); }
         .ma-selector { display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px; margin-bottom: 16px; }
-        .ma-option { height: 56px; background: rgba(255,255,255,0.05); border: 1px solid rgba(255,255,255,0.1); border-radius: 12px; display: flex; flex-direction: column; align-items: center; justify-content: center; gap: 2px; cursor: pointer; transition: all 0.2s; }
+        .ma-option { height: 56px; background: rgba(255,255,255,0.05); border: 1px solid rgba(255,255,255,0.1); border-radius: 12px; display: flex; flex-direction: column; align-items: center; justify-content: center; gap: 2px; cursor: pointer; transition: background-color 0.2s ease, border-color 0.2s ease, box-shadow 0.2s ease; }
         .ma-option:hover { background: rgba(255,255,255,0.08); }
         .ma-option.active { background: rgba(0,217,255,0.08); border-color: #00D9FF; box-shadow: 0 0 0 3px rgba(0,217,255,0.15); }
         .ma-label { font-size: 15px; font-weight: 700; color: #fff; }
@@ -364,15 +556,15 @@ def dashboard():
     <div id="maAlertFields" style="display: none;">
         <label>Moving Average Period</label>
         <div class="ma-selector">
-            <div class="ma-option active" onclick="selectMA(20)">
+            <div class="ma-option active" data-period="20" onclick="selectMA(20)">
                 <div class="ma-label">MA 20</div>
                 <div class="ma-sublabel">Short</div>
             </div>
-            <div class="ma-option" onclick="selectMA(50)">
+            <div class="ma-option" data-period="50" onclick="selectMA(50)">
                 <div class="ma-label">MA 50</div>
                 <div class="ma-sublabel">Medium</div>
             </div>
-            <div class="ma-option" onclick="selectMA(150)">
+            <div class="ma-option" data-period="150" onclick="selectMA(150)">
                 <div class="ma-label">MA 150</div>
                 <div class="ma-sublabel">Long</div>
             </div>
@@ -430,36 +622,55 @@ def dashboard():
     </div><!-- /.main-content -->
     
     <script>
+        // Flip to true locally to trace polling/autocomplete in the console
+        const DEBUG = false;
+        const log = DEBUG ? console.log.bind(console) : () => {};
+
         let allTickers = [];
         let selectedTicker = null;
 
+        // DOM refs, looked up once — the script runs after the markup above
+        const $priceFields = document.getElementById('priceAlertFields');
+        const $maFields = document.getElementById('maAlertFields');
+        const $priceTypeBtn = document.getElementById('priceTypeBtn');
+        const $maTypeBtn = document.getElementById('maTypeBtn');
+        const $targetPrice = document.getElementById('targetPrice');
+        const $maPeriod = document.getElementById('maPeriod');
+        const $message = document.getElementById('message');
+        const $createBtn = document.getElementById('createBtn');
+        const $alertsList = document.getElementById('alertsList');
+        const $nlInput = document.getElementById('nlAlertInput');
+        const $nlMessage = document.getElementById('nlMessage');
+        const $nlPreview = document.getElementById('nlPreview');
+        const $nlSummary = document.getElementById('nlSummary');
+        const $parseBtn = document.getElementById('parseBtn');
+        const $confirmBtn = document.getElementById('confirmBtn');
+        const toggleOptions = [$priceTypeBtn, $maTypeBtn];
+        const maOptions = Array.from(document.querySelectorAll('.ma-option'));
+
             // NEW: Toggle between price and MA alert fields
        function toggleAlertFields() {
-            const priceFields = document.getElementById('priceAlertFields');
-            const maFields = document.getElementById('maAlertFields');
-            
-            // Check which button is active
-            const isPriceActive = document.getElementById('priceTypeBtn').classList.contains('active');
+            const isPriceActive = $priceTypeBtn.classList.contains('active');
             
             if (isPriceActive) {
-                priceFields.style.display = 'block';
-                maFields.style.display = 'none';
+                $priceFields.style.display = 'block';
+                $maFields.style.display = 'none';
             } else {
-                priceFields.style.display = 'none';
-                maFields.style.display = 'block';
+                $priceFields.style.display = 'none';
+                $maFields.style.display = 'block';
             }
         }
         
         // Load tickers on page load
         async function loadTickers() {
             try {
-              console.log('Loading tickers...');
+              log('Loading tickers...');
               const res = await fetch('/api/tickers');
               const data = await res.json();
         
         if (data.success) {
             allTickers = data.tickers;
-            console.log(`✅ Loaded ${allTickers.length} tickers`);
+            log(`✅ Loaded ${allTickers.length} tickers`);
         } else {
             console.error('❌ Failed to load tickers:', data);
         }
@@ -472,7 +683,7 @@ def dashboard():
             {symbol: 'MSFT', name: 'Microsoft Corporation', type: 'Stock'},
             {symbol: 'BTC-USD', name: 'Bitcoin USD', type: 'Crypto'}
         ];
-        console.log('Using fallback ticker list');
+        log('Using fallback ticker list');
     }
 }
 
@@ -480,22 +691,42 @@ def dashboard():
         // Autocomplete functionality
         const tickerInput = document.getElementById('tickerInput');
         const dropdown = document.getElementById('autocompleteDropdown');
+
+        // The outside-click listener is only attached while the dropdown is
+        // open, so ordinary clicks on the page do no work.
+        function onOutsideClick(e) {
+            if (!tickerInput.contains(e.target) && !dropdown.contains(e.target)) {
+                hideDropdown();
+            }
+        }
+
+        function showDropdown() {
+            if (dropdown.style.display !== 'block') {
+                dropdown.style.display = 'block';
+                document.addEventListener('click', onOutsideClick);
+            }
+        }
+
+        function hideDropdown() {
+            dropdown.style.display = 'none';
+            document.removeEventListener('click', onOutsideClick);
+        }
         
         tickerInput.addEventListener('input', function() {
     const query = this.value.toUpperCase().trim();
     
-    console.log(`Searching for: "${query}"`);
+    log(`Searching for: "${query}"`);
     
     if (query.length < 1) {
-        dropdown.style.display = 'none';
+        hideDropdown();
         selectedTicker = null;
         return;
     }
     
     if (allTickers.length === 0) {
-        console.error('No tickers loaded yet!');
+        log('No tickers loaded yet!');
         dropdown.innerHTML = '<div class="autocomplete-item">Loading tickers...</div>';
-        dropdown.style.display = 'block';
+        showDropdown();
         return;
     }
     
@@ -504,10 +735,10 @@ def dashboard():
         t.name.toUpperCase().includes(query)
     ).slice(0, 10);
     
-    console.log(`Found ${matches.length} matches`);
+    log(`Found ${matches.length} matches`);
     
     if (matches.length === 0) {
-        dropdown.style.display = 'none';
+        hideDropdown();
         return;
     }
     
@@ -519,29 +750,22 @@ def dashboard():
         </div>
     `).join('');
     
-    dropdown.style.display = 'block';
-    console.log('Dropdown shown');
+    showDropdown();
+    log('Dropdown shown');
 });
 
         
         function selectTicker(symbol, name) {
             selectedTicker = symbol;
             tickerInput.value = symbol;
-            dropdown.style.display = 'none';
+            hideDropdown();
         }
         
-        // Close dropdown when clicking outside
-        document.addEventListener('click', function(e) {
-            if (!tickerInput.contains(e.target) && !dropdown.contains(e.target)) {
-                dropdown.style.display = 'none';
-            }
-        });
-        
     async function createAlert() {
         const ticker = selectedTicker || tickerInput.value.toUpperCase().trim();
-        const alertType = document.getElementById('priceTypeBtn').classList.contains('active') ? 'price' : 'ma';
-        const msgEl = document.getElementById('message');
-        const btn = document.getElementById('createBtn');
+        const alertType = $priceTypeBtn.classList.contains('active') ? 'price' : 'ma';
+        const msgEl = $message;
+        const btn = $createBtn;
     
         if (!ticker) {
             msgEl.innerHTML = '<div class="message error">Please select a ticker</div>';
@@ -552,13 +776,13 @@ def dashboard():
         let payload = { ticker, alert_type: alertType };
     
         if (alertType === 'ma') {
-            const maPeriod = parseInt(document.getElementById('maPeriod').value);
+            const maPeriod = parseInt($maPeriod.value);
     
             payload.ma_period = maPeriod;
             payload.direction = 'up';  // MA alerts always trigger when price > MA
             payload.target_price = 0;  // Will be set by backend to current MA value
         } else {
-        const target = parseFloat(document.getElementById('targetPrice').value);
+        const target = parseFloat($targetPrice.value);
         
         if (!target) {
             msgEl.innerHTML = '<div class="message error">Please enter a target price</div>';
@@ -584,9 +808,8 @@ def dashboard():
                 if (data.success) {
                     msgEl.innerHTML = '<div class="message success">✓ Alert created successfully!</div>';
                     tickerInput.value = '';
-                    document.getElementById('targetPrice').value = '';
-                    document.getElementById('alertType').value = 'price';
-                    toggleAlertFields();  // Reset to price view
+                    $targetPrice.value = '';
+                    switchAlertType('price');  // Reset to price view
                     selectedTicker = null;
                     loadAlerts();
                 } else {
@@ -600,98 +823,102 @@ def dashboard():
             }
         }
         
+        // Alert card template, split once into constant chunks so each poll
+        // only pushes the per-alert values and joins a single array.
+        const CARD_TPL_OPEN = '<div class="alert-card ';
+        const CARD_TPL_HEAD = '" style="background: rgba(255,255,255,0.05); backdrop-filter: blur(20px); border: 1px solid rgba(255,255,255,0.08); border-radius: 16px; padding: 20px; margin-bottom: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.2); position: relative; overflow: hidden;">'
+            + '<div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 16px;">'
+            + '<div style="display: flex; align-items: center; gap: 8px;">'
+            + '<span style="font-size: 18px; font-weight: 700; letter-spacing: -0.3px; color: #FFFFFF;">';
+        const CARD_TPL_BADGE = '</span><span class="status-badge ';
+        const CARD_TPL_BADGE_STYLE = '" style="font-size: 11px; font-weight: 600; padding: 4px 8px; border-radius: 6px;">';
+        const CARD_TPL_STATUS = '</span></div><div class="status-indicator ';
+        const CARD_TPL_STATUS_STYLE = '" style="font-size: 12px; font-weight: 600; padding: 6px 10px; border-radius: 8px; display: inline-flex; align-items: center; gap: 4px;">'
+            + '<span class="status-dot" style="width: 6px; height: 6px; border-radius: 50%; background: currentColor; box-shadow: 0 0 8px currentColor;"></span>';
+        const CARD_TPL_CURRENT = '</div></div>'
+            + '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 16px;"><div>'
+            + '<div style="font-size: 12px; font-weight: 500; color: #8B92A8; margin-bottom: 4px;">Current Price</div>'
+            + '<div style="font-size: 20px; font-weight: 600; font-variant-numeric: tabular-nums; letter-spacing: -0.3px; color: #FFFFFF;">$';
+        const CARD_TPL_TARGET_LABEL = '</div></div><div>'
+            + '<div style="font-size: 12px; font-weight: 500; color: #8B92A8; margin-bottom: 4px;">';
+        const CARD_TPL_TARGET = '</div>'
+            + '<div style="font-size: 20px; font-weight: 600; font-variant-numeric: tabular-nums; letter-spacing: -0.3px; color: #FFFFFF;">$';
+        const CARD_TPL_DISTANCE = '</div></div></div>'
+            + '<div style="margin-top: 12px; font-size: 13px; color: #8B92A8;">';
+        const CARD_TPL_DELETE = '</div><button onclick="deleteAlert(';
+        const CARD_TPL_CLOSE = ')" style="width: 100%; margin-top: 16px; padding: 10px; background: rgba(255,107,107,0.15); border: 1px solid rgba(255,107,107,0.25); border-radius: 8px; color: #FF6B6B; font-size: 13px; font-weight: 600;">'
+            + 'Delete Alert</button></div>';
+
+        function pushAlertCard(out, alert) {
+            const current = alert.current_price || 0;
+            const target = alert.target_price || 0;
+            const isMA = alert.alert_type === 'ma';
+            const isAbove = current >= target;
+            const pct = target > 0 ? ((Math.abs(current - target) / target) * 100).toFixed(1) : '0.0';
+            const targetLabel = isMA ? 'MA' + alert.ma_period : 'Target';
+
+            out.push(
+                CARD_TPL_OPEN, isMA ? 'ma-alert' : '',
+                CARD_TPL_HEAD, alert.ticker,
+                CARD_TPL_BADGE, isMA ? 'ma' : 'price',
+                CARD_TPL_BADGE_STYLE, isMA ? 'MA ' + alert.ma_period : 'PRICE',
+                CARD_TPL_STATUS, isAbove ? 'above' : 'below',
+                CARD_TPL_STATUS_STYLE, isAbove ? 'Above' : 'Below',
+                CARD_TPL_CURRENT, current.toFixed(2),
+                CARD_TPL_TARGET_LABEL, targetLabel,
+                CARD_TPL_TARGET, target.toFixed(2),
+                CARD_TPL_DISTANCE, pct, '% away from ', targetLabel.toLowerCase(),
+                CARD_TPL_DELETE, alert.id,
+                CARD_TPL_CLOSE
+            );
+        }
+
+        function renderAlertCards(alerts) {
+            const out = [];
+            for (let i = 0; i < alerts.length; i++) pushAlertCard(out, alerts[i]);
+            return out.join('');
+        }
+
+        function showAlerts(data) {
+            if (!data.success) {
+                $alertsList.innerHTML = '<div class="error">Failed to load alerts</div>';
+                return;
+            }
+            
+            const active = data.alerts.filter(a => a.active);
+            
+            if (active.length === 0) {
+                $alertsList.innerHTML = '<div class="empty">No active alerts. Create one to get started!</div>';
+                return;
+            }
+            
+            $alertsList.innerHTML = renderAlertCards(active);
+        }
+
+        // Only one /api/alerts request in flight: a new poll aborts the previous
+        // one so a slow response can never render over a fresher one.
+        let alertsInflight = null;
+
         async function loadAlerts() {
-    const alertsEl = document.getElementById('alertsList');
+    const alertsEl = $alertsList;
+    if (alertsInflight) alertsInflight.abort();
+    const controller = alertsInflight = new AbortController();
     
     try {
-        console.log('🔄 Loading alerts...');  // ADD THIS
         // Add timestamp to prevent caching
         const timestamp = new Date().getTime();
-        const res = await fetch(`/api/alerts?t=${timestamp}`);
-        console.log('Response status:', res.status);  // ADD THIS
+        const res = await fetch(`/api/alerts?t=${timestamp}`, { signal: controller.signal });
         const data = await res.json();
-        console.log('Alerts data:', data);  // ADD THIS
-        
-        console.log(`📊 [${new Date().toLocaleTimeString()}] Alerts loaded:`, data);
-        
-        if (!data.success) {
-            alertsEl.innerHTML = '<div class="error">Failed to load alerts</div>';
-            return;
-        }
         
-        const active = data.alerts.filter(a => a.active);
-        
-        if (active.length === 0) {
-            alertsEl.innerHTML = '<div class="empty">No active alerts. Create one to get started!</div>';
-            return;
-        }
-        
-        // Generate unique key for each render to force update
-        const renderKey = Math.random().toString(36).substring(7);
-        
-        alertsEl.innerHTML = active.map(alert => {
-        const current = alert.current_price || 0;
-        const target = alert.target_price || 0;
-        const alertType = alert.alert_type || 'price';
-        const maPeriod = alert.ma_period;
-        
-        // Calculate status (above/below)
-        const isAbove = current >= target;
-        
-        // Calculate percentage difference
-        const diff = Math.abs(current - target);
-        const pct = target > 0 ? ((diff / target) * 100).toFixed(1) : '0.0';
-        
-        // Determine colors and labels
-        const accentClass = alertType === 'ma' ? 'ma-alert' : '';
-        const badgeLabel = alertType === 'ma' ? `MA ${maPeriod}` : 'PRICE';
-        const badgeClass = alertType === 'ma' ? 'ma' : 'price';
-        const targetLabel = alertType === 'ma' ? `MA${maPeriod}` : 'Target';
-        
-        return `
-            <div class="alert-card ${accentClass}" style="background: rgba(255,255,255,0.05); backdrop-filter: blur(20px); border: 1px solid rgba(255,255,255,0.08); border-radius: 16px; padding: 20px; margin-bottom: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.2); position: relative; overflow: hidden;">
-                
-                <!-- Header Row -->
-                <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 16px;">
-                    <div style="display: flex; align-items: center; gap: 8px;">
-                        <span style="font-size: 18px; font-weight: 700; letter-spacing: -0.3px; color: #FFFFFF;">${alert.ticker}</span>
-                        <span class="status-badge ${badgeClass}" style="font-size: 11px; font-weight: 600; padding: 4px 8px; border-radius: 6px;">${badgeLabel}</span>
-                    </div>
-                    
-                    <div class="status-indicator ${isAbove ? 'above' : 'below'}" style="font-size: 12px; font-weight: 600; padding: 6px 10px; border-radius: 8px; display: inline-flex; align-items: center; gap: 4px;">
-                        <span class="status-dot" style="width: 6px; height: 6px; border-radius: 50%; background: currentColor; box-shadow: 0 0 8px currentColor;"></span>
-                        ${isAbove ? 'Above' : 'Below'}
-                    </div>
-                </div>
-                
-                <!-- Prices Grid -->
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 16px;">
-                    <div>
-                        <div style="font-size: 12px; font-weight: 500; color: #8B92A8; margin-bottom: 4px;">Current Price</div>
-                        <div style="font-size: 20px; font-weight: 600; font-variant-numeric: tabular-nums; letter-spacing: -0.3px; color: #FFFFFF;">$${current.toFixed(2)}</div>
-                    </div>
-                    <div>
-                        <div style="font-size: 12px; font-weight: 500; color: #8B92A8; margin-bottom: 4px;">${targetLabel}</div>
-                        <div style="font-size: 20px; font-weight: 600; font-variant-numeric: tabular-nums; letter-spacing: -0.3px; color: #FFFFFF;">$${target.toFixed(2)}</div>
-                    </div>
-                </div>
-                
-                <!-- Distance Info -->
-                <div style="margin-top: 12px; font-size: 13px; color: #8B92A8;">
-                    ${pct}% away from ${targetLabel.toLowerCase()}
-                </div>
-                
-                <!-- Delete Button -->
-                <button onclick="deleteAlert(${alert.id})" style="width: 100%; margin-top: 16px; padding: 10px; background: rgba(255,107,107,0.15); border: 1px solid rgba(255,107,107,0.25); border-radius: 8px; color: #FF6B6B; font-size: 13px; font-weight: 600;">
-                    Delete Alert
-                </button>
-            </div>
-        `;
-    }).join('');
+        log(`📊 [${new Date().toLocaleTimeString()}] Alerts loaded:`, data);
+        showAlerts(data);
         
     } catch (error) {
+        if (error.name === 'AbortError') return;
         console.error('❌ Error loading alerts:', error);
         alertsEl.innerHTML = '<div class="error">Failed to load alerts</div>';
+    } finally {
+        if (alertsInflight === controller) alertsInflight = null;
     }
 }
 
@@ -713,44 +940,39 @@ def dashboard():
         }
         
         // Initialize
-        console.log('starting initialize')
-        loadAlerts();
         loadTickers();
-        setInterval(loadAlerts, 10000); // Refresh every 30 seconds
-        // Premium UI Functions
-        function switchAlertType(type) {
-        document.querySelectorAll('.toggle-option').forEach(btn => {
-            btn.classList.remove('active');
-        });
-        
-        if (type === 'price') {
-            document.getElementById('priceTypeBtn').classList.add('active');
+        if (window.EventSource) {
+            // The server pushes the alert list on connect and whenever the
+            // price checker changes it; EventSource reconnects on its own.
+            const alertStream = new EventSource('/api/alerts/stream');
+            alertStream.addEventListener('alerts', e => showAlerts(JSON.parse(e.data)));
         } else {
-            document.getElementById('maTypeBtn').classList.add('active');
+            loadAlerts();
+            setInterval(loadAlerts, 10000);
         }
+        // Premium UI Functions
+        function switchAlertType(type) {
+        toggleOptions.forEach(btn => btn.classList.remove('active'));
+        (type === 'price' ? $priceTypeBtn : $maTypeBtn).classList.add('active');
         
         toggleAlertFields();
     }
     
     function selectMA(period) {
-        // Remove active from all
-        document.querySelectorAll('.ma-option').forEach(opt => {
-            opt.classList.remove('active');
+        maOptions.forEach(opt => {
+            opt.classList.toggle('active', opt.dataset.period === String(period));
         });
         
-        // Add active to clicked
-        event.target.closest('.ma-option').classList.add('active');
-        
         // Update hidden input
-        document.getElementById('maPeriod').value = period;
+        $maPeriod.value = period;
     }
     // Natural Language Alert Functions
 let nlSuggestion = null;
 
 async function parseNLAlert() {
-    const text = document.getElementById('nlAlertInput').value.trim();
-    const msgEl = document.getElementById('nlMessage');
-    const parseBtn = document.getElementById('parseBtn');
+    const text = $nlInput.value.trim();
+    const msgEl = $nlMessage;
+    const parseBtn = $parseBtn;
     
     if (!text) {
         msgEl.innerHTML = '<div class="message error">Please enter some text</div>';
@@ -778,7 +1000,7 @@ async function parseNLAlert() {
     const confidenceColor = confidence >= 80 ? '#00FFA3' : confidence >= 50 ? '#FFB800' : '#FF6B6B';
     
     // Build enhanced preview with interpretation
-    document.getElementById('nlSummary').innerHTML = `
+    $nlSummary.innerHTML = `
         <div style="margin-bottom: 8px; font-size: 15px; font-weight: 600;">
             ${nlSuggestion.summary}
         </div>
@@ -792,7 +1014,7 @@ async function parseNLAlert() {
         </div>
     `;
     
-    document.getElementById('nlPreview').style.display = 'block';
+    $nlPreview.style.display = 'block';
     msgEl.innerHTML = '';
     } else {
             msgEl.innerHTML = `<div class="message error">${data.error}</div>`;
@@ -809,8 +1031,8 @@ async function parseNLAlert() {
 async function confirmNLAlert() {
     if (!nlSuggestion) return;
     
-    const confirmBtn = document.getElementById('confirmBtn');
-    const msgEl = document.getElementById('nlMessage');
+    const confirmBtn = $confirmBtn;
+    const msgEl = $nlMessage;
     confirmBtn.disabled = true;
     confirmBtn.textContent = 'Creating...';
     
@@ -825,7 +1047,7 @@ async function confirmNLAlert() {
         
         if (data.success) {
             msgEl.innerHTML = '<div class="message success">✓ Alert created successfully!</div>';
-            document.getElementById('nlAlertInput').value = '';
+            $nlInput.value = '';
             cancelNLAlert();
             loadAlerts();  // Refresh alert list
         } else {
@@ -841,133 +1063,157 @@ async function confirmNLAlert() {
 }
 
 function cancelNLAlert() {
-    document.getElementById('nlPreview').style.display = 'none';
-    document.getElementById('nlMessage').innerHTML = '';
+    $nlPreview.style.display = 'none';
+    $nlMessage.innerHTML = '';
     nlSuggestion = null;
 }
 
     </script>
 </body>
 </html>
-"""
-    return render_template_string(html)
+""")
+
+@app.route('/dashboard')
+@login_required
+def dashboard():
+    return _DASHBOARD_PAGE.response()
 
 @app.route('/api/register', methods=['POST'])
 def api_register():
-    data = request.json
+    data = json_body()
     email = data.get('email')
     password = data.get('password')
     
     if not email or not password:
-        return jsonify({'success': False, 'error': 'Email and password required'}), 400
+        return fastjson({'success': False, 'error': 'Email and password required'}, 400)
     
     existing = User.get_by_email(email)
     if existing:
-        return jsonify({'success': False, 'error': 'Email already registered'}), 400
+        return fastjson({'success': False, 'error': 'Email already registered'}, 400)
     
     try:
         User.create(email, password)
-        return jsonify({'success': True})
+        return fastjson({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': 'Registration failed'}), 500
+        return fastjson({'success': False, 'error': 'Registration failed'}, 500)
 
 @app.route('/api/login', methods=['POST'])
 def api_login():
-    data = request.json
+    data = json_body()
     email = data.get('email')
     password = data.get('password')
     
     user = User.verify_password(email, password)
     
     if not user:
-        return jsonify({'success': False, 'error': 'Invalid email or password'}), 401
+        return fastjson({'success': False, 'error': 'Invalid email or password'}, 401)
     
     login_user(user)
-    return jsonify({'success': True, 'email': email})
+    return fastjson({'success': True, 'email': email})
 
 @app.route('/api/logout')
 @login_required
 def api_logout():
     logout_user()
-    return jsonify({'success': True})
+    return fastjson({'success': True})
 
 @app.route('/api/alerts', methods=['GET'])
 @login_required
 def get_alerts():
     """Get current user's alerts"""
     try:
-        alerts_raw = Alert.get_user_alerts(current_user.id)
-        
-        # Convert to plain dicts with explicit price conversion
-        alerts = []
-        for alert in alerts_raw:
-            alerts.append({
-                'id': alert['id'],
-                'ticker': alert['ticker'],
-                'target_price': float(alert['target_price']),
-                'current_price': float(alert['current_price']) if alert['current_price'] else None,
-                'direction': alert['direction'],
-                'active': alert['active'],
-                'created_at': alert['created_at'].isoformat() if hasattr(alert['created_at'], 'isoformat') else str(alert['created_at']),
-                'triggered_at': alert['triggered_at'].isoformat() if alert.get('triggered_at') and hasattr(alert['triggered_at'], 'isoformat') else alert.get('triggered_at'),
-                'triggered_price': float(alert['triggered_price']) if alert.get('triggered_price') else None,
-                'alert_type': alert.get('alert_type', 'price'),
-                'ma_period': alert.get('ma_period'),
-                'ma_value': float(alert['ma_value']) if alert.get('ma_value') else None
-            })
+        # Prices arrive as floats (cast in SQL) and fastjson writes the
+        # timestamps as ISO strings, so the rows are returned as-is.
+        alerts = Alert.get_user_alerts(current_user.id) or []
         
-        logger.info(f"📤 Returning {len(alerts)} alerts for user {current_user.id}")
+        logger.info("📤 Returning %s alerts for user %s", len(alerts), current_user.id)
         
-        # Log each alert's current state
-        for alert in alerts:
-            logger.debug(f"Alert: {alert['ticker']} - Current: ${alert['current_price'] or 0:.2f}, Target: ${alert['target_price']:.2f}")
+        # Log each alert's current state (skipped entirely above DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            for alert in alerts:
+                logger.debug("Alert: %s - Current: $%.2f, Target: $%.2f",
+                             alert['ticker'], alert['current_price'] or 0, alert['target_price'])
         
-        return jsonify({'success': True, 'alerts': alerts})
+        return fastjson({'success': True, 'alerts': alerts})
     
     except Exception as e:
-        logger.error(f"❌ Error getting alerts for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e), 'alerts': []}), 500
+        logger.error("❌ Error getting alerts for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e), 'alerts': []}, 500)
+
+_SSE_HEARTBEAT = 25  # seconds; keeps proxies from closing idle streams
+
+
+@app.route('/api/alerts/stream')
+@login_required
+def alerts_stream():
+    """Server-Sent Events: the user's alert list on connect and on every change."""
+    user_id = current_user.id
+
+    def alerts_event():
+        rows = Alert.get_user_alerts(user_id) or []
+        return sse_event('alerts', {'success': True, 'alerts': rows})
+
+    return sse_response(_user_event_stream(user_id, ('alerts',), alerts_event))
+
+
+def _user_event_stream(user_id, events, build_frame):
+    """SSE generator: build_frame() on connect and whenever user_id gets one
+    of `events`.
+
+    Other event types published to the user are skipped, so each page's
+    stream only refreshes the data it shows.
+    """
+    q = event_bus.subscribe(user_id)
+    try:
+        yield build_frame()
+        while True:
+            try:
+                names = {q.get(timeout=_SSE_HEARTBEAT)[0]}
+            except queue.Empty:
+                yield ': keep-alive\n\n'
+                continue
+            # Collapse a burst of notifications into one refresh
+            while not q.empty():
+                names.add(q.get_nowait()[0])
+            if not names.isdisjoint(events):
+                yield build_frame()
+    finally:
+        event_bus.unsubscribe(user_id, q)
 
 @app.route('/api/alerts', methods=['POST'])
 @login_required
 def create_alert():
-    data = request.json
-    ticker = data.get('ticker', '').upper()
-    target_price = float(data.get('target_price', 0))
-    
-    # NEW: Get alert type and MA period
-    alert_type = data.get('alert_type', 'price')
-    ma_period = data.get('ma_period')
-    direction = data.get('direction', 'up')
-    
-    if not ticker:
-        return jsonify({'success': False, 'error': 'Ticker required'}), 400
-    
-    # Validate alert type
-    if alert_type not in ['price', 'ma']:
-        return jsonify({'success': False, 'error': 'Invalid alert type'}), 400
-    
-    # Validate MA period if MA alert
-    if alert_type == 'ma' and ma_period not in [20, 50, 150]:
-        return jsonify({'success': False, 'error': 'Invalid MA period'}), 400
-    
-    # Get current price
-    current_price = price_checker.get_price(ticker)
-    if current_price is None:
-        return jsonify({'success': False, 'error': 'Invalid ticker or unable to fetch price'}), 400
+    try:
+        req = CreateAlertRequest.from_json(json_body())
+    except BadRequest:
+        return fastjson({'success': False, 'error': 'Invalid JSON body'}, 400)
+    except ValueError as e:
+        return fastjson({'success': False, 'error': str(e)}, 400)
+
+    ticker = req.ticker
+    target_price = req.target_price
+    alert_type = req.alert_type
+    ma_period = req.ma_period
+    direction = req.direction
     
-    # For MA alerts, calculate and set target_price to current MA value
+    # For MA alerts, price and MA come from one history fetch and the
+    # target_price is set to the current MA value
     if alert_type == 'ma':
-        ma_value = price_checker.get_moving_average(ticker, ma_period)  # FIXED: Use price_checker.
+        current_price, ma_value = price_checker.get_price_and_ma(ticker, ma_period)
+        if current_price is None:
+            return fastjson({'success': False, 'error': 'Invalid ticker or unable to fetch price'}, 400)
         if ma_value is None:
-            return jsonify({'success': False, 'error': f'Could not calculate MA{ma_period} for {ticker}'}), 400
+            return fastjson({'success': False, 'error': f'Could not calculate MA{ma_period} for {ticker}'}, 400)
         target_price = ma_value
         direction = 'up'  # MA alerts trigger when crossing in either direction
-        logger.info(f"MA alert created: {ticker} MA{ma_period} = ${ma_value:.2f}")
+        logger.info("MA alert created: %s MA%s = $%.2f", ticker, ma_period, ma_value)
     else:
-        # Validate target price for price alerts
+        # Validate target price for price alerts before hitting the network
         if target_price <= 0:
-            return jsonify({'success': False, 'error': 'Invalid target price'}), 400
+            return fastjson({'success': False, 'error': 'Invalid target price'}, 400)
+        current_price = price_checker.get_cached_price(ticker)
+        if current_price is None:
+            return fastjson({'success': False, 'error': 'Invalid ticker or unable to fetch price'}, 400)
             
     # Determine direction based on current price vs target
     if direction == 'both':
@@ -976,8 +1222,9 @@ def create_alert():
         
     # Create alert
     alert_id = Alert.create(current_user.id, ticker, target_price, current_price, direction, alert_type, ma_period)
+    event_bus.publish(current_user.id, 'alerts')
     
-    return jsonify({
+    return fastjson({
         'success': True,
         'alert': {
             'id': alert_id,
@@ -994,442 +1241,38 @@ def create_alert():
 @login_required
 def delete_alert(alert_id):
     Alert.delete(alert_id, current_user.id)
-    return jsonify({'success': True})
+    event_bus.publish(current_user.id, 'alerts')
+    return fastjson({'success': True})
+
+# Serialized /api/tickers body; the list is static, so rebuilding it every
+# few minutes is plenty.
+_TICKER_CACHE = {'body': None, 'etag': None, 'expires': 0.0}
+_TICKER_CACHE_TTL = 300  # seconds
+
 
 @app.route('/api/tickers', methods=['GET'])
 def get_tickers():
     """Get list of all available tickers"""
     try:
-        logger.info("📊 /api/tickers called")
-        tickers = ticker_fetcher.get_all_tickers()
-        logger.info(f"✅ Returning {len(tickers)} tickers")
-        return jsonify({'success': True, 'tickers': tickers})
+        if time.monotonic() >= _TICKER_CACHE['expires']:
+            tickers = ticker_fetcher.get_all_tickers()
+            body = orjson.dumps({'success': True, 'tickers': tickers})
+            _TICKER_CACHE.update(body=body, etag=body_etag(body),
+                                 expires=time.monotonic() + _TICKER_CACHE_TTL)
+            logger.info("✅ Cached %s tickers for /api/tickers", len(tickers))
+        return conditional_json(_TICKER_CACHE['body'], _TICKER_CACHE['etag'], max_age=60)
     except Exception as e:
-        logger.error(f"❌ Error in /api/tickers: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("❌ Error in /api/tickers: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
-@app.route('/bitcoin-scanner')
-@login_required
-def bitcoin_scanner_page():
-    """Bitcoin transaction scanner page"""
-    html = """
+_BITCOIN_SCANNER_PAGE = StaticPage("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>Bitcoin Scanner - Stock Alerts</title>
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Inter', system-ui, sans-serif;
-                background: #0A0E1A;
-                background-image: radial-gradient(circle at 50% 0%, #1a1f2e 0%, #0a0e1a 50%);
-                min-height: 100vh;
-                color: #FFFFFF;
-                padding: 20px;
-                -webkit-font-smoothing: antialiased;
-            }
-            .nav {
-                display: flex;
-                gap: 20px;
-                margin-bottom: 30px;
-                padding: 15px;
-                background: rgba(255,255,255,0.05);
-                border-radius: 10px;
-            }
-            .nav a {
-                color: #8B92A8;
-                text-decoration: none;
-                font-weight: 600;
-                font-size: 14px;
-                transition: color 0.3s;
-            }
-            
-            .nav a:hover { color: #5B7CFF; }
-            .container { max-width: 1200px; margin: 0 auto; }
-            .header {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 30px;
-                border-radius: 15px;
-                margin-bottom: 30px;
-                box-shadow: 0 10px 40px rgba(0,0,0,0.3);
-            }
-            .header h1 {
-                font-size: 32px;
-                font-weight: 700;
-                letter-spacing: -0.5px;
-                margin-bottom: 24px;
-            }
-            .card {
-                background: rgba(255,255,255,0.05);
-                backdrop-filter: blur(20px);
-                border: 1px solid rgba(255,255,255,0.08);
-                border-radius: 16px;
-                padding: 25px;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-                margin-bottom: 20px;
-            }
-            .form-grid {
-                display: grid;
-                grid-template-columns: 1fr 1fr auto;
-                gap: 15px;
-                margin-bottom: 20px;
-            }
-            label {
-                display: block;
-                margin-bottom: 8px;
-                font-weight: 600;
-                color: #8B92A8;
-                font-size: 13px;
-                letter-spacing: 0.2px;
-                text-transform: uppercase;
-            }
-            input, select, textarea {
-                width: 100%;
-                height: 56px;
-                padding: 0 16px;
-                background: rgba(255,255,255,0.05);
-                border: 1px solid rgba(255,255,255,0.1);
-                border-radius: 12px;
-                color: #FFFFFF;
-                font-size: 16px;
-                font-weight: 500;
-                font-family: inherit;
-                transition: all 0.3s ease;
-            }
-            
-            textarea {
-                height: auto;
-                min-height: 80px;
-                padding: 16px;
-            }
-                
-            input:focus, select:focus, textarea:focus {
-                outline: none;
-                border-color: #5B7CFF;
-                background: rgba(91,124,255,0.05);
-                box-shadow: 0 0 0 4px rgba(91,124,255,0.1);
-            }
-            
-            input::placeholder {
-                color: #4A5568;
-            }
-            button {
-                width: 100%;
-                padding: 14px;
-                background: linear-gradient(135deg, #5B7CFF 0%, #7B5CFF 100%);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-weight: 700;
-                cursor: pointer;
-                font-size: 15px;
-                transition: all 0.2s ease;
-                margin-top: 10px;
-                box-shadow: 0 4px 24px rgba(91,124,255,0.35), 0 2px 8px rgba(0,0,0,0.2);
-            }
-            
-            button:hover {
-                box-shadow: 0 6px 32px rgba(91,124,255,0.45), 0 2px 8px rgba(0,0,0,0.3);
-            }
-            
-            button:active {
-                transform: scale(0.98);
-            }
-            button:disabled {
-                opacity: 0.5;
-                cursor: not-allowed;
-            }
-            .tx-table {
-                width: 100%;
-                border-collapse: collapse;
-                margin-top: 20px;
-            }
-            .tx-table th {
-                background: rgba(100,255,218,0.1);
-                padding: 15px;
-                text-align: left;
-                font-weight: 600;
-                color: #64ffda;
-                border-bottom: 2px solid rgba(100,255,218,0.3);
-            }
-            .tx-table td {
-                padding: 15px;
-                border-bottom: 1px solid rgba(255,255,255,0.05);
-            }
-            .tx-table tr:hover {
-                background: rgba(255,255,255,0.03);
-            }
-            .hash {
-                font-family: monospace;
-                color: #64ffda;
-                font-size: 12px;
-            }
-            .amount {
-                font-weight: 600;
-                color: #f39c12;
-            }
-            .address {
-                font-family: monospace;
-                font-size: 11px;
-                color: #888;
-            }
-            .loading {
-                text-align: center;
-                padding: 40px;
-                color: #64ffda;
-            }
-            .empty {
-                text-align: center;
-                padding: 40px;
-                color: #888;
-            }
-            .stats {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 15px;
-                margin-bottom: 20px;
-            }
-            .stat-card {
-                background: rgba(100,255,218,0.1);
-                padding: 20px;
-                border-radius: 10px;
-                border: 1px solid rgba(100,255,218,0.2);
-            }
-            .stat-value {
-                font-size: 28px;
-                font-weight: 700;
-                color: #64ffda;
-            }
-            .stat-label {
-                font-size: 13px;
-                color: #888;
-                margin-top: 5px;
-            }
-                        /* Alert Type Toggle */
-            .alert-type-toggle {
-                display: grid;
-                grid-template-columns: 1fr 1fr;
-                gap: 8px;
-                margin-bottom: 24px;
-                background: rgba(255,255,255,0.05);
-                border-radius: 12px;
-                padding: 4px;
-            }
-            
-            .toggle-option {
-                height: 44px;
-                border-radius: 10px;
-                background: transparent;
-                border: none;
-                color: #8B92A8;
-                font-size: 14px;
-                font-weight: 600;
-                box-shadow: none;
-                transition: all 0.3s ease;
-                margin: 0;
-                width: auto;
-            }
-            
-            .toggle-option.active {
-                background: #5B7CFF;
-                color: #FFFFFF;
-                box-shadow: 0 2px 12px rgba(91,124,255,0.3);
-            }
-            
-            /* MA Selector */
-            .ma-selector {
-                display: grid;
-                grid-template-columns: repeat(3, 1fr);
-                gap: 8px;
-            }
-            
-            .ma-option {
-                height: 56px;
-                background: rgba(255,255,255,0.05);
-                border: 1px solid rgba(255,255,255,0.1);
-                border-radius: 12px;
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                justify-content: center;
-                gap: 2px;
-                cursor: pointer;
-                transition: all 0.3s ease;
-            }
-            
-            .ma-option.active {
-                background: rgba(0,217,255,0.1);
-                border-color: #00D9FF;
-                box-shadow: 0 0 0 4px rgba(0,217,255,0.1);
-            }
-            
-            .ma-label {
-                font-size: 15px;
-                font-weight: 700;
-                color: #FFFFFF;
-            }
-            
-            .ma-sublabel {
-                font-size: 11px;
-                font-weight: 500;
-                color: #8B92A8;
-                text-transform: none;
-            }
-            
-            .ma-option.active .ma-sublabel {
-                color: #00D9FF;
-            }
-            
-            /* Financial Values */
-            .financial-value,
-            .price-value,
-            .summary-value {
-                font-variant-numeric: tabular-nums;
-                letter-spacing: -0.3px;
-            }
-            
-            /* Alert Cards */
-            .alert-card {
-                background: rgba(255,255,255,0.05);
-                backdrop-filter: blur(20px);
-                border: 1px solid rgba(255,255,255,0.08);
-                border-radius: 16px;
-                padding: 20px;
-                margin-bottom: 12px;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .alert-card::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                width: 4px;
-                height: 100%;
-                background: linear-gradient(180deg, #5B7CFF 0%, #7B5CFF 100%);
-            }
-            
-            .alert-card.ma-alert::before {
-                background: linear-gradient(180deg, #00D9FF 0%, #0099FF 100%);
-            }
-            
-            /* Status Badges */
-            .status-badge {
-                font-size: 11px;
-                font-weight: 600;
-                padding: 4px 8px;
-                border-radius: 6px;
-                letter-spacing: 0.3px;
-            }
-            
-            .status-badge.price {
-                background: rgba(91,124,255,0.15);
-                color: #5B7CFF;
-                border: 1px solid rgba(91,124,255,0.25);
-            }
-            
-            .status-badge.ma {
-                background: rgba(0,217,255,0.15);
-                color: #00D9FF;
-                border: 1px solid rgba(0,217,255,0.25);
-            }
-            
-            .status-indicator {
-                font-size: 12px;
-                font-weight: 600;
-                padding: 6px 10px;
-                border-radius: 8px;
-                display: inline-flex;
-                align-items: center;
-                gap: 4px;
-            }
-            
-            .status-indicator.above {
-                background: rgba(0,255,163,0.1);
-                color: #00FFA3;
-                border: 1px solid rgba(0,255,163,0.2);
-            }
-            
-            .status-indicator.below {
-                background: rgba(255,107,107,0.1);
-                color: #FF6B6B;
-                border: 1px solid rgba(255,107,107,0.2);
-            }
-            
-            .status-dot {
-                width: 6px;
-                height: 6px;
-                border-radius: 50%;
-                background: currentColor;
-                box-shadow: 0 0 8px currentColor;
-            }
-            
-            /* Price Display */
-            .price-item {
-                margin-bottom: 12px;
-            }
-            
-            .price-label {
-                font-size: 12px;
-                font-weight: 500;
-                color: #8B92A8;
-                margin-bottom: 4px;
-                text-transform: none;
-            }
-            
-            .price-value {
-                font-size: 20px;
-                font-weight: 600;
-                font-variant-numeric: tabular-nums;
-                letter-spacing: -0.3px;
-            }
-            
-            .price-change {
-                font-size: 13px;
-                font-weight: 600;
-                margin-top: 4px;
-            }
-            
-            .price-change.positive {
-                color: #00FFA3;
-            }
-            
-            .price-change.negative {
-                color: #FF6B6B;
-            }
-            
-            /* Autocomplete Dropdown */
-            .autocomplete-dropdown {
-                background: rgba(14,20,32,0.98);
-                backdrop-filter: blur(20px);
-                border: 1px solid rgba(91,124,255,0.3);
-                border-radius: 12px;
-                box-shadow: 0 10px 40px rgba(0,0,0,0.4);
-            }
-            
-            .autocomplete-item:hover {
-                background: rgba(91,124,255,0.1);
-            }
-            
-            .ticker-symbol {
-                font-weight: 700;
-                color: #5B7CFF;
-            }
-            
-            .ticker-name {
-                color: #8B92A8;
-            }
-            
-            .ticker-type {
-                background: rgba(91,124,255,0.15);
-                color: #5B7CFF;
-                font-weight: 600;
-            }
         <link rel="stylesheet" href="/static/css/theme.css">
-        </style>
+        <link rel="stylesheet" href="__BITCOIN_SCANNER_CSS__">
     </head>
     <body>
         <nav class="top-nav wide">
@@ -1460,10 +1303,10 @@ def bitcoin_scanner_page():
                     <div class="form-group">
             <label>Time Period</label>
             <select id="timeRange">
-                <option value="24">Last 24 Hours</option>
-                <option value="168">Last Week</option>
-                <option value="720">Last Month</option>
-                <option value="4320">Last 6 Months</option>
+                <option value="24h">Last 24 Hours</option>
+                <option value="7d">Last Week</option>
+                <option value="30d">Last Month</option>
+                <option value="180d">Last 6 Months</option>
             </select>
         </div>
 
@@ -1497,142 +1340,54 @@ def bitcoin_scanner_page():
             </div>
         </div>
 
-        <script>
-            async function scanTransactions() {
-                const minAmount = parseFloat(document.getElementById('minAmount').value);
-                const timeRange = document.getElementById('timeRange').value; // Remove parseInt, keep as string
-                const resultsEl = document.getElementById('results');
-                const scanBtn = document.getElementById('scanBtn');
-                
-                scanBtn.disabled = true;
-                scanBtn.textContent = 'Scanning...';
-                resultsEl.innerHTML = '<div class="loading">🔍 Scanning Bitcoin blockchain...</div>';
-                
-                try {
-                    const res = await fetch('/api/bitcoin/scan', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ min_amount: minAmount, timeframe: timeRange })
-                    });
-                    
-                    const data = await res.json();
-                    
-                    if (data.success && data.transactions.length > 0) {
-                        displayResults(data.transactions);
-                    } else {
-                        resultsEl.innerHTML = '<div class="empty">No transactions found matching your criteria.</div>';
-                        document.getElementById('stats').style.display = 'none';
-                    }
-                } catch (error) {
-                    resultsEl.innerHTML = '<div class="empty">Error scanning blockchain. Please try again.</div>';
-                } finally {
-                    scanBtn.disabled = false;
-                    scanBtn.textContent = 'Scan Blockchain';
-                }
-            }
-            
-            function displayResults(transactions) {
-                const statsEl = document.getElementById('stats');
-                const resultsEl = document.getElementById('results');
-                
-                // Calculate stats
-                const totalBTC = transactions.reduce((sum, tx) => sum + tx.amount_btc, 0);
-                const totalUSD = transactions.reduce((sum, tx) => sum + tx.amount_usd, 0);
-                
-                // Update stats
-                document.getElementById('txCount').textContent = transactions.length;
-                document.getElementById('totalBTC').textContent = totalBTC.toFixed(2) + ' BTC';
-                document.getElementById('totalUSD').textContent = '$' + totalUSD.toLocaleString();
-                statsEl.style.display = 'grid';
-                
-                // Build table
-                let html = `
-                    <table class="tx-table">
-                        <thead>
-                            <tr>
-                                <th>Transaction Hash</th>
-                                <th>Time</th>
-                                <th>Amount</th>
-                                <th>From</th>
-                                <th>To</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                `;
-                
-                transactions.forEach(tx => {
-                    const time = new Date(tx.time).toLocaleString();
-                    const fromAddr = tx.from_addresses.slice(0, 2).join('<br>');
-                    const toAddr = tx.to_addresses.slice(0, 2).join('<br>');
-                    
-                    html += `
-                        <tr>
-                            <td><a href="https://blockchain.info/tx/${tx.hash}" target="_blank" class="hash">${tx.hash.substring(0, 16)}...</a></td>
-                            <td>${time}</td>
-                            <td class="amount">${tx.amount_btc.toFixed(4)} BTC<br><span style="font-size:12px;color:#888;">$${tx.amount_usd.toLocaleString()}</span></td>
-                            <td class="address">${fromAddr}${tx.num_inputs > 2 ? '<br>+' + (tx.num_inputs - 2) + ' more' : ''}</td>
-                            <td class="address">${toAddr}${tx.num_outputs > 2 ? '<br>+' + (tx.num_outputs - 2) + ' more' : ''}</td>
-                        </tr>
-                    `;
-                });
-                
-                html += '</tbody></table>';
-                resultsEl.innerHTML = html;
-            }
-            
-            async function logout() {
-                await fetch('/api/logout');
-                window.location.href = '/login';
-            }
-            // Initialize
-            // loadTickers();
-            // loadAlerts();
-            setInterval(loadAlerts, 30000); // Refresh every 30 seconds
-        </script>
+        <script src="__BITCOIN_SCANNER_JS__"></script>
     </body>
     </html>
     """
-    return render_template_string(html)
+    .replace('__BITCOIN_SCANNER_CSS__', asset_url('css/bitcoin_scanner.css'))
+    .replace('__BITCOIN_SCANNER_JS__', asset_url('js/bitcoin_scanner.js')))
+
+
+@app.route('/bitcoin-scanner')
+@login_required
+def bitcoin_scanner_page():
+    """Bitcoin transaction scanner page"""
+    return _BITCOIN_SCANNER_PAGE.response()
+
+# Scanner timeframe → look-back window in hours (unknown values fall back to 24h)
+_TIMEFRAME_HOURS = {'24h': 24, '7d': 24 * 7, '30d': 24 * 30, '180d': 24 * 180}
+
 
 @app.route('/api/bitcoin/scan', methods=['POST'])
 @login_required
 def scan_bitcoin():
     try:
-        data = request.json
+        data = json_body()
         min_amount = float(data.get('min_amount', 100))
 
-        timeframe = data.get('timeframe', '24h')
-
-        if timeframe == '7d':
-            time_range = 24 * 7
-        elif timeframe == '30d':
-            time_range = 24 * 30
-        elif timeframe == '180d':
-            time_range = 24 * 180
-        else:
-            time_range = 24
+        time_range = _TIMEFRAME_HOURS.get(data.get('timeframe', '24h'), 24)
 
         logger.info(
-            f"Scanning for transactions > {min_amount} BTC in last {time_range} hours"
+            "Scanning for transactions > %s BTC in last %s hours", min_amount, time_range
         )
 
         transactions = bitcoin_scanner.scan_large_transactions(
             min_amount, time_range
         )
 
-        return jsonify({
+        return fastjson({
             'success': True,
             'transactions': transactions,
             'count': len(transactions)
         })
 
     except Exception as e:
-        logger.error(f"Error scanning Bitcoin transactions: {e}")
-        return jsonify({
+        logger.error("Error scanning Bitcoin transactions: %s", e)
+        return fastjson({
             'success': False,
             'error': str(e),
             'transactions': []
-        }), 500
+        }, 500)
 # ============================================================================
 # PORTFOLIO MANAGEMENT ROUTES
 # ============================================================================
@@ -1643,866 +1398,20 @@ from models import Portfolio, Trade
 @login_required
 def portfolio_page():
     """Portfolio management page"""
-    html = """
-    <!DOCTYPE html>
-<html lang="en">
-<head>
-    <title>Portfolio — Stock Alerts</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <link rel="stylesheet" href="/static/css/theme.css">
-    <style>
-        /* Portfolio-specific styles */
-        .main-content { max-width: 1600px; margin: 0 auto; padding: 80px 20px 40px; }
-        .container { max-width: 1600px; margin: 0 auto; }
-        .nav-placeholder { /* replaced by top-nav */
-            display: flex;
-            gap: 20px;
-            margin-bottom: 30px;
-            padding: 15px;
-            background: rgba(255,255,255,0.05);
-            border-radius: 10px;
-            flex-wrap: wrap;
-        }
-        /* ── Portfolio page compact CSS (preserves all JS-used classnames) ── */
-        .card { background: rgba(255,255,255,0.045); border: 1px solid rgba(255,255,255,0.06); border-radius: 16px; padding: 24px; margin-bottom: 20px; }
-        .card h2 { font-size: 18px; font-weight: 700; margin-bottom: 16px; letter-spacing: -0.3px; }
-        label { display: block; margin-bottom: 6px; font-weight: 600; color: #8B92A8; font-size: 12px; letter-spacing: 0.5px; text-transform: uppercase; }
-        input, select, textarea { width: 100%; height: 48px; padding: 0 14px; background: rgba(255,255,255,0.06); border: 1px solid rgba(255,255,255,0.1); border-radius: 10px; color: #fff; font-size: 14px; font-family: inherit; transition: border-color 0.2s, box-shadow 0.2s; }
-        textarea { height: auto; min-height: 80px; padding: 12px 14px; }
-        input:focus, select:focus, textarea:focus { outline: none; border-color: #5B7CFF; box-shadow: 0 0 0 3px rgba(91,124,255,0.18); background: rgba(91,124,255,0.05); }
-        input:disabled { opacity: 0.45; cursor: not-allowed; }
-        button { padding: 12px 24px; background: linear-gradient(135deg, #5B7CFF 0%, #7B5CFF 100%); color: #fff; border: none; border-radius: 10px; font-weight: 700; cursor: pointer; font-size: 14px; font-family: inherit; transition: box-shadow 0.2s; }
-        button:hover { box-shadow: 0 6px 24px rgba(91,124,255,0.4); }
-        button:active { transform: scale(0.98); }
-        button:disabled { opacity: 0.45; cursor: not-allowed; }
-        .btn-secondary { background: rgba(255,255,255,0.05); border: 1px solid rgba(255,255,255,0.1); color: #8B92A8; border-radius: 10px; padding: 10px 18px; font-size: 13px; cursor: pointer; transition: background 0.2s; margin: 0; }
-        .btn-secondary:hover { background: rgba(255,255,255,0.08); color: #fff; }
-        .form-group { margin-bottom: 14px; }
-        .grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 14px; }
-        .calculated-value { height: 48px; padding: 0 14px; background: rgba(0,208,132,0.07); border: 1px solid rgba(0,208,132,0.18); border-radius: 10px; color: #00D084; font-weight: 700; font-size: 14px; display: flex; align-items: center; }
-        .info-text { font-size: 12px; color: #4A5268; margin-top: 4px; }
-        .summary-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 16px; margin-bottom: 24px; }
-        .summary-item { background: rgba(255,255,255,0.04); padding: 18px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.07); }
-        .summary-label { font-size: 11px; color: #8B92A8; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 6px; }
-        .summary-value { font-size: 24px; font-weight: 800; font-variant-numeric: tabular-nums; letter-spacing: -0.5px; color: #5B7CFF; }
-        .summary-value.positive { color: #00D084; }
-        .summary-value.negative { color: #FF4757; }
-        .summary-value.neutral  { color: #FFB800; }
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(130px, 1fr)); gap: 12px; }
-        .stat-item { background: rgba(255,255,255,0.04); padding: 14px; border-radius: 10px; border: 1px solid rgba(255,255,255,0.06); text-align: center; }
-        .stat-label { font-size: 11px; color: #8B92A8; font-weight: 600; text-transform: uppercase; letter-spacing: 0.4px; margin-bottom: 4px; }
-        .stat-value { font-size: 18px; font-weight: 700; font-variant-numeric: tabular-nums; }
-        .stat-value.positive { color: #00D084; }
-        .stat-value.negative { color: #FF4757; }
-        .table-container { overflow-x: auto; border-radius: 10px; }
-        table { width: 100%; border-collapse: collapse; font-size: 13px; }
-        th, td { padding: 10px 12px; text-align: left; border-bottom: 1px solid rgba(255,255,255,0.06); white-space: nowrap; }
-        th { background: rgba(91,124,255,0.08); color: #8B92A8; font-weight: 600; font-size: 11px; text-transform: uppercase; letter-spacing: 0.5px; position: sticky; top: 0; z-index: 1; }
-        tbody tr { transition: background 0.15s; }
-        tbody tr:hover { background: rgba(255,255,255,0.04); }
-        .ticker-cell { font-weight: 700; color: #5B7CFF; font-size: 14px; }
-        .positive { color: #00D084; font-weight: 600; }
-        .negative { color: #FF4757; font-weight: 600; }
-        .neutral  { color: #FFB800; }
-        .warning-badge { display: inline-block; padding: 2px 7px; border-radius: 99px; font-size: 10px; font-weight: 700; margin: 2px; text-transform: uppercase; }
-        .warning-badge.error   { background: rgba(255,71,87,0.15);  border: 1px solid rgba(255,71,87,0.3);  color: #FF4757; }
-        .warning-badge.warning { background: rgba(255,184,0,0.15);  border: 1px solid rgba(255,184,0,0.3);  color: #FFB800; }
-        .status-badge { display: inline-block; padding: 3px 10px; border-radius: 99px; font-size: 11px; font-weight: 700; }
-        .status-badge.open   { background: rgba(0,208,132,0.12); color: #00D084; border: 1px solid rgba(0,208,132,0.25); }
-        .status-badge.closed { background: rgba(139,146,168,0.12); color: #8B92A8; border: 1px solid rgba(139,146,168,0.2); }
-        .message { padding: 12px 16px; border-radius: 10px; margin: 12px 0; font-size: 14px; font-weight: 500; }
-        .success { background: rgba(0,208,132,0.1); border: 1px solid rgba(0,208,132,0.25); color: #00D084; }
-        .error   { background: rgba(255,71,87,0.1); border: 1px solid rgba(255,71,87,0.25); color: #FF4757; }
-        .spinner { border: 3px solid rgba(91,124,255,0.1); border-top: 3px solid #5B7CFF; border-radius: 50%; width: 32px; height: 32px; animation: spin 0.7s linear infinite; margin: 16px auto; }
-        @keyframes spin { to { transform: rotate(360deg); } }
-        .loading { text-align: center; padding: 32px; color: #8B92A8; }
-        .empty   { text-align: center; padding: 48px; color: #4A5268; }
-        .modal { display: none; position: fixed; z-index: 1000; inset: 0; background: rgba(0,0,0,0.75); backdrop-filter: blur(6px); }
-        .modal.active { display: flex; align-items: center; justify-content: center; }
-        .modal-content { background: #0F1420; border: 1px solid rgba(91,124,255,0.2); padding: 28px; border-radius: 16px; max-width: 480px; width: 90%; box-shadow: 0 20px 60px rgba(0,0,0,0.5); }
-        .modal-header { margin-bottom: 20px; }
-        .modal-header h3 { font-size: 18px; font-weight: 700; color: #5B7CFF; }
-        .tabs { display: flex; gap: 0; border-bottom: 1px solid rgba(255,255,255,0.08); margin-bottom: 20px; }
-        .tab { padding: 10px 20px; background: transparent; border: none; color: #8B92A8; font-size: 13px; font-weight: 600; cursor: pointer; border-bottom: 2px solid transparent; margin-bottom: -1px; transition: color 0.15s, border-color 0.15s; font-family: inherit; }
-        .tab.active { color: #5B7CFF; border-bottom-color: #5B7CFF; }
-        .tab:hover:not(.active) { color: #fff; }
-        .tab-content { display: none; }
-        .tab-content.active { display: block; }
-        .timeframe-selector { display: flex; gap: 8px; margin-bottom: 14px; }
-        .timeframe-btn { flex: 1; padding: 10px; background: rgba(255,255,255,0.05); border: 1px solid rgba(255,255,255,0.1); border-radius: 8px; color: #8B92A8; font-size: 13px; font-weight: 600; cursor: pointer; transition: all 0.2s; font-family: inherit; }
-        .timeframe-btn.active { background: rgba(91,124,255,0.12); border-color: #5B7CFF; color: #5B7CFF; }
-        .timeframe-btn:hover:not(.active) { background: rgba(255,255,255,0.08); color: #fff; }
-        @media (max-width: 768px) { .summary-grid { grid-template-columns: 1fr 1fr; } .stats-grid { grid-template-columns: repeat(2, 1fr); } .grid { grid-template-columns: 1fr; } th, td { padding: 8px 6px; } }
-    </style>
-</head>
-<body>
-    <!-- Sticky Top Nav -->
-    <nav class="top-nav wide">
-        <span class="top-nav-brand">📈 PulseAlerts</span>
-        <a href="/dashboard" class="top-nav-link">📊 Alerts</a>
-        <a href="/portfolio" class="top-nav-link active">💼 Portfolio</a>
-        <a href="/alerts/history" class="top-nav-link">📜 History</a>
-        <a href="/radar" class="top-nav-link">🚨 Radar</a>
-        <a href="/bitcoin-scanner" class="top-nav-link">₿ Bitcoin</a>
-        <a href="/forex-amd" class="top-nav-link">🌐 Forex</a>
-        <a href="/fundamentals" class="top-nav-link">📋 Fundamentals</a>
-        <span class="top-nav-spacer"></span>
-        <button class="top-nav-logout" onclick="logout()">Sign out</button>
-    </nav>
-
-    <div class="main-content">
-        <div style="margin-bottom: 28px;">
-            <p style="font-size: 14px; color: var(--text-secondary); margin-bottom: 4px;">Your trading performance</p>
-            <h1 style="font-size: 28px; font-weight: 800; letter-spacing: -0.5px;">Portfolio</h1>
-        </div>
-
-        <div id="message"></div>
-
-        <!-- Portfolio Cash -->
-        <div class="card">
-            <h2>Portfolio Balance</h2>
-            <div class="form-group">
-                <label>Total Portfolio Cash ($)</label>
-                <input type="number" id="portfolioCash" placeholder="Enter total portfolio value" step="0.01" min="0">
-            </div>
-            <button onclick="updatePortfolioCash()">Update Balance</button>
-        </div>
-
-        <!-- Portfolio Summary -->
-        <div class="card" id="summaryCard">
-            <h2>📈 Portfolio Overview</h2>
-            <div class="summary-grid">
-                <div class="summary-item">
-                    <div class="summary-label">Portfolio Value</div>
-                    <div class="summary-value" id="portfolioValue">$0.00</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Total Invested</div>
-                    <div class="summary-value" id="totalInvested">$0.00</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Total at Risk</div>
-                    <div class="summary-value neutral" id="totalRisk">$0.00</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Unrealized P&L</div>
-                    <div class="summary-value" id="unrealizedPnl">$0.00</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Realized P&L</div>
-                    <div class="summary-value" id="realizedPnl">$0.00</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Total Return</div>
-                    <div class="summary-value" id="portfolioReturn">0.00%</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Trading Statistics -->
-        <div class="card" id="statsCard">
-            <h2>📊 Trading Performance</h2>
-            <div class="stats-grid">
-                <div class="stat-item">
-                    <div class="stat-label">Win Rate</div>
-                    <div class="stat-value" id="winRate">0%</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-label">Total Trades</div>
-                    <div class="stat-value" id="totalTrades">0</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-label">Wins / Losses</div>
-                    <div class="stat-value" id="winsLosses">0 / 0</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-label">Avg Win</div>
-                    <div class="stat-value positive" id="avgWin">$0.00</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-label">Avg Loss</div>
-                    <div class="stat-value negative" id="avgLoss">$0.00</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-label">Expectancy</div>
-                    <div class="stat-value" id="expectancy">$0.00</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Add/Edit Trade Form -->
-        <div class="card">
-            <h2 id="formTitle">➕ Add New Trade</h2>
-            <div class="grid">
-                <div class="form-group">
-                    <label>Ticker *</label>
-                    <input type="text" id="ticker" placeholder="e.g., AAPL" maxlength="10">
-                </div>
-                <div class="form-group">
-                    <label>Buy Price ($) *</label>
-                    <input type="number" id="buyPrice" step="0.01" min="0" oninput="calculateValues()">
-                </div>
-                <div class="form-group">
-                    <label>Quantity *</label>
-                    <input type="number" id="quantity" step="0.0001" min="0" oninput="calculateValues()">
-                </div>
-                <div class="form-group">
-                    <label>Stop Loss ($)</label>
-                    <input type="number" id="stopLoss" step="0.01" min="0" placeholder="Optional" oninput="calculateValues()">
-                </div>
-                <div class="form-group">
-                    <label>Position Size ($) - Auto Calculated</label>
-                    <div class="calculated-value" id="positionSizeDisplay">$0.00</div>
-                    <div class="info-text">= Buy Price × Quantity</div>
-                </div>
-                <div class="form-group">
-                    <label>Risk Amount ($) - Auto Calculated</label>
-                    <div class="calculated-value" id="riskAmountDisplay">$0.00</div>
-                    <div class="info-text">= |Buy Price - Stop Loss| × Quantity</div>
-                </div>
-                <div class="form-group">
-                    <label>Take Profit ($)</label>
-                    <input type="number" id="takeProfit" step="0.01" min="0" placeholder="Optional">
-                </div>
-                <div class="form-group">
-                    <label>Timeframe *</label>
-                    <select id="timeframe">
-                        <option value="Long">Long</option>
-                        <option value="Swing">Swing</option>
-                    </select>
-                </div>
-                <div class="form-group">
-                    <label>Trade Date *</label>
-                    <input type="date" id="tradeDate">
-                </div>
-            </div>
-            <div class="form-group">
-                <label>Notes</label>
-                <textarea id="notes" placeholder="Optional trade notes..."></textarea>
-            </div>
-            <button id="saveTradeBtn" onclick="saveTrade()">Add Trade</button>
-            <button class="btn-secondary" onclick="clearForm()" style="display:none;" id="cancelBtn">Cancel</button>
-        </div>
-
-        <!-- Trades Table -->
-        <div class="card">
-            <h2>📋 Trade Journal</h2>
-            
-            <!-- Tabs -->
-            <div class="tabs">
-                <button class="tab active" onclick="switchTab(event, 'all')">All Trades</button>
-                <button class="tab" onclick="switchTab(event, 'open')">Open Positions</button>
-                <button class="tab" onclick="switchTab(event, 'closed')">Closed Positions</button>
-            </div>
-
-            <!-- All Trades Tab -->
-            <div id="allTab" class="tab-content active">
-                <div class="table-container">
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Status</th>
-                                <th>Ticker</th>
-                                <th>Date</th>
-                                <th>Buy Price</th>
-                                <th>Qty</th>
-                                <th>Position $</th>
-                                <th>Risk $</th>
-                                <th>Risk %</th>
-                                <th>R:R</th>
-                                <th>P&L $</th>
-                                <th>P&L %</th>
-                                <th>Warnings</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody id="allTradesBody">
-                            <tr><td colspan="13" class="loading"><div class="spinner"></div>Loading trades...</td></tr>
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-
-            <!-- Open Trades Tab -->
-            <div id="openTab" class="tab-content">
-                <div class="table-container">
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Ticker</th>
-                                <th>Date</th>
-                                <th>Buy Price</th>
-                                <th>Qty</th>
-                                <th>Position $</th>
-                                <th>Risk $</th>
-                                <th>Risk %</th>
-                                <th>R:R</th>
-                                <th>Unrealized P&L $</th>
-                                <th>Unrealized P&L %</th>
-                                <th>Warnings</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody id="openTradesBody">
-                            <tr><td colspan="12" class="loading"><div class="spinner"></div>Loading open trades...</td></tr>
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-
-            <!-- Closed Trades Tab -->
-            <div id="closedTab" class="tab-content">
-                <div class="table-container">
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Ticker</th>
-                                <th>Open Date</th>
-                                <th>Close Date</th>
-                                <th>Buy Price</th>
-                                <th>Close Price</th>
-                                <th>Qty</th>
-                                <th>Realized P&L $</th>
-                                <th>Realized P&L %</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody id="closedTradesBody">
-                            <tr><td colspan="9" class="loading"><div class="spinner"></div>Loading closed trades...</td></tr>
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Close Trade Modal -->
-    <div id="closeModal" class="modal">
-        <div class="modal-content">
-            <div class="modal-header">
-                <h3>Close Trade</h3>
-            </div>
-            <div class="form-group">
-                <label>Close Price ($)</label>
-                <input type="number" id="closePrice" step="0.01" min="0">
-            </div>
-            <div class="form-group">
-                <label>Close Date</label>
-                <input type="date" id="closeDate">
-            </div>
-            <button onclick="confirmCloseTrade()">Close Trade</button>
-            <button class="btn-secondary" onclick="closeModal()">Cancel</button>
-        </div>
-    </div>
-
-    <script>
-        let portfolioCash = 0;
-        let allTrades = [];
-        let editingTradeId = null;
-        let closingTradeId = null;
-
-        // Initialize
-        document.addEventListener('DOMContentLoaded', function() {
-            console.log('Page loaded, initializing...');
-            loadPortfolio();
-            loadSummary();
-            loadTrades();
-            
-            // Set today's date as default
-            const today = new Date().toISOString().split('T')[0];
-            document.getElementById('tradeDate').value = today;
-            document.getElementById('closeDate').value = today;
-        });
-
-        // Calculate position size and risk amount automatically
-        function calculateValues() {
-            const buyPrice = parseFloat(document.getElementById('buyPrice').value) || 0;
-            const quantity = parseFloat(document.getElementById('quantity').value) || 0;
-            const stopLoss = parseFloat(document.getElementById('stopLoss').value) || 0;
-            
-            // Position Size = buy_price * quantity
-            const positionSize = buyPrice * quantity;
-            document.getElementById('positionSizeDisplay').textContent = 
-                '$' + positionSize.toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2});
-            
-            // Risk Amount = |buy_price - stop_loss| * quantity
-            let riskAmount = 0;
-            if (stopLoss > 0) {
-                riskAmount = Math.abs(buyPrice - stopLoss) * quantity;
-            } else {
-                // Default 2% risk if no stop loss
-                riskAmount = positionSize * 0.02;
-            }
-            document.getElementById('riskAmountDisplay').textContent = 
-                '$' + riskAmount.toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2});
-        }
-
-        // Tab switching
-        function switchTab(event, tab) {
-            // Update tab buttons
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            event.target.classList.add('active');
-            
-            // Update tab content
-            document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-            document.getElementById(tab + 'Tab').classList.add('active');
-            
-            // Render appropriate table
-            renderTrades();
-        }
-
-        // Load portfolio cash
-        async function loadPortfolio() {
-            try {
-                console.log('Loading portfolio...');
-                const res = await fetch('/api/portfolio');
-                const data = await res.json();
-                console.log('Portfolio response:', data);
-                if (data.success) {
-                    portfolioCash = data.cash;
-                    document.getElementById('portfolioCash').value = portfolioCash;
-                    document.getElementById('portfolioValue').textContent = 
-                        '$' + portfolioCash.toLocaleString('en-US', {minimumFractionDigits: 2});
-                }
-            } catch (error) {
-                console.error('Error loading portfolio:', error);
-                showMessage('Error loading portfolio: ' + error.message, 'error');
-            }
-        }
-
-        // Update portfolio cash
-        async function updatePortfolioCash() {
-            const cash = parseFloat(document.getElementById('portfolioCash').value);
-            
-            if (isNaN(cash) || cash < 0) {
-                showMessage('Please enter a valid amount', 'error');
-                return;
-            }
-
-            try {
-                const res = await fetch('/api/portfolio', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ cash })
-                });
-                
-                const data = await res.json();
-                if (data.success) {
-                    portfolioCash = cash;
-                    showMessage('Portfolio balance updated!', 'success');
-                    await loadSummary();
-                    await loadTrades();
-                }
-            } catch (error) {
-                console.error('Error updating portfolio:', error);
-                showMessage('Failed to update portfolio balance', 'error');
-            }
-        }
-
-        // Load portfolio summary
-        async function loadSummary() {
-            try {
-                console.log('Loading summary...');
-                const res = await fetch('/api/portfolio/summary');
-                const data = await res.json();
-                console.log('Summary response:', data);
-                
-                if (data.success) {
-                    const summary = data.summary;
-                    const stats = data.statistics;
-                    
-                    // Update summary
-                    document.getElementById('totalInvested').textContent = 
-                        '$' + summary.total_invested.toLocaleString('en-US', {minimumFractionDigits: 2});
-                    document.getElementById('totalRisk').textContent = 
-                        '$' + summary.total_risk.toLocaleString('en-US', {minimumFractionDigits: 2});
-                    
-                    const unrealizedEl = document.getElementById('unrealizedPnl');
-                    unrealizedEl.textContent = '$' + summary.unrealized_pnl.toLocaleString('en-US', {minimumFractionDigits: 2});
-                    unrealizedEl.className = 'summary-value ' + (summary.unrealized_pnl >= 0 ? 'positive' : 'negative');
-                    
-                    const realizedEl = document.getElementById('realizedPnl');
-                    realizedEl.textContent = '$' + summary.realized_pnl.toLocaleString('en-US', {minimumFractionDigits: 2});
-                    realizedEl.className = 'summary-value ' + (summary.realized_pnl >= 0 ? 'positive' : 'negative');
-                    
-                    const returnEl = document.getElementById('portfolioReturn');
-                    returnEl.textContent = summary.portfolio_return_pct.toFixed(2) + '%';
-                    returnEl.className = 'summary-value ' + (summary.portfolio_return_pct >= 0 ? 'positive' : 'negative');
-                    
-                    // Update statistics
-                    document.getElementById('winRate').textContent = stats.win_rate.toFixed(1) + '%';
-                    document.getElementById('totalTrades').textContent = stats.total_trades;
-                    document.getElementById('winsLosses').textContent = stats.winning_trades + ' / ' + stats.losing_trades;
-                    document.getElementById('avgWin').textContent = '$' + stats.avg_win.toLocaleString('en-US', {minimumFractionDigits: 2});
-                    document.getElementById('avgLoss').textContent = '$' + stats.avg_loss.toLocaleString('en-US', {minimumFractionDigits: 2});
-                    
-                    const expectancyEl = document.getElementById('expectancy');
-                    expectancyEl.textContent = '$' + stats.expectancy.toLocaleString('en-US', {minimumFractionDigits: 2});
-                    expectancyEl.className = 'stat-value ' + (stats.expectancy >= 0 ? 'positive' : 'negative');
-                }
-            } catch (error) {
-                console.error('Error loading summary:', error);
-            }
-        }
-
-        // Load trades
-        async function loadTrades() {
-            try {
-                console.log('Loading trades...');
-                const res = await fetch('/api/trades/enriched');
-                const data = await res.json();
-                console.log('Trades response:', data);
-                
-                if (data.success) {
-                    allTrades = data.trades;
-                    console.log('Loaded', allTrades.length, 'trades');
-                    renderTrades();
-                } else {
-                    console.error('Failed to load trades:', data.error);
-                    showMessage('Failed to load trades: ' + data.error, 'error');
-                }
-            } catch (error) {
-                console.error('Error loading trades:', error);
-                showMessage('Error loading trades: ' + error.message, 'error');
-            }
-        }
-
-        // Render trades based on active tab
-        function renderTrades() {
-            const activeTab = document.querySelector('.tab.active');
-            if (!activeTab) return;
-            
-            const tabText = activeTab.textContent.toLowerCase();
-            
-            if (tabText.includes('all')) {
-                renderAllTrades();
-            } else if (tabText.includes('open')) {
-                renderOpenTrades();
-            } else if (tabText.includes('closed')) {
-                renderClosedTrades();
-            }
-        }
-
-        // Render all trades
-        function renderAllTrades() {
-            const tbody = document.getElementById('allTradesBody');
-            
-            if (allTrades.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="13" style="text-align: center; padding: 40px; color: #888;">No trades yet. Add your first trade above!</td></tr>';
-                return;
-            }
-
-            tbody.innerHTML = allTrades.map(trade => {
-                const status = trade.is_closed ? 'closed' : 'open';
-                const pnl = trade.is_closed ? trade.realized_pnl : trade.unrealized_pnl;
-                const pnlPct = trade.is_closed ? trade.realized_pnl_pct : trade.unrealized_pnl_pct;
-                
-                const warnings = (trade.warnings || []).map(w => 
-                    `<span class="warning-badge ${w.severity}">${w.type.replace('_', ' ')}</span>`
-                ).join('');
-                
-                return `
-                    <tr>
-                        <td><span class="status-badge ${status}">${status.toUpperCase()}</span></td>
-                        <td class="ticker-cell">${trade.ticker}</td>
-                        <td>${trade.trade_date}</td>
-                        <td>$${parseFloat(trade.buy_price).toFixed(2)}</td>
-                        <td>${parseFloat(trade.quantity).toFixed(4)}</td>
-                        <td>$${parseFloat(trade.position_size).toLocaleString('en-US', {minimumFractionDigits: 2})}</td>
-                        <td>$${parseFloat(trade.risk_amount).toLocaleString('en-US', {minimumFractionDigits: 2})}</td>
-                        <td class="${trade.risk_pct > 2 ? 'negative' : ''}">${trade.risk_pct}%</td>
-                        <td class="${trade.rr_ratio !== null && trade.rr_ratio < 1.5 ? 'negative' : 'positive'}">${trade.rr_ratio !== null ? trade.rr_ratio.toFixed(2) : 'N/A'}</td>
-                        <td class="${pnl !== null && pnl >= 0 ? 'positive' : 'negative'}">${pnl !== null ? '$' + pnl.toLocaleString('en-US', {minimumFractionDigits: 2}) : 'N/A'}</td>
-                        <td class="${pnlPct !== null && pnlPct >= 0 ? 'positive' : 'negative'}">${pnlPct !== null ? pnlPct.toFixed(2) + '%' : 'N/A'}</td>
-                        <td>${warnings || '-'}</td>
-                        <td style="white-space: nowrap;">
-                            ${!trade.is_closed ? `<button class="btn-close" onclick="openCloseModal(${trade.id})">Close</button>` : ''}
-                            <button class="btn-edit" onclick="editTrade(${trade.id})">Edit</button>
-                            <button class="btn-delete" onclick="deleteTrade(${trade.id})">Delete</button>
-                        </td>
-                    </tr>
-                `;
-            }).join('');
-        }
-
-        // Render open trades
-        function renderOpenTrades() {
-            const tbody = document.getElementById('openTradesBody');
-            const openTrades = allTrades.filter(t => !t.is_closed);
-            
-            if (openTrades.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="12" style="text-align: center; padding: 40px; color: #888;">No open positions</td></tr>';
-                return;
-            }
-
-            tbody.innerHTML = openTrades.map(trade => {
-                const warnings = (trade.warnings || []).map(w => 
-                    `<span class="warning-badge ${w.severity}">${w.type.replace('_', ' ')}</span>`
-                ).join('');
-                
-                return `
-                    <tr>
-                        <td class="ticker-cell">${trade.ticker}</td>
-                        <td>${trade.trade_date}</td>
-                        <td>$${parseFloat(trade.buy_price).toFixed(2)}</td>
-                        <td>${parseFloat(trade.quantity).toFixed(4)}</td>
-                        <td>$${parseFloat(trade.position_size).toLocaleString('en-US', {minimumFractionDigits: 2})}</td>
-                        <td>$${parseFloat(trade.risk_amount).toLocaleString('en-US', {minimumFractionDigits: 2})}</td>
-                        <td class="${trade.risk_pct > 2 ? 'negative' : ''}">${trade.risk_pct}%</td>
-                        <td class="${trade.rr_ratio !== null && trade.rr_ratio < 1.5 ? 'negative' : 'positive'}">${trade.rr_ratio !== null ? trade.rr_ratio.toFixed(2) : 'N/A'}</td>
-                        <td class="${trade.unrealized_pnl !== null && trade.unrealized_pnl >= 0 ? 'positive' : 'negative'}">${trade.unrealized_pnl !== null ? '$' + trade.unrealized_pnl.toLocaleString('en-US', {minimumFractionDigits: 2}) : 'N/A'}</td>
-                        <td class="${trade.unrealized_pnl_pct !== null && trade.unrealized_pnl_pct >= 0 ? 'positive' : 'negative'}">${trade.unrealized_pnl_pct !== null ? trade.unrealized_pnl_pct.toFixed(2) + '%' : 'N/A'}</td>
-                        <td>${warnings || '-'}</td>
-                        <td style="white-space: nowrap;">
-                            <button class="btn-close" onclick="openCloseModal(${trade.id})">Close</button>
-                            <button class="btn-edit" onclick="editTrade(${trade.id})">Edit</button>
-                            <button class="btn-delete" onclick="deleteTrade(${trade.id})">Delete</button>
-                        </td>
-                    </tr>
-                `;
-            }).join('');
-        }
-
-        // Render closed trades
-        function renderClosedTrades() {
-            const tbody = document.getElementById('closedTradesBody');
-            const closedTrades = allTrades.filter(t => t.is_closed);
-            
-            if (closedTrades.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="9" style="text-align: center; padding: 40px; color: #888;">No closed positions</td></tr>';
-                return;
-            }
-
-            tbody.innerHTML = closedTrades.map(trade => {
-                return `
-                    <tr>
-                        <td class="ticker-cell">${trade.ticker}</td>
-                        <td>${trade.trade_date}</td>
-                        <td>${trade.close_date || 'N/A'}</td>
-                        <td>$${parseFloat(trade.buy_price).toFixed(2)}</td>
-                        <td>$${parseFloat(trade.close_price).toFixed(2)}</td>
-                        <td>${parseFloat(trade.quantity).toFixed(4)}</td>
-                        <td class="${trade.realized_pnl >= 0 ? 'positive' : 'negative'}">$${trade.realized_pnl.toLocaleString('en-US', {minimumFractionDigits: 2})}</td>
-                        <td class="${trade.realized_pnl_pct >= 0 ? 'positive' : 'negative'}">${trade.realized_pnl_pct.toFixed(2)}%</td>
-                        <td style="white-space: nowrap;">
-                            <button class="btn-edit" onclick="editTrade(${trade.id})">Edit</button>
-                            <button class="btn-delete" onclick="deleteTrade(${trade.id})">Delete</button>
-                        </td>
-                    </tr>
-                `;
-            }).join('');
-        }
-
-        // Save trade (add or update)
-        async function saveTrade() {
-            const ticker = document.getElementById('ticker').value.toUpperCase().trim();
-            const buyPrice = parseFloat(document.getElementById('buyPrice').value);
-            const quantity = parseFloat(document.getElementById('quantity').value);
-            const stopLoss = document.getElementById('stopLoss').value ? parseFloat(document.getElementById('stopLoss').value) : null;
-            const takeProfit = document.getElementById('takeProfit').value ? parseFloat(document.getElementById('takeProfit').value) : null;
-            const timeframe = document.getElementById('timeframe').value;
-            const tradeDate = document.getElementById('tradeDate').value;
-            const notes = document.getElementById('notes').value.trim();
-
-            if (!ticker || isNaN(buyPrice) || isNaN(quantity) || !tradeDate) {
-                showMessage('Please fill in all required fields (Ticker, Buy Price, Quantity, Date)', 'error');
-                return;
-            }
-
-            if (buyPrice <= 0 || quantity <= 0) {
-                showMessage('Buy price and quantity must be positive', 'error');
-                return;
-            }
-
-            const payload = {
-                ticker,
-                buy_price: buyPrice,
-                quantity,
-                timeframe,
-                trade_date: tradeDate,
-                stop_loss: stopLoss,
-                take_profit: takeProfit,
-                notes: notes || null
-            };
-
-            console.log('Saving trade:', payload);
-
-            try {
-                const saveBtn = document.getElementById('saveTradeBtn');
-                saveBtn.disabled = true;
-                saveBtn.textContent = editingTradeId ? 'Updating...' : 'Adding...';
-                
-                const url = editingTradeId ? `/api/trades/${editingTradeId}` : '/api/trades';
-                const method = editingTradeId ? 'PUT' : 'POST';
-                
-                const res = await fetch(url, {
-                    method: method,
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(payload)
-                });
-                
-                const data = await res.json();
-                console.log('Save response:', data);
-                
-                if (data.success) {
-                    showMessage(editingTradeId ? 'Trade updated!' : 'Trade added!', 'success');
-                    clearForm();
-                    
-                    // Reload all data
-                    await Promise.all([
-                        loadSummary(),
-                        loadTrades()
-                    ]);
-                } else {
-                    showMessage('Failed to save trade: ' + (data.error || 'Unknown error'), 'error');
-                }
-            } catch (error) {
-                console.error('Error saving trade:', error);
-                showMessage('Failed to save trade: ' + error.message, 'error');
-            } finally {
-                const saveBtn = document.getElementById('saveTradeBtn');
-                saveBtn.disabled = false;
-                saveBtn.textContent = editingTradeId ? 'Update Trade' : 'Add Trade';
-            }
-        }
+    return _portfolio_page().response(max_age=300)
 
-        // Edit trade
-        function editTrade(id) {
-            const trade = allTrades.find(t => t.id === id);
-            if (!trade) {
-                console.error('Trade not found:', id);
-                return;
-            }
-
-            console.log('Editing trade:', trade);
-
-            document.getElementById('ticker').value = trade.ticker;
-            document.getElementById('buyPrice').value = trade.buy_price;
-            document.getElementById('quantity').value = trade.quantity;
-            document.getElementById('stopLoss').value = trade.stop_loss || '';
-            document.getElementById('takeProfit').value = trade.take_profit || '';
-            document.getElementById('timeframe').value = trade.timeframe;
-            document.getElementById('tradeDate').value = trade.trade_date;
-            document.getElementById('notes').value = trade.notes || '';
-
-            calculateValues();
-
-            editingTradeId = id;
-            document.getElementById('formTitle').textContent = '✏️ Edit Trade';
-            document.getElementById('saveTradeBtn').textContent = 'Update Trade';
-            document.getElementById('cancelBtn').style.display = 'inline-block';
-            
-            // Scroll to form
-            window.scrollTo({ top: 0, behavior: 'smooth' });
-        }
-
-        // Delete trade
-        async function deleteTrade(id) {
-            if (!confirm('Delete this trade? This cannot be undone.')) return;
-
-            try {
-                const res = await fetch(`/api/trades/${id}`, { method: 'DELETE' });
-                const data = await res.json();
-                
-                if (data.success) {
-                    showMessage('Trade deleted', 'success');
-                    await Promise.all([
-                        loadSummary(),
-                        loadTrades()
-                    ]);
-                } else {
-                    showMessage('Failed to delete trade: ' + data.error, 'error');
-                }
-            } catch (error) {
-                console.error('Error deleting trade:', error);
-                showMessage('Failed to delete trade: ' + error.message, 'error');
-            }
-        }
-
-        // Open close modal
-        function openCloseModal(id) {
-            closingTradeId = id;
-            document.getElementById('closeModal').classList.add('active');
-            document.getElementById('closeDate').value = new Date().toISOString().split('T')[0];
-        }
 
-        // Close modal
-        function closeModal() {
-            closingTradeId = null;
-            document.getElementById('closeModal').classList.remove('active');
-            document.getElementById('closePrice').value = '';
-        }
+@lru_cache(maxsize=1)
+def _portfolio_page() -> StaticPage:
+    # Nothing user- or request-specific goes into the page (all data is
+    # fetched client-side), so it only needs rendering once per process.
+    return StaticPage(render_template('portfolio.html'))
 
-        // Confirm close trade
-        async function confirmCloseTrade() {
-            const closePrice = parseFloat(document.getElementById('closePrice').value);
-            const closeDate = document.getElementById('closeDate').value;
 
-            if (isNaN(closePrice) || !closeDate) {
-                showMessage('Please enter close price and date', 'error');
-                return;
-            }
-
-            try {
-                const res = await fetch(`/api/trades/${closingTradeId}/close`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ close_price: closePrice, close_date: closeDate })
-                });
-                
-                const data = await res.json();
-                if (data.success) {
-                    showMessage('Trade closed successfully!', 'success');
-                    closeModal();
-                    await Promise.all([
-                        loadSummary(),
-                        loadTrades()
-                    ]);
-                } else {
-                    showMessage('Failed to close trade: ' + data.error, 'error');
-                }
-            } catch (error) {
-                console.error('Error closing trade:', error);
-                showMessage('Failed to close trade: ' + error.message, 'error');
-            }
-        }
-
-        // Clear form
-        function clearForm() {
-            document.getElementById('ticker').value = '';
-            document.getElementById('buyPrice').value = '';
-            document.getElementById('quantity').value = '';
-            document.getElementById('stopLoss').value = '';
-            document.getElementById('takeProfit').value = '';
-            document.getElementById('timeframe').value = 'Long';
-            document.getElementById('tradeDate').value = new Date().toISOString().split('T')[0];
-            document.getElementById('notes').value = '';
-            
-            calculateValues();
-            
-            editingTradeId = null;
-            document.getElementById('formTitle').textContent = '➕ Add New Trade';
-            document.getElementById('saveTradeBtn').textContent = 'Add Trade';
-            document.getElementById('cancelBtn').style.display = 'none';
-        }
-
-        // Show message
-        function showMessage(text, type) {
-            const msgEl = document.getElementById('message');
-            msgEl.innerHTML = `<div class="message ${type}">${text}</div>`;
-            setTimeout(() => msgEl.innerHTML = '', 5000);
-        }
-
-        // Logout
-        async function logout() {
-            await fetch('/api/logout');
-            window.location.href = '/login';
-        }
-    </script>
-</body>
-</html>
-    """
-    return render_template_string(html)
+# Build the page at import: the first visit is served from memory too, and a
+# broken template fails the deploy rather than a user's request.
+with app.app_context():
+    _portfolio_page()
 
 @app.route('/api/portfolio', methods=['GET'])
 @login_required
@@ -2510,35 +1419,37 @@ def get_portfolio():
     """Get user's portfolio cash"""
     try:
         cash = Portfolio.get_user_portfolio(current_user.id)
-        return jsonify({'success': True, 'cash': float(cash)})
+        body = orjson.dumps({'success': True, 'cash': float(cash)})
+        # Per-user data: revalidate every time (cheap 304) rather than let the
+        # browser reuse it across logins or updates made elsewhere.
+        return conditional_json(body, body_etag(body))
     except Exception as e:
-        logger.error(f"Error getting portfolio for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error getting portfolio for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/portfolio', methods=['POST'])
 @login_required
 def update_portfolio():
     """Update user's portfolio cash"""
     try:
-        data = request.json
+        data = json_body()
         cash = float(data.get('cash', 0))
         
         if cash < 0:
-            return jsonify({'success': False, 'error': 'Cash cannot be negative'}), 400
+            return fastjson({'success': False, 'error': 'Cash cannot be negative'}, 400)
         
         Portfolio.set_user_portfolio(current_user.id, cash)
-        return jsonify({'success': True})
+        return fastjson({'success': True})
     except Exception as e:
-        logger.error(f"Error updating portfolio for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error updating portfolio for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/portfolio/summary', methods=['GET'])
 @login_required
 def get_portfolio_summary():
     """Get comprehensive portfolio summary with all metrics"""
     try:
-        portfolio_cash = float(Portfolio.get_user_portfolio(current_user.id))
-        trades_raw = Trade.get_user_trades(current_user.id)
+        portfolio_cash, _, trades_raw = _user_state()
         
         # Convert to dict list
         trades = [dict(t) for t in trades_raw]
@@ -2549,82 +1460,152 @@ def get_portfolio_summary():
         # Get trading statistics
         stats = Trade.get_trade_statistics(current_user.id)
         
-        return jsonify({
+        return fastjson({
             'success': True,
             'portfolio_cash': portfolio_cash,
             'summary': summary,
             'statistics': stats
         })
     except Exception as e:
-        logger.error(f"Error getting portfolio summary for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error getting portfolio summary for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
+
+@app.route('/api/trades', methods=['GET'])
+@login_required
+def get_trades():
+    """Get user's trades"""
+    try:
+        trades_raw = Trade.get_user_trades(current_user.id)
+        
+        # Decimal and date columns are converted by fastjson()
+        trades = [{
+            'id': trade['id'],
+            'ticker': trade['ticker'],
+            'buy_price': trade['buy_price'],
+            'quantity': trade['quantity'],
+            'position_size': trade['position_size'],
+            'risk_amount': trade['risk_amount'],
+            'timeframe': trade['timeframe'],
+            'trade_date': trade['trade_date'],
+        } for trade in trades_raw]
+        
+        return fastjson({'success': True, 'trades': trades})
+    except Exception as e:
+        logger.error("Error getting trades for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
+        
+@lru_cache(maxsize=1024)
+def _user_trades(user_id, version):
+    """Trade.get_user_trades() memoized per Trade.get_version() stamp.
+
+    Callers pass the current version, so any trade write makes the next
+    call miss and re-read. Rows are shared: copy before mutating.
+    """
+    return Trade.get_user_trades(user_id)
+
+
+def _user_state():
+    """(cash, trades version, raw trades) for the current user.
+
+    Read once per request and kept on flask.g, so helpers that need the
+    portfolio state don't each go back to the database for it.
+    """
+    if 'user_state' not in g:
+        user_id = current_user.id
+        version = Trade.get_version(user_id)
+        g.user_state = (
+            float(Portfolio.get_user_portfolio(user_id)),
+            version,
+            _user_trades(user_id, version),
+        )
+    return g.user_state
+
+
+def _open_trade_prices(trades):
+    """Current price for each distinct ticker among the open trades.
+
+    Tickers whose quote can't be fetched map to None.
+    """
+    return price_checker.get_cached_prices(t['ticker'] for t in trades if not t.get('is_closed'))
+
+
+def _enrich_trades(trades_raw, portfolio_cash, prices):
+    """Trades with all calculated fields, JSON-ready."""
+    enrich = portfolio_calculator.enrich_trade_with_calculations
+    # Current price only matters for open trades
+    return [
+        enrich(trade, portfolio_cash, None if trade.get('is_closed') else prices.get(trade['ticker']))
+        for trade in trades_raw
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _cached_enriched_trades(user_id, version, portfolio_cash, prices):
+    """_enrich_trades() memoized on everything its output depends on.
+
+    prices is a sorted tuple of (ticker, price) items so it can be hashed.
+    Quotes come from the 15s price cache, so repeated loads within that
+    window (and reloads after a no-op) skip the calculators.
+    """
+    return _enrich_trades(_user_trades(user_id, version), portfolio_cash, dict(prices))
+
+
+def _enriched_trades_for_user():
+    """(trades_raw, prices, enriched trades, etag) for the current user.
+
+    The etag covers every input of the enriched trades (trades version, cash
+    and quotes), so callers can answer 304 without serializing anything.
+    """
+    user_id = current_user.id
+    portfolio_cash, version, trades_raw = _user_state()
+    prices = _open_trade_prices(trades_raw)
+    prices_key = tuple(sorted(prices.items()))
+    enriched = _cached_enriched_trades(user_id, version, portfolio_cash, prices_key)
+    etag = state_etag(user_id, version, portfolio_cash, prices_key)
+    return trades_raw, prices, enriched, etag
+
 
-@app.route('/api/trades', methods=['GET'])
-@login_required
-def get_trades():
-    """Get user's trades"""
-    try:
-        trades_raw = Trade.get_user_trades(current_user.id)
-        
-        trades = []
-        for trade in trades_raw:
-            trades.append({
-                'id': trade['id'],
-                'ticker': trade['ticker'],
-                'buy_price': float(trade['buy_price']),
-                'quantity': float(trade['quantity']),
-                'position_size': float(trade['position_size']),
-                'risk_amount': float(trade['risk_amount']),
-                'timeframe': trade['timeframe'],
-                'trade_date': trade['trade_date'].isoformat() if hasattr(trade['trade_date'], 'isoformat') else str(trade['trade_date'])
-            })
-        
-        return jsonify({'success': True, 'trades': trades})
-    except Exception as e:
-        logger.error(f"Error getting trades for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
-        
 @app.route('/api/trades/enriched', methods=['GET'])
 @login_required
 def get_enriched_trades():
     """Get trades with all calculated fields (risk %, R:R, P&L, warnings)"""
     try:
-        portfolio_cash = float(Portfolio.get_user_portfolio(current_user.id))
-        trades_raw = Trade.get_user_trades(current_user.id)
-        
-        enriched_trades = []
-        
-        for trade in trades_raw:
-            # Get current price for open trades
-            current_price = None
-            if not trade.get('is_closed'):
-                try:
-                    current_price = price_checker.get_price(trade['ticker'])
-                except Exception as e:
-                    logger.warning(f"Could not fetch price for {trade['ticker']}: {e}")
-            
-            # Enrich trade with all calculations
-            enriched = portfolio_calculator.enrich_trade_with_calculations(
-                dict(trade), portfolio_cash, current_price
-            )
-            
-            # Convert dates to strings
-            if enriched.get('trade_date'):
-                enriched['trade_date'] = enriched['trade_date'].isoformat() if hasattr(enriched['trade_date'], 'isoformat') else str(enriched['trade_date'])
-            if enriched.get('close_date'):
-                enriched['close_date'] = enriched['close_date'].isoformat() if hasattr(enriched['close_date'], 'isoformat') else str(enriched['close_date'])
-            
-            # Convert Decimal to float
-            for key in enriched:
-                if hasattr(enriched[key], '__float__'):
-                    enriched[key] = float(enriched[key])
-            
-            enriched_trades.append(enriched)
-        
-        return jsonify({'success': True, 'trades': enriched_trades})
+        _, _, enriched_trades, etag = _enriched_trades_for_user()
+        if request.if_none_match.contains(etag):
+            return not_modified(etag)
+        return conditional_json(json_bytes({'success': True, 'trades': enriched_trades}), etag)
+    except Exception as e:
+        logger.error("Error getting enriched trades for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
+
+@app.route('/api/portfolio/bootstrap', methods=['GET'])
+@login_required
+def get_portfolio_bootstrap():
+    """Everything the portfolio page loads on open, in one round trip.
+
+    Same payload as /api/portfolio, /api/portfolio/summary and
+    /api/trades/enriched combined, computed from one read of the cash and
+    trades and one price lookup per open ticker.
+    """
+    try:
+        trades_raw, prices, enriched_trades, etag = _enriched_trades_for_user()
+        portfolio_cash = _user_state()[0]
+        # Statistics and summary derive from the same inputs as the trades
+        if request.if_none_match.contains(etag):
+            return not_modified(etag)
+
+        return conditional_json(json_bytes({
+            'success': True,
+            'cash': portfolio_cash,
+            'summary': portfolio_calculator.calculate_portfolio_summary(
+                [dict(t) for t in trades_raw], portfolio_cash, prices
+            ),
+            'statistics': Trade.get_trade_statistics(current_user.id),
+            'trades': enriched_trades,
+        }), etag)
     except Exception as e:
-        logger.error(f"Error getting enriched trades for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error getting portfolio bootstrap for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/trades', methods=['POST'])
 @login_required
@@ -2635,55 +1616,20 @@ def create_trade():
     Risk Amount = |buy_price - stop_loss| * quantity
     """
     try:
-        data = request.json
-        
-        # Get required fields
-        ticker = data['ticker'].upper()
-        buy_price = float(data['buy_price'])
-        quantity = float(data['quantity'])
-        timeframe = data['timeframe']
-        trade_date = data['trade_date']
-        
-        # Get optional fields
-        stop_loss = float(data['stop_loss']) if data.get('stop_loss') else None
-        take_profit = float(data['take_profit']) if data.get('take_profit') else None
-        notes = (data.get('notes') or '').strip() or None
+        # Parsing, validation and the automatic calculations live in TradeInput
+        trade = TradeInput.from_json(json_body())
+        logger.info("Creating trade for user %s: %s - Position: $%.2f, Risk: $%.2f", current_user.id, trade.ticker, trade.position_size, trade.risk_amount)
         
-        # AUTOMATIC CALCULATIONS
-        # Position Size = buy_price * quantity
-        position_size = buy_price * quantity
+        trade_id = Trade.create_trade(current_user.id, *trade.as_trade_args())
         
-        # Risk Amount = |buy_price - stop_loss| * quantity (if stop_loss provided)
-        if stop_loss is not None:
-            risk_amount = abs(buy_price - stop_loss) * quantity
-        else:
-            # Default risk if no stop loss (e.g., 2% of position)
-            risk_amount = position_size * 0.02
-        
-        logger.info(f"Creating trade for user {current_user.id}: {ticker} - Position: ${position_size:.2f}, Risk: ${risk_amount:.2f}")
-        
-        trade_id = Trade.create_trade(
-            current_user.id,
-            ticker,
-            buy_price,
-            quantity,
-            position_size,
-            risk_amount,
-            timeframe,
-            trade_date,
-            stop_loss,
-            take_profit,
-            notes
-        )
-        
-        logger.info(f"Trade created successfully with ID: {trade_id}")
-        return jsonify({'success': True, 'id': trade_id})
-    except KeyError as e:
-        logger.error(f"Missing required field: {e}")
-        return jsonify({'success': False, 'error': f'Missing required field: {e}'}), 400
+        logger.info("Trade created successfully with ID: %s", trade_id)
+        return fastjson({'success': True, 'id': trade_id})
+    except ValueError as e:
+        logger.error("Invalid trade payload: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 400)
     except Exception as e:
-        logger.error(f"Error creating trade for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error creating trade for user %s: %s", current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/trades/<int:trade_id>', methods=['PUT'])
 @login_required
@@ -2694,50 +1640,15 @@ def update_trade_route(trade_id):
     Risk Amount = |buy_price - stop_loss| * quantity
     """
     try:
-        data = request.json
-        
-        # Get required fields
-        ticker = data['ticker'].upper()
-        buy_price = float(data['buy_price'])
-        quantity = float(data['quantity'])
-        timeframe = data['timeframe']
-        trade_date = data['trade_date']
+        trade = TradeInput.from_json(json_body())
+        Trade.update_trade(trade_id, current_user.id, *trade.as_trade_args())
         
-        # Get optional fields
-        stop_loss = float(data['stop_loss']) if data.get('stop_loss') else None
-        take_profit = float(data['take_profit']) if data.get('take_profit') else None
-        notes = (data.get('notes') or '').strip() or None
-        
-        # AUTOMATIC CALCULATIONS
-        # Position Size = buy_price * quantity
-        position_size = buy_price * quantity
-        
-        # Risk Amount = |buy_price - stop_loss| * quantity (if stop_loss provided)
-        if stop_loss is not None:
-            risk_amount = abs(buy_price - stop_loss) * quantity
-        else:
-            # Default risk if no stop loss
-            risk_amount = position_size * 0.02
-        
-        Trade.update_trade(
-            trade_id,
-            current_user.id,
-            ticker,
-            buy_price,
-            quantity,
-            position_size,
-            risk_amount,
-            timeframe,
-            trade_date,
-            stop_loss,
-            take_profit,
-            notes
-        )
-        
-        return jsonify({'success': True})
+        return fastjson({'success': True})
+    except ValueError as e:
+        return fastjson({'success': False, 'error': str(e)}, 400)
     except Exception as e:
-        logger.error(f"Error updating trade {trade_id} for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error updating trade %s for user %s: %s", trade_id, current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/trades/<int:trade_id>', methods=['DELETE'])
 @login_required
@@ -2745,26 +1656,26 @@ def delete_trade_route(trade_id):
     """Delete a trade"""
     try:
         Trade.delete_trade(trade_id, current_user.id)
-        return jsonify({'success': True})
+        return fastjson({'success': True})
     except Exception as e:
-        logger.error(f"Error deleting trade {trade_id} for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error deleting trade %s for user %s: %s", trade_id, current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/trades/<int:trade_id>/close', methods=['POST'])
 @login_required
 def close_trade_route(trade_id):
     """Close a trade and record realized P&L"""
     try:
-        data = request.json
+        data = json_body()
         close_price = float(data['close_price'])
         close_date = data['close_date']
         
         Trade.close_trade(trade_id, current_user.id, close_price, close_date)
         
-        return jsonify({'success': True})
+        return fastjson({'success': True})
     except Exception as e:
-        logger.error(f"Error closing trade {trade_id} for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error closing trade %s for user %s: %s", trade_id, current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/trades/<int:trade_id>/reopen', methods=['POST'])
 @login_required
@@ -2772,31 +1683,41 @@ def reopen_trade_route(trade_id):
     """Reopen a closed trade"""
     try:
         Trade.reopen_trade(trade_id, current_user.id)
-        return jsonify({'success': True})
+        return fastjson({'success': True})
     except Exception as e:
-        logger.error(f"Error reopening trade {trade_id} for user {current_user.id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error reopening trade %s for user %s: %s", trade_id, current_user.id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
+
+
+@lru_cache(maxsize=4096)
+def _trade_ticker(trade_id, user_id, version):
+    """Trade.get_trade_ticker() memoized per Trade.get_version() stamp.
+
+    Any trade write (including editing the ticker or deleting the trade)
+    moves the version, so stale entries are never read again.
+    """
+    return Trade.get_trade_ticker(trade_id, user_id)
+
+
 @app.route('/api/trades/<int:trade_id>/current-price', methods=['GET'])
 @login_required
 def get_trade_current_price(trade_id):
     """Get current market price for a trade's ticker"""
     try:
-        # Get trade to find ticker
-        trades = Trade.get_user_trades(current_user.id)
-        trade = next((t for t in trades if t['id'] == trade_id), None)
+        ticker = _trade_ticker(trade_id, current_user.id, Trade.get_version(current_user.id))
         
-        if not trade:
-            return jsonify({'success': False, 'error': 'Trade not found'}), 404
+        if not ticker:
+            return fastjson({'success': False, 'error': 'Trade not found'}, 404)
         
-        current_price = price_checker.get_price(trade['ticker'])
+        current_price = price_checker.get_cached_price(ticker)
         
         if current_price is None:
-            return jsonify({'success': False, 'error': 'Could not fetch price'}), 500
+            return fastjson({'success': False, 'error': 'Could not fetch price'}, 500)
         
-        return jsonify({'success': True, 'price': current_price})
+        return fastjson({'success': True, 'price': current_price})
     except Exception as e:
-        logger.error(f"Error fetching current price for trade {trade_id}: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error fetching current price for trade %s: %s", trade_id, e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
         
 # Initialize database schema in background
 def init_db_and_scheduler():
@@ -2804,50 +1725,82 @@ def init_db_and_scheduler():
         db.init_schema()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+        logger.error("Database initialization failed: %s", e)
     
     # Start alert processor
     alert_processor.start()
 
+_init_lock = threading.Lock()
+
+
 # Run after first request, not at startup
 @app.before_request
 def before_first_request():
-    if not hasattr(app, '_initialized'):
-        app._initialized = True
-        from threading import Thread
-        Thread(target=init_db_and_scheduler, daemon=True).start()
+    # One-shot: the hook takes itself out of the chain, so later requests
+    # don't pay for it. The list is replaced rather than mutated because
+    # Flask is iterating over it right now.
+    with _init_lock:
+        hooks = app.before_request_funcs[None]
+        if before_first_request not in hooks:
+            return
+        app.before_request_funcs[None] = [f for f in hooks if f is not before_first_request]
+    threading.Thread(target=init_db_and_scheduler, daemon=True).start()
+
 @app.route('/api/alerts/history', methods=['GET'])
 @login_required
 def get_alert_history():
-    from models import AlertTrigger
+    etag = state_etag('history', *AlertTrigger.get_history_stamp(current_user.id))
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
     history = AlertTrigger.get_user_history(current_user.id)
-    return jsonify({'success': True, 'history': [
+    return conditional_json(json_bytes({'success': True, 'history': [
         {
             'id': r['id'], 'ticker': r['ticker'], 'alert_type': r['alert_type'],
-            'triggered_at': r['triggered_at'].isoformat() if r['triggered_at'] else None,
-            'price_at_trigger': float(r['price_at_trigger']) if r['price_at_trigger'] else None,
+            'triggered_at': r['triggered_at'], 'price_at_trigger': r['price_at_trigger'],
             'explanation': r['explanation_text']
         } for r in history
-    ]})
+    ]}), etag)
+
+_PRICE_DIRECTION_WORDS = {'up': 'above', 'down': 'below'}
+_PERCENT_CHANGE_TEMPLATES = {
+    'up': "Alert when {} rises {}%+ in 24h",
+    'down': "Alert when {} falls {}%+ in 24h",
+}
+_PERCENT_CHANGE_EITHER = "Alert when {} moves {}%+ (either direction) in 24h"
+
+
+def _generic_summary(ticker, params):
+    return f"Alert for {ticker}"
+
+
+# alert_type -> (ticker, parameters) -> one-line summary of the AI suggestion
+_SUGGESTION_SUMMARIES = {
+    'price': lambda ticker, p: (
+        f"Alert when {ticker} goes {_PRICE_DIRECTION_WORDS.get(p.get('direction'), 'near')} "
+        f"${p['target_price']:.2f}"
+    ),
+    'ma': lambda ticker, p: f"Alert when {ticker} crosses MA{p['ma_period']}",
+    'percent_change': lambda ticker, p: _PERCENT_CHANGE_TEMPLATES.get(
+        p.get('direction', 'both'), _PERCENT_CHANGE_EITHER).format(ticker, p['threshold_pct']),
+}
+
 
 @app.route('/api/alerts/parse-text', methods=['POST'])
 @login_required
 def parse_alert_text():
     """Parse natural language text using AI"""
     try:
-        from services.ai_nl_parser import ai_nl_parser
-        
-        data = request.json
+        data = json_body()
         text = data.get('text', '').strip()
         
         if not text:
-            return jsonify({'success': False, 'error': 'No text provided'}), 400
+            return fastjson({'success': False, 'error': 'No text provided'}, 400)
         
         # Use AI parser
         result = ai_nl_parser.parse(text)
         
         if not result.get('success'):
-            return jsonify(result), 400
+            return fastjson(result, 400)
         
         # Build readable summary
         ticker = result['ticker']
@@ -2855,24 +1808,9 @@ def parse_alert_text():
         params = result['parameters']
         
         # Create human-readable summary
-        if alert_type == 'price':
-            direction = 'above' if params.get('direction') == 'up' else 'below' if params.get('direction') == 'down' else 'near'
-            summary = f"Alert when {ticker} goes {direction} ${params['target_price']:.2f}"
-        elif alert_type == 'ma':
-            summary = f"Alert when {ticker} crosses MA{params['ma_period']}"
-        elif alert_type == 'percent_change':
-            direction = params.get('direction', 'both')
-            threshold = params['threshold_pct']
-            if direction == 'up':
-                summary = f"Alert when {ticker} rises {threshold}%+ in 24h"
-            elif direction == 'down':
-                summary = f"Alert when {ticker} falls {threshold}%+ in 24h"
-            else:
-                summary = f"Alert when {ticker} moves {threshold}%+ (either direction) in 24h"
-        else:
-            summary = f"Alert for {ticker}"
+        summary = _SUGGESTION_SUMMARIES.get(alert_type, _generic_summary)(ticker, params)
         
-        return jsonify({
+        return fastjson({
             'success': True,
             'suggestion': {
                 'ticker': result['ticker'],
@@ -2885,34 +1823,34 @@ def parse_alert_text():
         })
     
     except Exception as e:
-        logger.error(f"Error parsing alert text: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error parsing alert text: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/alerts/create-from-suggestion', methods=['POST'])
 @login_required
 def create_alert_from_suggestion():
     """Create alert from AI NL parser suggestion (after user confirms)"""
     try:
-        data = request.json
+        data = json_body()
         ticker = data['ticker'].upper()
         alert_type = data['alert_type']
         params = data['params']
         
-        logger.info(f"Creating alert from AI suggestion: {ticker} | Type: {alert_type}")
+        logger.info("Creating alert from AI suggestion: %s | Type: %s", ticker, alert_type)
         
         # Validate alert type is supported
-        if alert_type not in ['price', 'ma']:
-            return jsonify({
+        if alert_type not in ALERT_TYPES:
+            return fastjson({
                 'success': False, 
                 'error': f'Alert type "{alert_type}" not yet supported via AI parsing. Try price or MA alerts.'
-            }), 400
+            }, 400)
         
         # Get current price (validates ticker exists)
-        current_price = price_checker.get_price(ticker)
+        current_price = price_checker.get_cached_price(ticker)
         if current_price is None:
-            return jsonify({'success': False, 'error': f'Could not get price for {ticker}. Invalid ticker?'}), 400
+            return fastjson({'success': False, 'error': f'Could not get price for {ticker}. Invalid ticker?'}, 400)
         
-        logger.info(f"Current price for {ticker}: ${current_price:.2f}")
+        logger.info("Current price for %s: $%.2f", ticker, current_price)
         
         # Create alert based on type
         alert_id = None
@@ -2924,7 +1862,7 @@ def create_alert_from_suggestion():
             
             # Validate price
             if target_price <= 0:
-                return jsonify({'success': False, 'error': 'Price must be greater than 0'}), 400
+                return fastjson({'success': False, 'error': 'Price must be greater than 0'}, 400)
             
             # Determine direction if "both"
             if direction == 'both':
@@ -2940,24 +1878,24 @@ def create_alert_from_suggestion():
                 alert_type='price'
             )
             
-            logger.info(f"Created price alert #{alert_id}: {ticker} @ ${target_price:.2f} ({direction})")
+            logger.info("Created price alert #%s: %s @ $%.2f (%s)", alert_id, ticker, target_price, direction)
         
         elif alert_type == 'ma':
             # MA ALERT
             ma_period = int(params.get('ma_period', 50))
             
             # Validate MA period
-            if ma_period not in [20, 50, 150]:
-                return jsonify({'success': False, 'error': 'MA period must be 20, 50, or 150'}), 400
+            if ma_period not in MA_PERIODS:
+                return fastjson({'success': False, 'error': 'MA period must be 20, 50, or 150'}, 400)
             
             # Calculate current MA value
-            ma_value = price_checker.get_moving_average(ticker, ma_period)
+            ma_value = price_checker.get_cached_moving_average(ticker, ma_period)
             
             if ma_value is None:
-                return jsonify({
+                return fastjson({
                     'success': False, 
                     'error': f'Could not calculate MA{ma_period} for {ticker}. Not enough historical data.'
-                }), 400
+                }, 400)
             
             # Direction for MA alerts (default: up = cross above)
             direction = params.get('direction', 'up')
@@ -2972,10 +1910,12 @@ def create_alert_from_suggestion():
                 ma_period=ma_period
             )
             
-            logger.info(f"Created MA alert #{alert_id}: {ticker} MA{ma_period} @ ${ma_value:.2f}")
+            logger.info("Created MA alert #%s: %s MA%s @ $%.2f", alert_id, ticker, ma_period, ma_value)
+        
+        event_bus.publish(current_user.id, 'alerts')
         
         # Return success
-        return jsonify({
+        return fastjson({
             'success': True,
             'alert': {
                 'id': alert_id,
@@ -2989,35 +1929,33 @@ def create_alert_from_suggestion():
         })
     
     except KeyError as e:
-        logger.error(f"Missing parameter: {e}")
-        return jsonify({'success': False, 'error': f'Missing required parameter: {e}'}), 400
+        logger.error("Missing parameter: %s", e)
+        return fastjson({'success': False, 'error': f'Missing required parameter: {e}'}, 400)
     
     except ValueError as e:
-        logger.error(f"Invalid value: {e}")
-        return jsonify({'success': False, 'error': f'Invalid value: {e}'}), 400
+        logger.error("Invalid value: %s", e)
+        return fastjson({'success': False, 'error': f'Invalid value: {e}'}, 400)
     
     except Exception as e:
-        logger.error(f"Error creating alert from suggestion: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error creating alert from suggestion: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/radar', methods=['GET'])
 @login_required
 def get_market_radar():
-    from models import Anomaly
+    etag = state_etag('radar', *Anomaly.get_stamp(current_user.id))
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
     anomalies = Anomaly.get_user_anomalies(current_user.id)
-    return jsonify({'success': True, 'anomalies': [
+    return conditional_json(json_bytes({'success': True, 'anomalies': [
         {
             'id': a['id'], 'ticker': a['ticker'], 'anomaly_type': a['anomaly_type'],
             'metrics': a['metrics_json'], 'severity': a.get('severity'),
-            'detected_at': a['detected_at'].isoformat() if a['detected_at'] else None
+            'detected_at': a['detected_at']
         } for a in anomalies
-    ]})
+    ]}), etag)
 
-@app.route('/alerts/history')
-@login_required
-def alert_history_page():
-    """Alert trigger history page with AI explanations"""
-    html = """
+_ALERT_HISTORY_PAGE = StaticPage("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -3105,14 +2043,15 @@ def alert_history_page():
     </script>
 </body>
 </html>
-    """
-    return render_template_string(html)
+""")
 
-@app.route('/radar')
+@app.route('/alerts/history')
 @login_required
-def radar_page():
-    """Market anomaly radar page"""
-    html = """
+def alert_history_page():
+    """Alert trigger history page with AI explanations"""
+    return _ALERT_HISTORY_PAGE.response(max_age=60)
+
+_RADAR_PAGE = StaticPage("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -3241,23 +2180,27 @@ def radar_page():
     </script>
 </body>
 </html>
-    """
-    return render_template_string(html)
+""")
+
+@app.route('/radar')
+@login_required
+def radar_page():
+    """Market anomaly radar page"""
+    return _RADAR_PAGE.response(max_age=60)
 
 # ============================================
 # FOREX AMD ROUTES
 # ============================================
 
-@app.route('/forex-amd')
-@login_required
-def forex_amd_page():
-    """Forex AMD detection page"""
-    html = """
+_FOREX_AMD_PAGE = StaticPage("""
 <!DOCTYPE html>
 <html>
 <head>
     <title>Forex AMD Scanner</title>
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <!-- Start the watchlist request while the chart library downloads;
+         loadWatchlist()'s fetch picks up this response. -->
+    <link rel="preload" href="/api/forex-amd/watchlist" as="fetch" crossorigin>
     <script src="https://unpkg.com/lightweight-charts@4/dist/lightweight-charts.standalone.production.js"></script>
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
@@ -3408,23 +2351,52 @@ def forex_amd_page():
     </div>
     
     <script>
+        // Keyed list rendering: keeps the element already built for each key,
+        // builds only new ones, drops the rest and fixes the order in place,
+        // instead of re-parsing the whole list on every refresh.
+        function syncList(container, nodes, items, keyOf, build, emptyHtml) {
+            const keys = new Set(items.map(item => String(keyOf(item))));
+            for (const [key, el] of nodes) {
+                if (!keys.has(key)) { el.remove(); nodes.delete(key); }
+            }
+            if (items.length === 0) {
+                container.innerHTML = emptyHtml;
+                return;
+            }
+            for (const child of [...container.children]) {
+                if (!child.dataset.key) child.remove();  // placeholder text
+            }
+            items.forEach((item, i) => {
+                const key = String(keyOf(item));
+                let el = nodes.get(key);
+                if (!el) {
+                    const tpl = document.createElement('template');
+                    tpl.innerHTML = build(item).trim();
+                    el = tpl.content.firstElementChild;
+                    el.dataset.key = key;
+                    nodes.set(key, el);
+                }
+                const at = container.children[i];
+                if (at !== el) container.insertBefore(el, at || null);
+            });
+        }
+
         // ── Watchlist ────────────────────────────────────────────────────────
+        const _watchlistNodes = new Map();  // symbol -> rendered chip
+
         async function loadWatchlist() {
             const res = await fetch('/api/forex-amd/watchlist');
             const data = await res.json();
+            const symbols = data.symbols || [];
 
-            const container = document.getElementById('watchlistContainer');
-            if (data.symbols.length === 0) {
-                container.innerHTML = '<p style="color: #8B92A8;">No symbols in watchlist. Add some above.</p>';
-            } else {
-                container.innerHTML = data.symbols.map(s => `
+            syncList(document.getElementById('watchlistContainer'), _watchlistNodes,
+                symbols, s => s, s => `
                     <span style="display:inline-flex;align-items:center;gap:8px;margin:4px;padding:8px 16px;background:rgba(255,255,255,0.1);border-radius:8px;">
                         ${s}
                         <button onclick="removeSymbol('${s}')" style="padding:2px 8px;font-size:12px;background:rgba(255,107,107,0.3);border-radius:4px;cursor:pointer;" title="Remove">&#x2715;</button>
-                    </span>
-                `).join('');
-            }
-            updateChartSymbolSelect(data.symbols || []);
+                    </span>`,
+                '<p style="color: #8B92A8;">No symbols in watchlist. Add some above.</p>');
+            updateChartSymbolSelect(symbols);
         }
 
         async function removeSymbol(symbol) {
@@ -3452,34 +2424,38 @@ def forex_amd_page():
         // ── AMD Setups ───────────────────────────────────────────────────────
         async function loadAlerts() {
             const res = await fetch('/api/forex-amd/alerts');
-            const data = await res.json();
-            const container = document.getElementById('alertsContainer');
-            if (data.alerts.length === 0) {
-                container.innerHTML = '<div style="text-align:center;padding:40px;color:#8B92A8;">No AMD setups detected yet</div>';
-                return;
-            }
-            container.innerHTML = data.alerts.map(alert => {
-                const qualityClass = alert.setup_quality >= 8 ? 'quality-high' : 'quality-medium';
-                const dirClass = alert.direction === 'bullish' ? 'bullish' : 'bearish';
-                const date = new Date(alert.detected_at).toLocaleString();
-                return `
-                    <div class="amd-card ${dirClass}">
-                        <div style="display:flex;justify-content:space-between;margin-bottom:12px;">
-                            <span style="font-size:20px;font-weight:700;">${alert.symbol}</span>
-                            <span class="quality-badge ${qualityClass}">Quality: ${alert.setup_quality}/10</span>
-                        </div>
-                        <div style="margin-bottom:8px;">
-                            <strong style="color:${alert.direction==='bullish'?'#00FFA3':'#FF6B6B'};">
-                                ${alert.direction.toUpperCase()}
-                            </strong> setup detected during ${alert.session} session
-                        </div>
-                        <div style="font-size:13px;color:#8B92A8;">
-                            Sweep: ${alert.sweep_level} | IFVG: ${alert.ifvg_low} - ${alert.ifvg_high}
-                        </div>
-                        <div style="font-size:12px;color:#666;margin-top:8px;">${date}</div>
+            renderAlerts(await res.json());
+        }
+
+        const _alertNodes = new Map();  // alert id -> rendered card (setups never change)
+
+        function renderAlerts(data) {
+            syncList(document.getElementById('alertsContainer'), _alertNodes,
+                data.alerts || [], alert => alert.id, alertCard,
+                '<div style="text-align:center;padding:40px;color:#8B92A8;">No AMD setups detected yet</div>');
+        }
+
+        function alertCard(alert) {
+            const qualityClass = alert.setup_quality >= 8 ? 'quality-high' : 'quality-medium';
+            const dirClass = alert.direction === 'bullish' ? 'bullish' : 'bearish';
+            const date = new Date(alert.detected_at).toLocaleString();
+            return `
+                <div class="amd-card ${dirClass}">
+                    <div style="display:flex;justify-content:space-between;margin-bottom:12px;">
+                        <span style="font-size:20px;font-weight:700;">${alert.symbol}</span>
+                        <span class="quality-badge ${qualityClass}">Quality: ${alert.setup_quality}/10</span>
+                    </div>
+                    <div style="margin-bottom:8px;">
+                        <strong style="color:${alert.direction==='bullish'?'#00FFA3':'#FF6B6B'};">
+                            ${alert.direction.toUpperCase()}
+                        </strong> setup detected during ${alert.session} session
+                    </div>
+                    <div style="font-size:13px;color:#8B92A8;">
+                        Sweep: ${alert.sweep_level} | IFVG: ${alert.ifvg_low} - ${alert.ifvg_high}
                     </div>
-                `;
-            }).join('');
+                    <div style="font-size:12px;color:#666;margin-top:8px;">${date}</div>
+                </div>
+            `;
         }
 
         async function logout() {
@@ -3565,22 +2541,54 @@ def forex_amd_page():
                 return;
             }
             try {
+                // Candles and overlay arrive together in one request
                 const res = await fetch(
-                    '/api/forex-amd/candles?symbol=' + encodeURIComponent(sym) +
+                    '/api/forex-amd/chart?symbol=' + encodeURIComponent(sym) +
                     '&interval=' + _currentTf + '&limit=200'
                 );
                 const data = await res.json();
                 if (data.error) throw new Error(data.error);
-                _candleSeries.setData(data);
+                _candleSeries.setData(data.candles);
+                _lastBarTime = data.candles.length ? data.candles[data.candles.length - 1].time : null;
                 _chart.timeScale().fitContent();
-                await loadOverlays(sym);
+                drawOverlays(data.overlay);
             } catch(e) {
                 errEl.textContent = 'Chart error: ' + e.message;
                 errEl.style.display = 'block';
             }
         }
 
-        async function loadOverlays(sym) {
+        // Keep the shown chart current without redrawing it: only the bars
+        // at or after the last one go through series.update(), which is O(1)
+        // per bar where setData() rebuilds the whole series.
+        let _lastBarTime = null;
+
+        async function refreshChart() {
+            const sym = document.getElementById('chartSymbolSelect').value;
+            const tf = _currentTf;
+            if (!sym || !_candleSeries || _lastBarTime === null || document.hidden) return;
+            try {
+                // Served from the server's candle cache, the same entry /chart
+                // uses. Repeat ticks revalidate the browser's copy by ETag, so
+                // they only transfer the bars when the entry has changed.
+                const res = await fetch(
+                    '/api/forex-amd/candles?symbol=' + encodeURIComponent(sym) +
+                    '&interval=' + tf + '&limit=200'
+                );
+                const bars = await res.json();
+                // Ignore the result if the user switched charts meanwhile
+                if (!Array.isArray(bars) || sym !== document.getElementById('chartSymbolSelect').value
+                        || tf !== _currentTf) return;
+                for (const bar of bars) {
+                    if (bar.time >= _lastBarTime) {
+                        _candleSeries.update(bar);
+                        _lastBarTime = bar.time;
+                    }
+                }
+            } catch(_) { /* the next tick retries */ }
+        }
+
+        function drawOverlays(ov) {
             // Remove old price lines
             _priceLines.forEach(pl => { try { _candleSeries.removePriceLine(pl); } catch(_) {} });
             _priceLines = [];
@@ -3589,12 +2597,8 @@ def forex_amd_page():
             const badge = document.getElementById('chart-state-badge');
             if (badge) badge.textContent = '';
 
+            if (!ov) return;
             try {
-                const res = await fetch('/api/forex-amd/overlay?symbol=' + encodeURIComponent(sym));
-                const data = await res.json();
-                if (!data.success) return;
-                const ov = data.overlay;
-
                 if (badge && ov.state) badge.textContent = 'State: ' + ov.state;
 
                 // Accumulation box – two dotted lines
@@ -3652,13 +2656,32 @@ def forex_amd_page():
 
         // ── Boot ─────────────────────────────────────────────────────────────
         loadWatchlist();
-        loadAlerts();
-        setInterval(loadAlerts, 60000);
+        if (window.EventSource) {
+            // Pushed on connect and whenever the scanner records a setup
+            const amdStream = new EventSource('/api/forex-amd/stream');
+            amdStream.addEventListener('amd_alerts', e => renderAlerts(JSON.parse(e.data)));
+        } else {
+            loadAlerts();
+            setInterval(loadAlerts, 60000);
+        }
+        setInterval(refreshChart, 60000);
     </script>
 </body>
 </html>
-    """
-    return render_template_string(html)
+""")
+
+@app.route('/forex-amd')
+@login_required
+def forex_amd_page():
+    """Forex AMD detection page"""
+    return _FOREX_AMD_PAGE.response(max_age=300)
+
+
+# Per-user watchlist cache: user_id -> (monotonic_timestamp, json_body, etag).
+# Only manage_forex_watchlist writes the table, and it drops the entry on
+# every change, so the TTL just bounds staleness from other processes.
+_watchlist_cache: dict = {}
+_WATCHLIST_CACHE_TTL = 30  # seconds
 
 
 @app.route('/api/forex-amd/watchlist', methods=['GET', 'POST', 'DELETE'])
@@ -3666,47 +2689,53 @@ def forex_amd_page():
 def manage_forex_watchlist():
     """Manage user's forex watchlist"""
     if request.method == 'POST':
-        raw_symbol = request.json.get('symbol', '').strip()
+        raw_symbol = json_body().get('symbol', '').strip()
 
         if not raw_symbol:
-            return jsonify({'success': False, 'error': 'Symbol required'}), 400
+            return fastjson({'success': False, 'error': 'Symbol required'}, 400)
 
-        from services.forex_data_provider import normalize_symbol
         symbol, norm_err = normalize_symbol(raw_symbol)
         if norm_err:
-            return jsonify({'success': False, 'error': norm_err}), 400
+            return fastjson({'success': False, 'error': norm_err}, 400)
 
         try:
-            db.execute("""
+            db.execute_prepared('amd_watchlist_add', """
                 INSERT INTO forex_watchlist (user_id, symbol)
-                VALUES (%s, %s)
+                VALUES ($1, $2)
                 ON CONFLICT (user_id, symbol) DO NOTHING
             """, (current_user.id, symbol))
+            _watchlist_cache.pop(current_user.id, None)
 
-            return jsonify({'success': True, 'symbol': symbol})
+            return fastjson({'success': True, 'symbol': symbol})
         except Exception as e:
-            logger.error(f"Error adding to watchlist: {e}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.error("Error adding to watchlist: %s", e)
+            return fastjson({'success': False, 'error': str(e)}, 500)
     
     elif request.method == 'DELETE':
-        symbol = request.json.get('symbol')
-        db.execute("""
+        symbol = json_body().get('symbol')
+        db.execute_prepared('amd_watchlist_delete', """
             DELETE FROM forex_watchlist
-            WHERE user_id = %s AND symbol = %s
+            WHERE user_id = $1 AND symbol = $2
         """, (current_user.id, symbol))
-        return jsonify({'success': True})
+        _watchlist_cache.pop(current_user.id, None)
+        return fastjson({'success': True})
     
     else:  # GET
-        watchlist = db.execute("""
+        now_mono = time.monotonic()
+        cached = _watchlist_cache.get(current_user.id)
+        if cached and (now_mono - cached[0]) < _WATCHLIST_CACHE_TTL:
+            return conditional_json(cached[1], cached[2])
+
+        watchlist = db.execute_prepared('amd_watchlist_get', """
             SELECT symbol FROM forex_watchlist
-            WHERE user_id = %s
+            WHERE user_id = $1
             ORDER BY added_at DESC
         """, (current_user.id,), fetchall=True)
-        
-        return jsonify({
-            'success': True,
-            'symbols': [w['symbol'] for w in watchlist] if watchlist else []
-        })
+        symbols = [w['symbol'] for w in watchlist] if watchlist else []
+        body = json_bytes({'success': True, 'symbols': symbols})
+        etag = body_etag(body)
+        _watchlist_cache[current_user.id] = (now_mono, body, etag)
+        return conditional_json(body, etag)
 
 
 @app.route('/api/forex-amd/alerts')
@@ -3714,20 +2743,35 @@ def manage_forex_watchlist():
 def get_forex_amd_alerts():
     """Get user's AMD alerts"""
     try:
-        alerts = db.execute("""
-            SELECT * FROM forex_amd_alerts
-            WHERE user_id = %s
-            ORDER BY detected_at DESC
-            LIMIT 50
-        """, (current_user.id,), fetchall=True)
-        
-        return jsonify({
-            'success': True,
-            'alerts': alerts if alerts else []
-        })
+        return fastjson({'success': True, 'alerts': _amd_alerts(current_user.id)})
     except Exception as e:
-        logger.error(f"Error fetching AMD alerts: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("Error fetching AMD alerts: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
+
+
+def _amd_alerts(user_id):
+    """The user's 50 most recent AMD setups, newest first (the fields the cards show)."""
+    return db.execute_prepared('amd_alerts_get', """
+        SELECT id, symbol, direction, session, setup_quality,
+               sweep_level, ifvg_low, ifvg_high, detected_at
+        FROM forex_amd_alerts
+        WHERE user_id = $1
+        ORDER BY detected_at DESC
+        LIMIT 50
+    """, (user_id,), fetchall=True) or []
+
+
+@app.route('/api/forex-amd/stream')
+@login_required
+def forex_amd_stream():
+    """Server-Sent Events: the user's AMD setups on connect and whenever the
+    detector records a new one."""
+    user_id = current_user.id
+
+    def amd_alerts_event():
+        return sse_event('amd_alerts', {'success': True, 'alerts': _amd_alerts(user_id)})
+
+    return sse_response(_user_event_stream(user_id, ('amd_alerts',), amd_alerts_event))
 
 @app.route('/api/forex-amd/debug-run')
 @login_required
@@ -3744,20 +2788,107 @@ def forex_amd_debug_run():
     """
     raw_symbol = request.args.get('symbol', '').strip()
     if not raw_symbol:
-        return jsonify({'error': 'symbol query parameter is required'}), 400
+        return fastjson({'error': 'symbol query parameter is required'}, 400)
 
-    from services.forex_data_provider import normalize_symbol
     symbol, norm_err = normalize_symbol(raw_symbol)
     if norm_err:
-        return jsonify({'error': norm_err}), 400
+        return fastjson({'error': norm_err}, 400)
 
     try:
-        from services.forex_amd_detector import forex_amd_detector
         report = forex_amd_detector.debug_run(current_user.id, symbol)
-        return jsonify(report)
+        return fastjson(report)
     except Exception as exc:
-        logger.error(f"[AMD_FOREX][DEBUG_RUN] symbol={symbol} user={current_user.id} err={exc}", exc_info=True)
-        return jsonify({'error': str(exc)}), 500
+        logger.error("[AMD_FOREX][DEBUG_RUN] symbol=%s user=%s err=%s", symbol, current_user.id, exc, exc_info=True)
+        return fastjson({'error': str(exc)}, 500)
+
+
+def _amd_health():
+    """Scanner health payload (global, not per user)."""
+    row = db.execute(
+        """SELECT last_run_at, last_ok_at, last_error_at, last_error_msg,
+                  last_symbols_count
+           FROM forex_amd_health WHERE id = 1""",
+        fetchone=True,
+    )
+    threshold_min = AMDConfig.UNHEALTHY_THRESHOLD_MINUTES
+    healthy = False
+    age_min = None
+    if row and row.get('last_ok_at'):
+        last_ok = row['last_ok_at']
+        if last_ok.tzinfo is None:
+            last_ok = last_ok.replace(tzinfo=timezone.utc)
+        age_min = (datetime.now(timezone.utc) - last_ok).total_seconds() / 60
+        healthy = age_min <= threshold_min
+    return {
+        'success': True,
+        'healthy': healthy,
+        'threshold_minutes': threshold_min,
+        'age_minutes': round(age_min, 1) if age_min is not None else None,
+        'last_run_at':    row['last_run_at']                if row else None,
+        'last_ok_at':     row['last_ok_at']                 if row else None,
+        'last_error_at':  row['last_error_at']              if row else None,
+        'last_error_msg': row['last_error_msg']             if row else None,
+        'last_symbols_count': row['last_symbols_count']     if row else 0,
+    }
+
+
+def _amd_states(user_id):
+    """State-machine snapshot payload, one entry per watched symbol."""
+    rows = db.execute_prepared('amd_state_get', """
+        SELECT symbol, current_state, last_update
+        FROM forex_amd_state
+        WHERE user_id = $1
+        ORDER BY symbol
+    """, (user_id,), fetchall=True)
+    states = [
+        {
+            'symbol':      r['symbol'],
+            'state_id':    r['current_state'],
+            'state_name':  STATE_NAMES.get(r['current_state'], 'UNKNOWN'),
+            'last_update': r['last_update'],
+        }
+        for r in (rows or [])
+    ]
+    return {'success': True, 'states': states, 'count': len(states)}
+
+
+def _amd_recent_events(user_id):
+    """Last 20 AMD triggers payload."""
+    rows = db.execute_prepared('amd_recent_events_get', """
+        SELECT symbol, direction, session, setup_quality,
+               sweep_level, ifvg_high, ifvg_low, detected_at
+        FROM forex_amd_alerts
+        WHERE user_id = $1
+        ORDER BY detected_at DESC
+        LIMIT 20
+    """, (user_id,), fetchall=True)
+    # Rows go out as-is: json_bytes() handles the timestamp and Decimals
+    return {'success': True, 'events': rows or []}
+
+
+# Encoded health/state/recent-events payloads:
+# (name, user_id) -> (monotonic_timestamp, scans_completed, json_body, etag).
+# They only change while a scan runs, so an entry is reused until the next run
+# completes; the TTL just bounds how stale age_minutes can read.
+_amd_snapshot_cache: dict = {}
+_AMD_SNAPSHOT_TTL = 30  # seconds
+_amd_snapshot_lock = threading.Lock()
+
+
+def _amd_snapshot(name, user_id, build, *args):
+    """(json_body, etag) for build(*args), cached per (name, user_id)."""
+    key = (name, user_id)
+    now_mono = time.monotonic()
+    scans = forex_amd_detector.scans_completed
+    with _amd_snapshot_lock:
+        cached = _amd_snapshot_cache.get(key)
+    if cached and cached[1] == scans and now_mono - cached[0] < _AMD_SNAPSHOT_TTL:
+        return cached[2], cached[3]
+    body = json_bytes(build(*args))
+    etag = body_etag(body)
+    with _amd_snapshot_lock:
+        _amd_snapshot_cache[key] = (now_mono, scans, body, etag)
+    return body, etag
 
 
 @app.route('/api/forex-amd/health')
@@ -3765,35 +2896,11 @@ def forex_amd_debug_run():
 def forex_amd_health():
     """AMD scanner health — last run timestamps + error info."""
     try:
-        row = db.execute(
-            "SELECT * FROM forex_amd_health WHERE id = 1",
-            fetchone=True,
-        )
-        from services.forex_amd_detector import AMDConfig
-        from datetime import datetime, timezone
-        threshold_min = AMDConfig.UNHEALTHY_THRESHOLD_MINUTES
-        healthy = False
-        age_min = None
-        if row and row.get('last_ok_at'):
-            last_ok = row['last_ok_at']
-            if last_ok.tzinfo is None:
-                last_ok = last_ok.replace(tzinfo=timezone.utc)
-            age_min = (datetime.now(timezone.utc) - last_ok).total_seconds() / 60
-            healthy = age_min <= threshold_min
-        return jsonify({
-            'success': True,
-            'healthy': healthy,
-            'threshold_minutes': threshold_min,
-            'age_minutes': round(age_min, 1) if age_min is not None else None,
-            'last_run_at':    row['last_run_at'].isoformat()    if row and row['last_run_at']    else None,
-            'last_ok_at':     row['last_ok_at'].isoformat()     if row and row['last_ok_at']     else None,
-            'last_error_at':  row['last_error_at'].isoformat()  if row and row['last_error_at']  else None,
-            'last_error_msg': row['last_error_msg']             if row else None,
-            'last_symbols_count': row['last_symbols_count']     if row else 0,
-        })
+        # Global, so every user shares one entry
+        return conditional_json(*_amd_snapshot('health', None, _amd_health))
     except Exception as e:
-        logger.error(f"[AMD_FOREX] health endpoint error: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("[AMD_FOREX] health endpoint error: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 
 @app.route('/api/forex-amd/state')
@@ -3801,29 +2908,10 @@ def forex_amd_health():
 def forex_amd_state_snapshot():
     """Current state-machine snapshot per symbol for the logged-in user."""
     try:
-        STATE_NAMES = {
-            0: 'IDLE', 1: 'ACCUMULATION', 2: 'SWEEP_DETECTED',
-            3: 'DISPLACEMENT_CONFIRMED', 4: 'WAIT_IFVG',
-        }
-        rows = db.execute("""
-            SELECT symbol, current_state, last_update
-            FROM forex_amd_state
-            WHERE user_id = %s
-            ORDER BY symbol
-        """, (current_user.id,), fetchall=True)
-        states = [
-            {
-                'symbol':      r['symbol'],
-                'state_id':    r['current_state'],
-                'state_name':  STATE_NAMES.get(r['current_state'], 'UNKNOWN'),
-                'last_update': r['last_update'].isoformat() if r['last_update'] else None,
-            }
-            for r in (rows or [])
-        ]
-        return jsonify({'success': True, 'states': states, 'count': len(states)})
+        return conditional_json(*_amd_snapshot('state', current_user.id, _amd_states, current_user.id))
     except Exception as e:
-        logger.error(f"[AMD_FOREX] state endpoint error: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("[AMD_FOREX] state endpoint error: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
 
 @app.route('/api/forex-amd/recent-events')
@@ -3831,83 +2919,206 @@ def forex_amd_state_snapshot():
 def forex_amd_recent_events():
     """Last 20 AMD alerts/triggers for the logged-in user (read-only history)."""
     try:
-        rows = db.execute("""
-            SELECT symbol, direction, session, setup_quality,
-                   sweep_level, ifvg_high, ifvg_low, detected_at
-            FROM forex_amd_alerts
-            WHERE user_id = %s
-            ORDER BY detected_at DESC
-            LIMIT 20
-        """, (current_user.id,), fetchall=True)
-        events = [dict(r) for r in (rows or [])]
-        for ev in events:
-            if ev.get('detected_at'):
-                ev['detected_at'] = ev['detected_at'].isoformat()
-        return jsonify({'success': True, 'events': events})
+        return conditional_json(*_amd_snapshot('recent-events', current_user.id,
+                                               _amd_recent_events, current_user.id))
     except Exception as e:
-        logger.error(f"[AMD_FOREX] recent-events endpoint error: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error("[AMD_FOREX] recent-events endpoint error: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
+
+
+@app.route('/api/forex-amd/dashboard-stream')
+@login_required
+def forex_amd_dashboard_stream():
+    """Server-Sent Events for the debug dashboard: a {health, states, events}
+    snapshot on connect and after every scan run."""
+    user_id = current_user.id
+
+    def part(name, owner, build, *args):
+        # Each section fails on its own, as the separate endpoints do
+        try:
+            return _amd_snapshot(name, owner, build, *args)[0]
+        except Exception as e:
+            logger.error("[AMD_FOREX] dashboard %s error: %s", name, e)
+            return json_bytes({'success': False, 'error': str(e)})
+
+    def snapshot_event():
+        # Splice the cached section bodies together rather than re-encoding
+        return (b'event: snapshot\ndata: {"health":' + part('health', None, _amd_health)
+                + b',"states":' + part('state', user_id, _amd_states, user_id)
+                + b',"events":' + part('recent-events', user_id, _amd_recent_events, user_id)
+                + b'}\n\n')
+
+    return sse_response(_user_event_stream(user_id, ('amd_scan',), snapshot_event))
 
 
 # ---------------------------------------------------------------------------
-# In-memory candle cache: cache_key -> (monotonic_timestamp, data_list)
+# In-memory candle cache: cache_key -> (monotonic_timestamp, json_body, etag)
+# The body is serialized once per refresh, so cache hits (the common case for
+# the largest response the app sends) do no encoding work at all.
 # ---------------------------------------------------------------------------
 _candle_cache: dict = {}
 _CANDLE_CACHE_TTL = 60  # seconds – refresh at most once per minute per symbol+tf
+_CANDLE_CACHE_MAX = 512  # entries; bounds memory however many symbols get charted
+_candle_lock = threading.Lock()
 
 
-@app.route('/api/forex-amd/candles')
-@login_required
-def forex_amd_candles():
-    """OHLC candles for LightweightCharts.
-    GET /api/forex-amd/candles?symbol=EURUSD&interval=15min&limit=200
-    Returns [{time, open, high, low, close}, …] sorted ascending by time.
-    """
-    from services.forex_data_provider import forex_data_provider
+def _cached_candles(cache_key, now_mono):
+    """Fresh (timestamp, body, etag) entry for cache_key, or None."""
+    with _candle_lock:
+        cached = _candle_cache.get(cache_key)
+    if cached and (now_mono - cached[0]) < _CANDLE_CACHE_TTL:
+        return cached
+    return None
+
+
+def _remember_candles(cache_key, entry):
+    with _candle_lock:
+        if len(_candle_cache) >= _CANDLE_CACHE_MAX:
+            # Expired entries first, then the oldest insert
+            for key in [k for k, v in _candle_cache.items() if entry[0] - v[0] >= _CANDLE_CACHE_TTL]:
+                del _candle_cache[key]
+            if len(_candle_cache) >= _CANDLE_CACHE_MAX:
+                del _candle_cache[next(iter(_candle_cache))]
+        _candle_cache.pop(cache_key, None)  # re-insert at the young end
+        _candle_cache[cache_key] = entry
+
+
+_CANDLE_INTERVALS = {
+    '5m': '5m', '5min': '5m',
+    '15m': '15m', '15min': '15m',
+    '1h': '1h', '1hour': '1h',
+}
 
+
+def _candle_request_args():
+    """(symbol, timeframe, limit) from the query string of the chart endpoints."""
     symbol = request.args.get('symbol', '').strip().upper()
     interval = request.args.get('interval', '15min').strip().lower()
     try:
         limit = min(int(request.args.get('limit', 200)), 500)
     except ValueError:
         limit = 200
+    return symbol, _CANDLE_INTERVALS.get(interval, '15m'), limit
 
-    if not symbol:
-        return jsonify({'error': 'symbol required'}), 400
 
-    _IV = {
-        '5m': '5m', '5min': '5m',
-        '15m': '15m', '15min': '15m',
-        '1h': '1h', '1hour': '1h',
-    }
-    tf = _IV.get(interval, '15m')
+def _candles_entry(symbol, tf, limit):
+    """Cached (timestamp, body, etag) for symbol/tf, fetching it on a miss.
 
+    None when the provider has no candles for the symbol.
+    """
     cache_key = f"{symbol}:{tf}"
     now_mono = time.monotonic()
-    cached = _candle_cache.get(cache_key)
-    if cached and (now_mono - cached[0]) < _CANDLE_CACHE_TTL:
-        return jsonify(cached[1])
+    cached = _cached_candles(cache_key, now_mono)
+    if cached:
+        return cached
 
     candles = forex_data_provider.get_recent_candles(symbol, timeframe=tf, count=limit)
     if not candles:
-        return jsonify({'error': f'No candle data available for {symbol}'}), 404
-
-    result = sorted(
-        [
-            {
-                'time':  int(c['timestamp'].timestamp()),
-                'open':  c['open'],
-                'high':  c['high'],
-                'low':   c['low'],
-                'close': c['close'],
-            }
-            for c in candles
-        ],
-        key=lambda x: x['time'],
+        return None
+
+    # The provider requests order=ASC, so candles are already oldest first
+    result = [
+        {
+            'time':  int(c['timestamp'].timestamp()),
+            'open':  c['open'],
+            'high':  c['high'],
+            'low':   c['low'],
+            'close': c['close'],
+        }
+        for c in candles
+    ]
+
+    body = json_bytes(result)
+    entry = (now_mono, body, body_etag(body))
+    _remember_candles(cache_key, entry)
+    return entry
+
+
+@app.route('/api/forex-amd/candles')
+@login_required
+def forex_amd_candles():
+    """OHLC candles for LightweightCharts.
+    GET /api/forex-amd/candles?symbol=EURUSD&interval=15min&limit=200
+    Returns [{time, open, high, low, close}, …] sorted ascending by time.
+    """
+    symbol, tf, limit = _candle_request_args()
+    if not symbol:
+        return fastjson({'error': 'symbol required'}, 400)
+
+    entry = _candles_entry(symbol, tf, limit)
+    if entry is None:
+        return fastjson({'error': f'No candle data available for {symbol}'}, 404)
+
+    # The server won't refresh this entry before it expires, so the
+    # browser can reuse its copy until then without asking.
+    return conditional_json(entry[1], entry[2],
+                            max_age=int(_CANDLE_CACHE_TTL - (time.monotonic() - entry[0])))
+
+
+def _amd_overlay(user_id, symbol):
+    """Accumulation box, sweep level, IFVG zone and trigger marker for the chart."""
+    # One round-trip: the state row and the latest alert are each
+    # optional, so both hang off a single-row anchor via LEFT JOINs.
+    row = db.execute_prepared(
+        'amd_overlay_get',
+        """SELECT s.user_id IS NOT NULL AS has_state,
+                  s.current_state, s.accumulation_data, s.sweep_data, s.last_update,
+                  a.user_id IS NOT NULL AS has_alert,
+                  a.sweep_level, a.sweep_time, a.ifvg_high, a.ifvg_low, a.ifvg_time,
+                  a.direction, a.detected_at
+           FROM (SELECT $1::integer AS user_id, $2::text AS symbol) k
+           LEFT JOIN forex_amd_state s
+                  ON s.user_id = k.user_id AND s.symbol = k.symbol
+           LEFT JOIN LATERAL (
+               SELECT user_id, sweep_level, sweep_time, ifvg_high, ifvg_low,
+                      ifvg_time, direction, detected_at
+               FROM forex_amd_alerts
+               WHERE user_id = k.user_id AND symbol = k.symbol
+               ORDER BY detected_at DESC LIMIT 1
+           ) a ON TRUE""",
+        (user_id, symbol), fetchone=True,
     )
+    state_row = row if row and row['has_state'] else None
+    alert_row = row if row and row['has_alert'] else None
+
+    overlay = {'state': None, 'accumulation': None, 'sweep': None,
+               'ifvg': None, 'trigger': None}
+
+    if state_row:
+        overlay['state'] = STATE_NAMES.get(state_row['current_state'], 'UNKNOWN')
+
+        # TEXT columns holding the detector's JSON, so always str here
+        if state_row['accumulation_data']:
+            accum = orjson.loads(state_row['accumulation_data'])
+            overlay['accumulation'] = {
+                'high': accum.get('high'),
+                'low':  accum.get('low'),
+            }
+
+        if state_row['sweep_data']:
+            sweep = orjson.loads(state_row['sweep_data'])
+            overlay['sweep'] = {
+                'level':     sweep.get('level'),
+                'direction': sweep.get('direction'),
+            }
+
+    if alert_row:
+        overlay['ifvg'] = {
+            'high': None if alert_row.get('ifvg_high') is None else float(alert_row['ifvg_high']),
+            'low':  None if alert_row.get('ifvg_low') is None else float(alert_row['ifvg_low']),
+            'time': alert_row.get('ifvg_time'),
+        }
+        overlay['trigger'] = {
+            'time':      alert_row.get('detected_at'),
+            'direction': alert_row.get('direction'),
+        }
+        if alert_row.get('sweep_level') is not None and not overlay['sweep']:
+            overlay['sweep'] = {
+                'level':     float(alert_row['sweep_level']),
+                'direction': alert_row.get('direction'),
+            }
 
-    _candle_cache[cache_key] = (now_mono, result)
-    return jsonify(result)
+    return overlay
 
 
 @app.route('/api/forex-amd/overlay')
@@ -3919,78 +3130,48 @@ def forex_amd_overlay():
     """
     symbol = request.args.get('symbol', '').strip().upper()
     if not symbol:
-        return jsonify({'error': 'symbol required'}), 400
+        return fastjson({'error': 'symbol required'}, 400)
 
     try:
-        state_row = db.execute(
-            """SELECT current_state, accumulation_data, sweep_data, last_update
-               FROM forex_amd_state
-               WHERE user_id = %s AND symbol = %s""",
-            (current_user.id, symbol), fetchone=True,
-        )
-        alert_row = db.execute(
-            """SELECT sweep_level, sweep_time, ifvg_high, ifvg_low, ifvg_time,
-                      direction, detected_at
-               FROM forex_amd_alerts
-               WHERE user_id = %s AND symbol = %s
-               ORDER BY detected_at DESC LIMIT 1""",
-            (current_user.id, symbol), fetchone=True,
-        )
-
-        STATE_NAMES = {
-            0: 'IDLE', 1: 'ACCUMULATION', 2: 'SWEEP_DETECTED',
-            3: 'DISPLACEMENT_CONFIRMED', 4: 'WAIT_IFVG',
-        }
-
-        overlay = {'state': None, 'accumulation': None, 'sweep': None,
-                   'ifvg': None, 'trigger': None}
-
-        if state_row:
-            overlay['state'] = STATE_NAMES.get(state_row['current_state'], 'UNKNOWN')
+        overlay = _amd_overlay(current_user.id, symbol)
+        body = json_bytes({'success': True, 'symbol': symbol, 'overlay': overlay})
+        return conditional_json(body, body_etag(body))
+    except Exception as e:
+        logger.error("[AMD_FOREX] overlay endpoint error: %s", e)
+        return fastjson({'success': False, 'error': str(e)}, 500)
 
-            if state_row['accumulation_data']:
-                raw = state_row['accumulation_data']
-                accum = json.loads(raw) if isinstance(raw, str) else raw
-                overlay['accumulation'] = {
-                    'high': accum.get('high'),
-                    'low':  accum.get('low'),
-                }
 
-            if state_row['sweep_data']:
-                raw = state_row['sweep_data']
-                sweep = json.loads(raw) if isinstance(raw, str) else raw
-                overlay['sweep'] = {
-                    'level':     sweep.get('level'),
-                    'direction': sweep.get('direction'),
-                }
+@app.route('/api/forex-amd/chart')
+@login_required
+def forex_amd_chart():
+    """Candles and overlay for one chart in a single round-trip.
+    GET /api/forex-amd/chart?symbol=EURUSD&interval=15min&limit=200
+    Returns {success, symbol, candles, overlay} with the same shapes as
+    /candles and /overlay; overlay is null if it could not be loaded.
+    """
+    symbol, tf, limit = _candle_request_args()
+    if not symbol:
+        return fastjson({'error': 'symbol required'}, 400)
 
-        if alert_row:
-            overlay['ifvg'] = {
-                'high': float(alert_row['ifvg_high']) if alert_row.get('ifvg_high') else None,
-                'low':  float(alert_row['ifvg_low'])  if alert_row.get('ifvg_low')  else None,
-                'time': alert_row['ifvg_time'].isoformat() if alert_row.get('ifvg_time') else None,
-            }
-            overlay['trigger'] = {
-                'time':      alert_row['detected_at'].isoformat() if alert_row.get('detected_at') else None,
-                'direction': alert_row.get('direction'),
-            }
-            if alert_row.get('sweep_level') and not overlay['sweep']:
-                overlay['sweep'] = {
-                    'level':     float(alert_row['sweep_level']),
-                    'direction': alert_row.get('direction'),
-                }
+    entry = _candles_entry(symbol, tf, limit)
+    if entry is None:
+        return fastjson({'error': f'No candle data available for {symbol}'}, 404)
 
-        return jsonify({'success': True, 'symbol': symbol, 'overlay': overlay})
+    try:
+        overlay = _amd_overlay(current_user.id, symbol)
     except Exception as e:
-        logger.error(f"[AMD_FOREX] overlay endpoint error: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        # The chart is still useful without its overlay
+        logger.error("[AMD_FOREX] chart overlay error: %s", e)
+        overlay = None
 
+    # Splice in the cached candle bytes instead of decoding and re-encoding them
+    body = (b'{"success":true,"symbol":' + json_bytes(symbol)
+            + b',"candles":' + entry[1]
+            + b',"overlay":' + json_bytes(overlay) + b'}')
+    return conditional_json(body, body_etag(body))
 
-@app.route('/forex-amd/debug')
-@login_required
-def forex_amd_debug_page():
-    """Read-only AMD debug/monitoring page."""
-    html = """<!DOCTYPE html>
+
+_FOREX_AMD_DEBUG_PAGE = StaticPage("""<!DOCTYPE html>
 <html>
 <head>
   <title>AMD Debug</title>
@@ -4069,69 +3250,89 @@ const STATE_COLOR = {
   WAIT_IFVG: '#FF6B6B'
 };
 
-async function load() {
-  try {
-    const h = await fetch('/api/forex-amd/health').then(r => r.json());
-    const badge = document.getElementById('health-badge');
-    badge.innerHTML = h.healthy
-      ? '<span class="badge badge-ok">HEALTHY</span>'
-      : '<span class="badge badge-err">UNHEALTHY</span>';
-    document.getElementById('health-data').textContent = JSON.stringify({
-      healthy:            h.healthy,
-      age_minutes:        h.age_minutes,
-      threshold_minutes:  h.threshold_minutes,
-      last_run_at:        h.last_run_at,
-      last_ok_at:         h.last_ok_at,
-      last_error_at:      h.last_error_at,
-      last_error_msg:     h.last_error_msg,
-      last_symbols_count: h.last_symbols_count
-    }, null, 2);
-  } catch(e) {
-    document.getElementById('health-data').textContent = 'Error: ' + e;
+function renderHealth(h) {
+  if (!h.success) {
+    document.getElementById('health-data').textContent = 'Error: ' + h.error;
+    return;
   }
+  const badge = document.getElementById('health-badge');
+  badge.innerHTML = h.healthy
+    ? '<span class="badge badge-ok">HEALTHY</span>'
+    : '<span class="badge badge-err">UNHEALTHY</span>';
+  document.getElementById('health-data').textContent = JSON.stringify({
+    healthy:            h.healthy,
+    age_minutes:        h.age_minutes,
+    threshold_minutes:  h.threshold_minutes,
+    last_run_at:        h.last_run_at,
+    last_ok_at:         h.last_ok_at,
+    last_error_at:      h.last_error_at,
+    last_error_msg:     h.last_error_msg,
+    last_symbols_count: h.last_symbols_count
+  }, null, 2);
+}
 
-  try {
-    const s = await fetch('/api/forex-amd/state').then(r => r.json());
-    document.getElementById('state-rows').innerHTML =
-      (s.states && s.states.length)
-        ? s.states.map(r =>
-            '<tr><td>' + r.symbol + '</td>' +
-            '<td style="color:' + (STATE_COLOR[r.state_name] || '#ccc') + '">' + r.state_name + '</td>' +
-            '<td>' + (r.last_update || '-') + '</td></tr>'
-          ).join('')
-        : '<tr><td colspan="3" style="color:#555">No symbols in watchlist</td></tr>';
-  } catch(e) {
-    document.getElementById('state-rows').innerHTML =
-      '<tr><td colspan="3" class="err">Error: ' + e + '</td></tr>';
-  }
+function renderStates(s) {
+  document.getElementById('state-rows').innerHTML = !s.success
+    ? '<tr><td colspan="3" class="err">Error: ' + s.error + '</td></tr>'
+    : (s.states && s.states.length)
+      ? s.states.map(r =>
+          '<tr><td>' + r.symbol + '</td>' +
+          '<td style="color:' + (STATE_COLOR[r.state_name] || '#ccc') + '">' + r.state_name + '</td>' +
+          '<td>' + (r.last_update || '-') + '</td></tr>'
+        ).join('')
+      : '<tr><td colspan="3" style="color:#555">No symbols in watchlist</td></tr>';
+}
 
-  try {
-    const ev = await fetch('/api/forex-amd/recent-events').then(r => r.json());
-    document.getElementById('event-rows').innerHTML =
-      (ev.events && ev.events.length)
-        ? ev.events.map(e =>
-            '<tr><td>' + e.symbol + '</td>' +
-            '<td class="' + (e.direction === 'bullish' ? 'ok' : 'err') + '">' + e.direction + '</td>' +
-            '<td>' + e.setup_quality + '/10</td>' +
-            '<td>' + e.session + '</td>' +
-            '<td>' + e.detected_at + '</td></tr>'
-          ).join('')
-        : '<tr><td colspan="5" style="color:#555">No triggers yet</td></tr>';
-  } catch(e) {
-    document.getElementById('event-rows').innerHTML =
-      '<tr><td colspan="5" class="err">Error: ' + e + '</td></tr>';
-  }
+function renderEvents(ev) {
+  document.getElementById('event-rows').innerHTML = !ev.success
+    ? '<tr><td colspan="5" class="err">Error: ' + ev.error + '</td></tr>'
+    : (ev.events && ev.events.length)
+      ? ev.events.map(e =>
+          '<tr><td>' + e.symbol + '</td>' +
+          '<td class="' + (e.direction === 'bullish' ? 'ok' : 'err') + '">' + e.direction + '</td>' +
+          '<td>' + e.setup_quality + '/10</td>' +
+          '<td>' + e.session + '</td>' +
+          '<td>' + e.detected_at + '</td></tr>'
+        ).join('')
+      : '<tr><td colspan="5" style="color:#555">No triggers yet</td></tr>';
+}
 
+function render(snap, note) {
+  renderHealth(snap.health);
+  renderStates(snap.states);
+  renderEvents(snap.events);
   document.getElementById('last-refresh').textContent =
-    'Auto-refreshes every 30s — Last: ' + new Date().toLocaleTimeString();
+    note + ' — Last: ' + new Date().toLocaleTimeString();
+}
+
+const failed = e => ({success: false, error: e});
+
+async function load() {
+  const get = url => fetch(url).then(r => r.json()).catch(failed);
+  const [health, states, events] = await Promise.all([
+    get('/api/forex-amd/health'), get('/api/forex-amd/state'), get('/api/forex-amd/recent-events'),
+  ]);
+  render({health, states, events}, 'Auto-refreshes every 30s');
 }
 
-load();
-setInterval(load, 30000);
+if (window.EventSource) {
+  // Pushed on connect and after each scan run
+  const stream = new EventSource('/api/forex-amd/dashboard-stream');
+  stream.addEventListener('snapshot', e => render(JSON.parse(e.data), 'Live'));
+} else {
+  load();
+  setInterval(load, 30000);
+}
 </script>
 </body>
-</html>"""
-    return html
+</html>""")
+
+
+@app.route('/forex-amd/debug')
+@login_required
+def forex_amd_debug_page():
+    """Read-only AMD debug/monitoring page."""
+    return _FOREX_AMD_DEBUG_PAGE.response(max_age=300)
 
 
 # Gunicorn will run the app, this is only for local testing
@@ -2,9 +2,20 @@ import requests
 from datetime import datetime
 import logging
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive session for the whole scan: a scan makes up to ~150 calls to
+# the same host, so reusing connections saves a TLS handshake on each.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+))
+
 class BitcoinScanner:
     """
     Scan Bitcoin blockchain for large transactions
@@ -27,12 +38,13 @@ class BitcoinScanner:
         """
         try:
             transactions = []
+            btc_price = None  # fetched once, on the first matching transaction
             min_satoshis = int(min_btc_amount * 100000000)
             cutoff_timestamp = int(time.time()) - (time_range_hours * 3600)
             
             # Get recent blocks
             url = f"{BitcoinScanner.BASE_URL}/blocks/tip/height"
-            response = requests.get(url, timeout=10)
+            response = _SESSION.get(url, timeout=(3, 10))
             latest_height = int(response.text)
             
             logger.info(f"Scanning from block {latest_height}, looking back {time_range_hours} hours")
@@ -46,11 +58,11 @@ class BitcoinScanner:
                 try:
                     # Get block hash
                     block_hash_url = f"{BitcoinScanner.BASE_URL}/block-height/{block_height}"
-                    block_hash = requests.get(block_hash_url, timeout=10).text.strip()
+                    block_hash = _SESSION.get(block_hash_url, timeout=(3, 10)).text.strip()
                     
                     # Get block data
                     block_url = f"{BitcoinScanner.BASE_URL}/block/{block_hash}"
-                    block_data = requests.get(block_url, timeout=10).json()
+                    block_data = _SESSION.get(block_url, timeout=(3, 10)).json()
                     block_timestamp = block_data.get('timestamp', 0)
                     
                     # Stop if block is older than time range
@@ -62,7 +74,7 @@ class BitcoinScanner:
                     tx_ids = block_data.get('tx_count', 0)
                     if tx_ids > 0:
                         txs_url = f"{BitcoinScanner.BASE_URL}/block/{block_hash}/txs/0"
-                        txs_data = requests.get(txs_url, timeout=15).json()
+                        txs_data = _SESSION.get(txs_url, timeout=(3, 15)).json()
                         
                         for tx in txs_data[:25]:  # Limit to 25 per block
                             try:
@@ -70,6 +82,9 @@ class BitcoinScanner:
                                 total_out = sum(out.get('value', 0) for out in tx.get('vout', []))
                                 
                                 if total_out >= min_satoshis:
+                                    if btc_price is None:
+                                        btc_price = get_btc_price()
+
                                     # Get addresses
                                     inputs = []
                                     for vin in tx.get('vin', [])[:3]:
@@ -85,7 +100,7 @@ class BitcoinScanner:
                                         'hash': tx.get('txid'),
                                         'time': datetime.fromtimestamp(block_timestamp).isoformat(),
                                         'amount_btc': total_out / 100000000,
-                                        'amount_usd': (total_out / 100000000) * get_btc_price(),
+                                        'amount_usd': (total_out / 100000000) * btc_price,
                                         'from_addresses': inputs,
                                         'to_addresses': outputs,
                                         'num_inputs': len(tx.get('vin', [])),
@@ -116,7 +131,7 @@ def get_btc_price():
         url = "https://blockstream.info/api/blocks/tip/height"
         # Use CoinGecko for price
         price_url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd"
-        response = requests.get(price_url, timeout=10)
+        response = _SESSION.get(price_url, timeout=(3, 10))
         data = response.json()
         return data['bitcoin']['usd']
     except:
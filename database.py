@@ -1,11 +1,26 @@
 import os
+import threading
+import weakref
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Under the gunicorn gevent worker the stdlib is already monkey-patched when
+# the app is imported; make psycopg2 wait on the gevent hub too, so a slow
+# query yields to other requests instead of blocking the whole worker.
+try:
+    from gevent import monkey as _gevent_monkey
+    if _gevent_monkey.is_module_patched('socket'):
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+        logger.info("psycopg2 patched for gevent")
+except ImportError:
+    pass
+
 class Database:
     def __init__(self):
         self.database_url = os.getenv('DATABASE_URL')
@@ -15,19 +30,51 @@ class Database:
         # Railway uses postgres:// but psycopg2 needs postgresql://
         if self.database_url.startswith('postgres://'):
             self.database_url = self.database_url.replace('postgres://', 'postgresql://', 1)
+        
+        # Connections are reused across requests instead of paying a TCP/TLS
+        # handshake and auth per query. The pool is created on first use so
+        # importing this module never touches the network.
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', '10'))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # ThreadedConnectionPool raises instead of waiting when it is empty;
+        # the semaphore makes callers (threads or gevent greenlets) queue up.
+        self._pool_slots = threading.BoundedSemaphore(self.pool_size)
+        # Names of the statements PREPAREd on each pooled connection; entries
+        # vanish with the connection when the pool closes it.
+        self._prepared = weakref.WeakKeyDictionary()
+    
+    def _get_pool(self):
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(1, self.pool_size, self.database_url)
+        return self._pool
     
     @contextmanager
     def get_connection(self):
-        conn = psycopg2.connect(self.database_url)
+        self._pool_slots.acquire()
+        discard = False
         try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
+            pool = self._get_pool()
+            conn = pool.getconn()
+            if conn.closed:  # dropped by the server while idle
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                # A dead connection can't be rolled back or reused
+                discard = conn.closed or isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError))
+                if not discard:
+                    conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                pool.putconn(conn, close=discard or bool(conn.closed))
         finally:
-            conn.close()
+            self._pool_slots.release()
     
     def execute(self, query, params=None, fetchone=False, fetchall=False):
         """Execute query and return results"""
@@ -42,6 +89,30 @@ class Database:
                 elif query.strip().upper().startswith('INSERT') and 'RETURNING' in query.upper():
                     return cur.fetchone()
                 return None
+
+    def execute_prepared(self, name, query, params=(), fetchone=False, fetchall=False):
+        """Like execute(), for a fixed hot query run as a server-side prepared statement.
+
+        query uses $1, $2, ... placeholders. It is PREPAREd the first time a
+        pooled connection runs it, so later calls on that connection skip
+        Postgres' parse and plan steps and only send EXECUTE name(params).
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                prepared = self._prepared.setdefault(conn, set())
+                if name not in prepared:
+                    cur.execute(f"PREPARE {name} AS {query}")
+                    prepared.add(name)
+                if params:
+                    cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+                else:
+                    cur.execute(f"EXECUTE {name}")
+
+                if fetchone:
+                    return cur.fetchone()
+                elif fetchall:
+                    return cur.fetchall()
+                return None
     
     def run_migrations(self):
         """Run database migrations automatically"""
@@ -187,6 +258,10 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_forex_amd_state_user
                 ON forex_amd_state(user_id);
             """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_forex_amd_user_detected
+                ON forex_amd_alerts(user_id, detected_at DESC);
+            """,
         ]
         
         try:
@@ -0,0 +1,57 @@
+"""
+In-process publish/subscribe used to push server-side changes to browsers
+over Server-Sent Events.
+
+The scheduler runs inside the (single) web worker, so a per-process bus is
+enough: background jobs call publish(user_id, event) and every open SSE
+connection for that user holds a subscriber queue it blocks on.
+"""
+import logging
+import queue
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+
+class EventBus:
+    def __init__(self, max_queue=100):
+        self._max_queue = max_queue
+        self._subscribers = defaultdict(set)  # user_id -> {Queue, ...}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id) -> queue.Queue:
+        """Register a listener for user_id's events; pair with unsubscribe()."""
+        q = queue.Queue(maxsize=self._max_queue)
+        with self._lock:
+            self._subscribers[user_id].add(q)
+        return q
+
+    def unsubscribe(self, user_id, q):
+        with self._lock:
+            subs = self._subscribers.get(user_id)
+            if subs is not None:
+                subs.discard(q)
+                if not subs:
+                    del self._subscribers[user_id]
+
+    def publish(self, user_id, event, data=None):
+        """Queue (event, data) for every listener of user_id. Never blocks."""
+        with self._lock:
+            targets = list(self._subscribers.get(user_id, ()))
+        for q in targets:
+            try:
+                q.put_nowait((event, data))
+            except queue.Full:
+                # Stalled client; it resyncs from the next event it does read.
+                logger.debug("Event queue full for user %s, dropping %s", user_id, event)
+
+    def broadcast(self, event, data=None):
+        """publish() to every connected user, for changes that aren't per-user."""
+        with self._lock:
+            user_ids = list(self._subscribers)
+        for user_id in user_ids:
+            self.publish(user_id, event, data)
+
+
+event_bus = EventBus()
@@ -18,7 +18,7 @@ import json
 import logging
 
 from flask import (
-    Blueprint, jsonify, render_template, render_template_string,
+    Blueprint, jsonify, render_template,
     request, abort, current_app,
 )
 from flask_login import login_required
@@ -31,6 +31,7 @@ from services.report_generator import (
     get_cached_report_html,
 )
 from services.llm_client import get_llm_client, PRE_EARNINGS_PROMPT
+from static_page import StaticPage
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ fundamentals_bp = Blueprint("fundamentals", __name__)
 # Fundamentals landing page
 # =========================================================================== #
 
-_TAB_HTML = """
+_TAB_PAGE = StaticPage("""
 <!DOCTYPE html>
 <html lang="he" dir="rtl">
 <head>
@@ -254,14 +255,14 @@ async function logout() {
 </script>
 </body>
 </html>
-"""
+""")
 
 
 @fundamentals_bp.route("/fundamentals")
 @login_required
 def fundamentals_tab():
     """Landing page: ticker search → filing list → generate / view."""
-    return render_template_string(_TAB_HTML)
+    return _TAB_PAGE.response()
 
 
 # =========================================================================== #
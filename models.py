@@ -1,10 +1,21 @@
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from database import db
+import itertools
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Per-user trade change stamp, moved forward by every Trade write in this
+# process (see Trade.get_version). Values only need to differ, so one global
+# sequence serves all users. It starts from the boot time so versions (and the
+# ETags built from them) from an earlier process are never reused after a
+# restart.
+_TRADE_VERSIONS = {}
+_BOOT_VERSION = time.time_ns()
+_VERSION_SEQ = itertools.count(_BOOT_VERSION + 1)
+
 class User(UserMixin):
     def __init__(self, id, email):
         self.id = id
@@ -79,11 +90,18 @@ class Alert:
     
     @staticmethod
     def get_user_alerts(user_id):
-        """Get all alerts for specific user"""
+        """Get all alerts for specific user.
+
+        Price columns are cast to float8 in SQL so the driver hands back
+        native floats instead of Decimals that each need converting.
+        """
         return db.execute("""
-            SELECT id, ticker, target_price, current_price, direction,
-                   active, created_at, triggered_at, triggered_price,
-                   alert_type, ma_period, ma_value
+            SELECT id, ticker, target_price::float8 AS target_price,
+                   current_price::float8 AS current_price, direction,
+                   active, created_at, triggered_at,
+                   triggered_price::float8 AS triggered_price,
+                   COALESCE(alert_type, 'price') AS alert_type,
+                   ma_period, ma_value::float8 AS ma_value
             FROM alerts
             WHERE user_id = %s
             ORDER BY created_at DESC
@@ -170,6 +188,19 @@ class Portfolio:
         logger.info(f"Portfolio updated for user {user_id}: ${cash}")
 
 class Trade:
+    @staticmethod
+    def get_version(user_id):
+        """Stamp that changes whenever this user's trades are written.
+
+        Lets callers cache anything derived from the trades and drop it
+        the moment a trade is created, edited, closed, reopened or deleted.
+        """
+        return _TRADE_VERSIONS.get(user_id, _BOOT_VERSION)
+
+    @staticmethod
+    def _touch(user_id):
+        _TRADE_VERSIONS[user_id] = next(_VERSION_SEQ)
+
     @staticmethod
     def get_user_trades(user_id):
         """Get all trades for a user"""
@@ -182,6 +213,16 @@ class Trade:
             ORDER BY is_closed ASC, trade_date DESC, created_at DESC
         """, (user_id,), fetchall=True)
     
+    @staticmethod
+    def get_trade_ticker(trade_id, user_id):
+        """Ticker of one of the user's trades, or None if it isn't theirs"""
+        result = db.execute(
+            "SELECT ticker FROM trades WHERE id = %s AND user_id = %s",
+            (trade_id, user_id),
+            fetchone=True
+        )
+        return result['ticker'] if result else None
+    
     @staticmethod
     def get_open_trades(user_id):
         """Get only open trades for a user"""
@@ -218,6 +259,7 @@ class Trade:
               timeframe, trade_date, stop_loss, take_profit, notes),
         fetchone=True)
         
+        Trade._touch(user_id)
         logger.info(f"Trade created for user {user_id}: {ticker}")
         return result['id']
     
@@ -234,6 +276,7 @@ class Trade:
         """, (ticker, buy_price, quantity, position_size, risk_amount, timeframe, 
               trade_date, stop_loss, take_profit, notes, trade_id, user_id))
         
+        Trade._touch(user_id)
         logger.info(f"Trade {trade_id} updated by user {user_id}")
     
     @staticmethod
@@ -245,6 +288,7 @@ class Trade:
             WHERE id = %s AND user_id = %s
         """, (close_price, close_date, trade_id, user_id))
         
+        Trade._touch(user_id)
         logger.info(f"Trade {trade_id} closed by user {user_id} at ${close_price}")
     
     @staticmethod
@@ -256,6 +300,7 @@ class Trade:
             WHERE id = %s AND user_id = %s
         """, (trade_id, user_id))
         
+        Trade._touch(user_id)
         logger.info(f"Trade {trade_id} reopened by user {user_id}")
     
     @staticmethod
@@ -265,6 +310,7 @@ class Trade:
             "DELETE FROM trades WHERE id = %s AND user_id = %s",
             (trade_id, user_id)
         )
+        Trade._touch(user_id)
         logger.info(f"Trade {trade_id} deleted by user {user_id}")
     
     @staticmethod
@@ -348,23 +394,50 @@ class AlertTrigger:
             SELECT * FROM alert_triggers
             WHERE user_id = %s ORDER BY triggered_at DESC LIMIT %s
         """, (user_id, limit), fetchall=True)
+    
+    @staticmethod
+    def get_history_stamp(user_id):
+        """(latest triggered_at, row count) for the user's triggers.
+
+        Triggers are insert-only, so this changes exactly when the history
+        does and can validate a cached copy without reading the rows.
+        """
+        row = db.execute("""
+            SELECT MAX(triggered_at) AS latest, COUNT(*) AS n
+            FROM alert_triggers WHERE user_id = %s
+        """, (user_id,), fetchone=True)
+        return row['latest'], row['n']
 
 
 class Anomaly:
     @staticmethod
     def get_user_anomalies(user_id, limit=50, ticker=None, anomaly_type=None):
-        query = "SELECT * FROM market_anomalies WHERE user_id = %s"
+        clauses = ["user_id = %s"]
         params = [user_id]
         if ticker:
-            query += " AND ticker = %s"
+            clauses.append("ticker = %s")
             params.append(ticker)
         if anomaly_type:
-            query += " AND anomaly_type = %s"
+            clauses.append("anomaly_type = %s")
             params.append(anomaly_type)
-        query += " ORDER BY detected_at DESC LIMIT %s"
         params.append(limit)
+        query = ("SELECT * FROM market_anomalies WHERE " + " AND ".join(clauses)
+                 + " ORDER BY detected_at DESC LIMIT %s")
         return db.execute(query, tuple(params), fetchall=True)
     
+    @staticmethod
+    def get_stamp(user_id):
+        """(latest detected_at, row count) for the user's anomalies.
+
+        Anomalies are only ever inserted (is_read isn't part of the radar
+        payload), so this is a cheap validator for get_user_anomalies().
+        """
+        row = db.execute("""
+            SELECT MAX(detected_at) AS latest, COUNT(*) AS n
+            FROM market_anomalies WHERE user_id = %s
+        """, (user_id,), fetchone=True)
+        return row['latest'], row['n']
+    
     @staticmethod
     def mark_read(anomaly_id, user_id):
         db.execute("UPDATE market_anomalies SET is_read = TRUE WHERE id = %s AND user_id = %s", 
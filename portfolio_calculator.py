@@ -1,8 +1,27 @@
 import logging
+from html import escape
 from price_checker import price_checker
 
 logger = logging.getLogger(__name__)
 
+# Trade columns that come back from Postgres as Decimal / date and are sent
+# to the browser as JSON numbers / ISO strings.
+_NUMERIC_FIELDS = ('buy_price', 'quantity', 'position_size', 'risk_amount',
+                   'stop_loss', 'take_profit', 'close_price')
+_DATE_FIELDS = ('trade_date', 'close_date', 'created_at')
+
+
+def _iso(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def _same(value):
+    return value
+
+
+# column -> JSON normalizer, so a row is converted in a single pass
+_NORMALIZERS = {**dict.fromkeys(_NUMERIC_FIELDS, float), **dict.fromkeys(_DATE_FIELDS, _iso)}
+
 class PortfolioCalculator:
     """Professional trading calculations and risk management"""
     
@@ -78,6 +97,19 @@ class PortfolioCalculator:
         
         return warnings
     
+    @staticmethod
+    def render_warnings_html(warnings):
+        """
+        Badge markup for the portfolio table's warnings cell.
+        Built here so it is computed once per enriched trade rather than on
+        every client-side render.
+        """
+        return ''.join(
+            f'<span class="warning-badge {escape(w["severity"])}">'
+            f'{escape(w["type"].replace("_", " "))}</span>'
+            for w in warnings
+        )
+    
     @staticmethod
     def calculate_unrealized_pnl(buy_price, current_price, quantity):
         """
@@ -121,8 +153,15 @@ class PortfolioCalculator:
     def enrich_trade_with_calculations(trade, portfolio_cash, current_price=None):
         """
         Add all calculated fields to a trade dictionary
+
+        The result is JSON-ready: money/quantity columns are floats and
+        dates are ISO strings, so clients can use them without parsing.
         """
-        enriched = dict(trade)
+        normalize = _NORMALIZERS.get
+        enriched = {
+            key: None if value is None else normalize(key, _same)(value)
+            for key, value in trade.items()
+        }
         
         # Risk percentage
         enriched['risk_pct'] = PortfolioCalculator.calculate_risk_percentage(
@@ -146,6 +185,7 @@ class PortfolioCalculator:
         enriched['warnings'] = PortfolioCalculator.is_high_risk(
             enriched['risk_pct'], enriched['rr_ratio']
         )
+        enriched['warnings_html'] = PortfolioCalculator.render_warnings_html(enriched['warnings'])
         
         # P&L calculation
         if trade.get('is_closed') and trade.get('close_price'):
@@ -174,9 +214,12 @@ class PortfolioCalculator:
         return enriched
     
     @staticmethod
-    def calculate_portfolio_summary(trades, portfolio_cash):
+    def calculate_portfolio_summary(trades, portfolio_cash, prices=None):
         """
         Calculate aggregate portfolio metrics
+
+        prices: optional {ticker: current_price} already fetched by the
+        caller; when omitted, prices are looked up here.
         """
         open_trades = [t for t in trades if not t.get('is_closed')]
         closed_trades = [t for t in trades if t.get('is_closed')]
@@ -186,10 +229,12 @@ class PortfolioCalculator:
         total_risk = sum(float(t['risk_amount']) for t in open_trades)
         
         # Fetch current prices and calculate unrealized P&L
+        if prices is None:
+            prices = price_checker.get_cached_prices(t['ticker'] for t in open_trades)
         total_unrealized_pnl = 0
         for trade in open_trades:
             try:
-                current_price = price_checker.get_price(trade['ticker'])
+                current_price = prices.get(trade['ticker'])
                 if current_price:
                     pnl = PortfolioCalculator.calculate_unrealized_pnl(
                         trade['buy_price'], current_price, trade['quantity']
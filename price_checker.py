@@ -1,8 +1,72 @@
 import requests
 import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Shared session: keeps TLS connections to Yahoo alive between calls instead of
+# a fresh handshake per price lookup. Only transient gateway errors are
+# retried; 429s are handled by the callers.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+))
+
+# Short-lived quote cache: ticker -> (price, expires_at). Every successful
+# fetch refreshes it, so request handlers calling get_cached_price() reuse
+# quotes the alert processor (or another user) fetched a moment ago.
+_PRICE_TTL = 15          # seconds
+_PRICE_CACHE_MAX = 4096
+_PRICE_CACHE: dict = {}
+_PRICE_LOCK = threading.Lock()
+
+# Moving averages are built from daily closes, so they barely move within a
+# few minutes: (ticker, period) -> (ma_value, expires_at). Shares _PRICE_LOCK.
+_MA_TTL = 300            # seconds
+_MA_CACHE: dict = {}
+
+
+def _store(cache, key, value, ttl):
+    now = time.monotonic()
+    with _PRICE_LOCK:
+        if len(cache) >= _PRICE_CACHE_MAX:
+            for k in [k for k, (_, exp) in cache.items() if exp <= now]:
+                del cache[k]
+            if len(cache) >= _PRICE_CACHE_MAX:
+                del cache[next(iter(cache))]
+        cache[key] = (value, now + ttl)
+
+
+def _lookup(cache, key):
+    """Unexpired cached value for key, or None."""
+    with _PRICE_LOCK:
+        entry = cache.get(key)
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+
+def _remember_price(ticker, price):
+    _store(_PRICE_CACHE, ticker, price, _PRICE_TTL)
+
+
+def _remember_ma(ticker, period, ma_value):
+    _store(_MA_CACHE, (ticker, period), ma_value, _MA_TTL)
+
+
+def invalidate_price_cache():
+    """Drop all cached quotes and moving averages (tests / manual refresh)."""
+    with _PRICE_LOCK:
+        _PRICE_CACHE.clear()
+        _MA_CACHE.clear()
+
 class PriceChecker:
     @staticmethod
     def get_price(ticker):
@@ -19,7 +83,7 @@ class PriceChecker:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = _SESSION.get(url, params=params, headers=headers, timeout=(3, 10))
             
             if response.status_code == 429:
                 logger.warning(f"Rate limited for {ticker}")
@@ -36,6 +100,7 @@ class PriceChecker:
             
             if price:
                 logger.info(f"Fetched {ticker}: ${price:.2f}")
+                _remember_price(ticker, float(price))
                 return float(price)
             
             logger.warning(f"No price data for {ticker}")
@@ -51,6 +116,136 @@ class PriceChecker:
             logger.error(f"Parse error for {ticker}: {e}")
             return None
 
+    @staticmethod
+    def get_cached_price(ticker):
+        """
+        Like get_price(), but reuses a quote fetched within the last
+        _PRICE_TTL seconds. Meant for request handlers; the alert processor
+        keeps calling get_price() so its checks always see a fresh quote.
+        """
+        price = _lookup(_PRICE_CACHE, ticker)
+        if price is not None:
+            return price
+        return PriceChecker.get_price(ticker)
+
+    @staticmethod
+    def get_cached_prices(tickers, max_workers=8):
+        """
+        get_cached_price() for several tickers at once.
+
+        Cached quotes are returned directly; the rest are fetched in
+        parallel (each is an independent HTTP round-trip), so a page with N
+        open positions waits about one request instead of N.
+
+        Returns: {ticker: price or None}
+        """
+        prices = {}
+        misses = []
+        now = time.monotonic()
+        with _PRICE_LOCK:
+            for ticker in set(tickers):
+                entry = _PRICE_CACHE.get(ticker)
+                if entry and entry[1] > now:
+                    prices[ticker] = entry[0]
+                else:
+                    misses.append(ticker)
+
+        def fetch(ticker):
+            try:
+                return PriceChecker.get_price(ticker)
+            except Exception as e:
+                logger.error(f"Error fetching {ticker}: {e}")
+                return None
+
+        if len(misses) == 1:
+            prices[misses[0]] = fetch(misses[0])
+        elif misses:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as pool:
+                prices.update(zip(misses, pool.map(fetch, misses)))
+        return prices
+
+    @staticmethod
+    def get_price_and_ma(ticker, period):
+        """
+        Fetch current price and Simple Moving Average with one chart request.
+
+        The chart response carries regularMarketPrice in its meta block next
+        to the daily closes, so MA alerts don't need a separate get_price()
+        round-trip.
+
+        Args:
+            ticker: Stock symbol
+            period: MA period (20, 50, 150)
+
+        Returns:
+            tuple: (price, ma_value) - either may be None if unavailable
+        """
+        try:
+            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+            params = {
+                'interval': '1d',
+                'range': '2y' if period >= 100 else '1y'
+            }
+
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+
+            response = _SESSION.get(url, params=params, headers=headers, timeout=(3, 15))
+
+            if response.status_code == 429:
+                logger.warning(f"Rate limited for {ticker}")
+                return None, None
+
+            response.raise_for_status()
+            result = response.json()['chart']['result'][0]
+
+            close_prices = result['indicators']['quote'][0]['close']
+            valid_prices = [p for p in close_prices if p is not None]
+
+            price = result.get('meta', {}).get('regularMarketPrice')
+            if price is None and valid_prices:
+                price = valid_prices[-1]
+
+            ma_value = None
+            if len(valid_prices) >= period:
+                ma_value = float(sum(valid_prices[-period:]) / period)
+                _remember_ma(ticker, period, ma_value)
+            else:
+                logger.warning(f"⚠️ Not enough data for MA{period} on {ticker} (got {len(valid_prices)} days, need {period})")
+
+            if price:
+                logger.info(f"Fetched {ticker}: ${price:.2f}" + (f", MA{period} ${ma_value:.2f}" if ma_value else ""))
+                _remember_price(ticker, float(price))
+                return float(price), ma_value
+
+            logger.warning(f"No price data for {ticker}")
+            return None, ma_value
+
+        except requests.exceptions.Timeout:
+            logger.error(f"Timeout fetching {ticker}")
+            return None, None
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching {ticker}: {e}")
+            return None, None
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.error(f"Parse error for {ticker}: {e}")
+            return None, None
+
+    @staticmethod
+    def get_cached_moving_average(ticker, period):
+        """
+        Like get_moving_average(), but reuses a value computed within the
+        last _MA_TTL seconds (including by get_price_and_ma()). For request
+        handlers; the alert processor keeps calling the uncached version.
+        """
+        ma_value = _lookup(_MA_CACHE, (ticker, period))
+        if ma_value is None:
+            ma_value = PriceChecker.get_moving_average(ticker, period)
+            if ma_value is not None:
+                _remember_ma(ticker, period, ma_value)
+        return ma_value
+
     @staticmethod
     def get_moving_average(ticker, period):
         """
@@ -66,9 +261,6 @@ class PriceChecker:
         """
         try:
             # Calculate timestamp range (we need period + buffer days)
-            import time
-            from datetime import datetime, timedelta
-            
             # Get data for last (period * 2) days to ensure we have enough
             days_to_fetch = period * 3
             end_time = int(time.time())
@@ -89,7 +281,7 @@ class PriceChecker:
             
             logger.info(f"Fetching {days_to_fetch} days of data for {ticker} to calculate MA{period}")
             
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            response = _SESSION.get(url, params=params, headers=headers, timeout=(3, 15))
             
             if response.status_code == 404:
                 logger.error(f"Ticker {ticker} not found (404)")
@@ -174,7 +366,7 @@ class PriceChecker:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = _SESSION.get(url, params=params, headers=headers, timeout=(3, 10))
 
             if response.status_code == 429:
                 logger.warning(f"Rate limited (fallback MA) for {ticker}")
@@ -0,0 +1,132 @@
+"""
+Request payload schemas for the JSON API.
+
+Each schema validates an already-decoded JSON body in a single from_json()
+call and raises ValueError with a user-facing message when it is invalid,
+so route handlers only deal with typed, normalized attributes.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+ALERT_TYPES = frozenset({'price', 'ma'})
+ALERT_DIRECTIONS = frozenset({'up', 'down', 'both'})
+MA_PERIODS = frozenset({20, 50, 150})
+
+
+def _as_float(value, error):
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        raise ValueError(error) from None
+
+
+def _positive_float(value, error):
+    # Required amounts: None, blank, non-numeric and non-positive all fail
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(error) from None
+    if not 0 < number < float('inf'):
+        raise ValueError(error)
+    return number
+
+
+@dataclass(frozen=True)
+class CreateAlertRequest:
+    """Body of POST /api/alerts."""
+    ticker: str
+    target_price: float = 0.0
+    alert_type: str = 'price'
+    ma_period: Optional[int] = None
+    direction: str = 'up'
+
+    @classmethod
+    def from_json(cls, data) -> 'CreateAlertRequest':
+        if not isinstance(data, dict):
+            raise ValueError('Invalid request body')
+
+        ticker = str(data.get('ticker') or '').strip().upper()
+        if not ticker:
+            raise ValueError('Ticker required')
+
+        alert_type = data.get('alert_type') or 'price'
+        if alert_type not in ALERT_TYPES:
+            raise ValueError('Invalid alert type')
+
+        ma_period = data.get('ma_period')
+        if alert_type == 'ma':
+            if ma_period not in MA_PERIODS:
+                raise ValueError('Invalid MA period')
+        else:
+            ma_period = None
+
+        direction = data.get('direction') or 'up'
+        if direction not in ALERT_DIRECTIONS:
+            raise ValueError('Invalid direction')
+
+        return cls(
+            ticker=ticker,
+            target_price=_as_float(data.get('target_price'), 'Invalid target price'),
+            alert_type=alert_type,
+            ma_period=ma_period,
+            direction=direction,
+        )
+
+
+def _optional_float(value, error):
+    # Blank / zero optional prices mean "not set", as the form sends them
+    return _as_float(value, error) if value else None
+
+
+@dataclass(frozen=True, slots=True)
+class TradeInput:
+    """Body of POST /api/trades and PUT /api/trades/<id>."""
+    ticker: str
+    buy_price: float
+    quantity: float
+    timeframe: str
+    trade_date: str
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+    notes: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, data) -> 'TradeInput':
+        if not isinstance(data, dict):
+            raise ValueError('Invalid request body')
+
+        missing = [k for k in ('ticker', 'buy_price', 'quantity', 'timeframe', 'trade_date')
+                   if k not in data]
+        if missing:
+            raise ValueError(f"Missing required field: '{missing[0]}'")
+
+        notes = data.get('notes')
+        return cls(
+            ticker=str(data['ticker']).upper(),
+            buy_price=_positive_float(data['buy_price'], 'Invalid buy price'),
+            quantity=_positive_float(data['quantity'], 'Invalid quantity'),
+            timeframe=data['timeframe'],
+            trade_date=data['trade_date'],
+            stop_loss=_optional_float(data.get('stop_loss'), 'Invalid stop loss'),
+            take_profit=_optional_float(data.get('take_profit'), 'Invalid take profit'),
+            notes=(notes.strip() or None) if notes else None,
+        )
+
+    @property
+    def position_size(self) -> float:
+        """buy_price * quantity"""
+        return self.buy_price * self.quantity
+
+    @property
+    def risk_amount(self) -> float:
+        """|buy_price - stop_loss| * quantity, or 2% of the position without a stop."""
+        if self.stop_loss is not None:
+            return abs(self.buy_price - self.stop_loss) * self.quantity
+        return self.position_size * 0.02
+
+    def as_trade_args(self) -> tuple:
+        """Positional args shared by Trade.create_trade and Trade.update_trade
+        (after their id parameters)."""
+        return (self.ticker, self.buy_price, self.quantity, self.position_size,
+                self.risk_amount, self.timeframe, self.trade_date,
+                self.stop_loss, self.take_profit, self.notes)
@@ -9,7 +9,10 @@ import time as _time
 from datetime import datetime, time, timedelta
 from typing import Dict, List, Optional, Tuple
 from database import db
+from services.forex_data_provider import forex_data_provider, normalize_symbol
+from event_bus import event_bus
 import json
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +81,15 @@ class AMDState:
     WAIT_IFVG = 4
 
 
+STATE_NAMES = {
+    AMDState.IDLE: "IDLE",
+    AMDState.ACCUMULATION: "ACCUMULATION",
+    AMDState.SWEEP_DETECTED: "SWEEP_DETECTED",
+    AMDState.DISPLACEMENT_CONFIRMED: "DISPLACEMENT_CONFIRMED",
+    AMDState.WAIT_IFVG: "WAIT_IFVG",
+}
+
+
 # ============================================
 # MAIN DETECTOR CLASS
 # ============================================
@@ -87,6 +99,9 @@ class ForexAMDDetector:
     
     def __init__(self):
         self.config = AMDConfig()
+        # Bumped by the scheduler after every scan run; readers use it to
+        # tell whether data derived from AMD state may have changed.
+        self.scans_completed = 0
     
     # ========================================
     # PUBLIC METHODS
@@ -104,8 +119,6 @@ class ForexAMDDetector:
             'states_advanced': int,
         }
         """
-        from services.forex_data_provider import forex_data_provider
-
         result: Dict = {
             'alerts': [],
             'symbols': 0,
@@ -123,8 +136,6 @@ class ForexAMDDetector:
         if not watchlist:
             return result
 
-        from services.forex_data_provider import normalize_symbol as _norm_sym
-
         result['symbols'] = len(watchlist)
 
         for row in watchlist:
@@ -132,7 +143,7 @@ class ForexAMDDetector:
             # Normalize to canonical form (e.g. XAUUSD → XAU/USD) so that
             # all DB state keys are consistent regardless of how the symbol
             # was stored when it was first added to the watchlist.
-            _norm, _err = _norm_sym(symbol_raw)
+            _norm, _err = normalize_symbol(symbol_raw)
             symbol = _norm if _norm else symbol_raw
             if symbol != symbol_raw:
                 logger.info(
@@ -918,9 +929,9 @@ class ForexAMDDetector:
         return {
             'current_state': result['current_state'],
             'data': {
-                'accumulation': json.loads(result['accumulation_data'] or '{}'),
-                'sweep': json.loads(result['sweep_data'] or '{}'),
-                'displacement': json.loads(result['displacement_data'] or '{}')
+                'accumulation': orjson.loads(result['accumulation_data'] or '{}'),
+                'sweep': orjson.loads(result['sweep_data'] or '{}'),
+                'displacement': orjson.loads(result['displacement_data'] or '{}')
             }
         }
     
@@ -1012,6 +1023,7 @@ class ForexAMDDetector:
             quality_score,
             int(quality_score)
         ))
+        event_bus.publish(user_id, 'amd_alerts')
         
         return {
             'symbol': symbol,
@@ -1058,16 +1070,6 @@ class ForexAMDDetector:
                 "error": null
             }
         """
-        from services.forex_data_provider import forex_data_provider
-
-        _STATE_NAMES = {
-            AMDState.IDLE: "IDLE",
-            AMDState.ACCUMULATION: "ACCUMULATION",
-            AMDState.SWEEP_DETECTED: "SWEEP_DETECTED",
-            AMDState.DISPLACEMENT_CONFIRMED: "DISPLACEMENT_CONFIRMED",
-            AMDState.WAIT_IFVG: "WAIT_IFVG",
-        }
-
         report: Dict = {
             "symbol": symbol,
             "user_id": user_id,
@@ -1093,7 +1095,7 @@ class ForexAMDDetector:
         state_data = self._load_state(user_id, symbol)
         current_state = state_data.get("current_state", AMDState.IDLE)
         report["current_state"] = current_state
-        report["current_state_name"] = _STATE_NAMES.get(current_state, str(current_state))
+        report["current_state_name"] = STATE_NAMES.get(current_state, str(current_state))
 
         # -- compute shared metrics ----------------------------------------
         atr = self._calculate_atr(candles[-self.config.ATR_PERIOD:])
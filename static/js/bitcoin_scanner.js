@@ -0,0 +1,86 @@
+// Loaded at the end of <body>, so the elements below already exist.
+const minAmountEl = document.getElementById('minAmount');
+const timeRangeEl = document.getElementById('timeRange');
+const resultsEl = document.getElementById('results');
+const scanBtn = document.getElementById('scanBtn');
+const statsEl = document.getElementById('stats');
+const txCountEl = document.getElementById('txCount');
+const totalBTCEl = document.getElementById('totalBTC');
+const totalUSDEl = document.getElementById('totalUSD');
+
+const TX_TABLE_HEAD = '<table class="tx-table"><thead><tr>'
+    + '<th>Transaction Hash</th><th>Time</th><th>Amount</th><th>From</th><th>To</th>'
+    + '</tr></thead><tbody>';
+const TX_TABLE_TAIL = '</tbody></table>';
+
+async function scanTransactions() {
+    const minAmount = parseFloat(minAmountEl.value);
+    const timeRange = timeRangeEl.value; // '24h' | '7d' | '30d' | '180d'
+
+    scanBtn.disabled = true;
+    scanBtn.textContent = 'Scanning...';
+    resultsEl.innerHTML = '<div class="loading">🔍 Scanning Bitcoin blockchain...</div>';
+
+    try {
+        const res = await fetch('/api/bitcoin/scan', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ min_amount: minAmount, timeframe: timeRange })
+        });
+
+        const data = await res.json();
+
+        if (data.success && data.transactions.length > 0) {
+            displayResults(data.transactions);
+        } else {
+            resultsEl.innerHTML = '<div class="empty">No transactions found matching your criteria.</div>';
+            statsEl.style.display = 'none';
+        }
+    } catch (error) {
+        resultsEl.innerHTML = '<div class="empty">Error scanning blockchain. Please try again.</div>';
+    } finally {
+        scanBtn.disabled = false;
+        scanBtn.textContent = 'Scan Blockchain';
+    }
+}
+
+function displayResults(transactions) {
+    // One pass: accumulate the stats and the row markup together
+    let totalBTC = 0;
+    let totalUSD = 0;
+    const out = [TX_TABLE_HEAD];
+
+    for (let i = 0; i < transactions.length; i++) {
+        const tx = transactions[i];
+        totalBTC += tx.amount_btc;
+        totalUSD += tx.amount_usd;
+
+        out.push(
+            '<tr><td><a href="https://blockchain.info/tx/', tx.hash, '" target="_blank" class="hash">',
+            tx.hash.substring(0, 16), '...</a></td><td>',
+            new Date(tx.time).toLocaleString(), '</td><td class="amount">',
+            tx.amount_btc.toFixed(4), ' BTC<br><span style="font-size:12px;color:#888;">$',
+            tx.amount_usd.toLocaleString(), '</span></td><td class="address">',
+            tx.from_addresses.slice(0, 2).join('<br>'),
+            tx.num_inputs > 2 ? '<br>+' + (tx.num_inputs - 2) + ' more' : '',
+            '</td><td class="address">',
+            tx.to_addresses.slice(0, 2).join('<br>'),
+            tx.num_outputs > 2 ? '<br>+' + (tx.num_outputs - 2) + ' more' : '',
+            '</td></tr>'
+        );
+    }
+    out.push(TX_TABLE_TAIL);
+
+    txCountEl.textContent = transactions.length;
+    totalBTCEl.textContent = totalBTC.toFixed(2) + ' BTC';
+    totalUSDEl.textContent = '$' + totalUSD.toLocaleString();
+    statsEl.style.display = 'grid';
+
+    // Single DOM write for the whole table
+    resultsEl.innerHTML = out.join('');
+}
+
+async function logout() {
+    await fetch('/api/logout');
+    window.location.href = '/login';
+}
@@ -0,0 +1,554 @@
+// Loaded at the end of <body>, so the elements below already exist.
+
+// Shared formatter: toLocaleString() builds a new Intl.NumberFormat per call
+const MONEY_FMT = new Intl.NumberFormat('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2});
+
+// Element refs, looked up once; the script runs after the markup is parsed
+const els = Object.fromEntries([
+    'tradeDate', 'closeDate', 'buyPrice', 'quantity', 'stopLoss', 'positionSizeDisplay',
+    'riskAmountDisplay', 'portfolioCash', 'portfolioValue', 'totalInvested', 'totalRisk',
+    'unrealizedPnl', 'realizedPnl', 'portfolioReturn', 'winRate', 'totalTrades', 'winsLosses',
+    'avgWin', 'avgLoss', 'expectancy', 'allTradesBody', 'openTradesBody', 'closedTradesBody',
+    'ticker', 'takeProfit', 'timeframe', 'notes', 'saveTradeBtn', 'formTitle', 'cancelBtn',
+    'closeModal', 'closePrice', 'message'
+].map(id => [id, document.getElementById(id)]));
+
+let portfolioCash = 0;
+let allTrades = [];
+let openTrades = [];    // allTrades partitioned once per load
+let closedTrades = [];
+let tradesById = new Map();  // id -> trade, rebuilt with allTrades
+let editingTradeId = null;
+let closingTradeId = null;
+let activeTab = 'all';  // hidden tabs stay empty until first shown
+let tradesVersion = 0;  // bumped whenever allTrades is replaced
+const renderedVersion = {};  // tab -> tradesVersion its tbody shows
+
+// Initialize
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('Page loaded, initializing...');
+    loadPortfolioData();
+    
+    // Set today's date as default
+    const today = new Date().toISOString().split('T')[0];
+    els.tradeDate.value = today;
+    els.closeDate.value = today;
+});
+
+// Recalculate on input, at most once per frame: fast typing or pasting
+// collapses into a single update showing the latest values.
+let calcPending = false;
+function calculateValues() {
+    if (calcPending) return;
+    calcPending = true;
+    requestAnimationFrame(() => {
+        calcPending = false;
+        updateCalculatedValues();
+    });
+}
+
+// Calculate position size and risk amount automatically
+function updateCalculatedValues() {
+    const buyPrice = parseFloat(els.buyPrice.value) || 0;
+    const quantity = parseFloat(els.quantity.value) || 0;
+    const stopLoss = parseFloat(els.stopLoss.value) || 0;
+    
+    // Position Size = buy_price * quantity
+    const positionSize = buyPrice * quantity;
+    els.positionSizeDisplay.textContent = 
+        '$' + MONEY_FMT.format(positionSize);
+    
+    // Risk Amount = |buy_price - stop_loss| * quantity
+    let riskAmount = 0;
+    if (stopLoss > 0) {
+        riskAmount = Math.abs(buyPrice - stopLoss) * quantity;
+    } else {
+        // Default 2% risk if no stop loss
+        riskAmount = positionSize * 0.02;
+    }
+    els.riskAmountDisplay.textContent = 
+        '$' + MONEY_FMT.format(riskAmount);
+}
+
+// Tab switching
+function switchTab(event, tab) {
+    // Update tab buttons
+    document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+    event.target.classList.add('active');
+    
+    // Update tab content
+    document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+    document.getElementById(tab + 'Tab').classList.add('active');
+    
+    // Render appropriate table
+    activeTab = tab;
+    renderTrades();
+}
+
+// Show portfolio cash
+function showPortfolio(cash) {
+    portfolioCash = cash;
+    els.portfolioCash.value = portfolioCash;
+    els.portfolioValue.textContent = 
+        '$' + MONEY_FMT.format(portfolioCash);
+}
+
+// Load cash, summary, statistics and trades in one request
+async function loadPortfolioData() {
+    try {
+        console.log('Loading portfolio...');
+        const res = await fetch('/api/portfolio/bootstrap');
+        const data = await res.json();
+        console.log('Portfolio response:', data);
+
+        if (data.success) {
+            showPortfolio(data.cash);
+            showSummary(data.summary, data.statistics);
+            showTrades(data.trades);
+        } else {
+            console.error('Failed to load portfolio:', data.error);
+            showMessage('Failed to load portfolio: ' + data.error, 'error');
+        }
+    } catch (error) {
+        console.error('Error loading portfolio:', error);
+        showMessage('Error loading portfolio: ' + error.message, 'error');
+    }
+}
+
+// Update portfolio cash
+async function updatePortfolioCash() {
+    const cash = parseFloat(els.portfolioCash.value);
+    
+    if (isNaN(cash) || cash < 0) {
+        showMessage('Please enter a valid amount', 'error');
+        return;
+    }
+
+    try {
+        const res = await fetch('/api/portfolio', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ cash })
+        });
+        
+        const data = await res.json();
+        if (data.success) {
+            portfolioCash = cash;
+            showMessage('Portfolio balance updated!', 'success');
+            await loadPortfolioData();
+        }
+    } catch (error) {
+        console.error('Error updating portfolio:', error);
+        showMessage('Failed to update portfolio balance', 'error');
+    }
+}
+
+// Show portfolio summary and statistics
+function showSummary(summary, stats) {
+    // Update summary
+    els.totalInvested.textContent = 
+        '$' + MONEY_FMT.format(summary.total_invested);
+    els.totalRisk.textContent = 
+        '$' + MONEY_FMT.format(summary.total_risk);
+    
+    const unrealizedEl = els.unrealizedPnl;
+    unrealizedEl.textContent = '$' + MONEY_FMT.format(summary.unrealized_pnl);
+    unrealizedEl.className = 'summary-value ' + (summary.unrealized_pnl >= 0 ? 'positive' : 'negative');
+    
+    const realizedEl = els.realizedPnl;
+    realizedEl.textContent = '$' + MONEY_FMT.format(summary.realized_pnl);
+    realizedEl.className = 'summary-value ' + (summary.realized_pnl >= 0 ? 'positive' : 'negative');
+    
+    const returnEl = els.portfolioReturn;
+    returnEl.textContent = summary.portfolio_return_pct.toFixed(2) + '%';
+    returnEl.className = 'summary-value ' + (summary.portfolio_return_pct >= 0 ? 'positive' : 'negative');
+    
+    // Update statistics
+    els.winRate.textContent = stats.win_rate.toFixed(1) + '%';
+    els.totalTrades.textContent = stats.total_trades;
+    els.winsLosses.textContent = stats.winning_trades + ' / ' + stats.losing_trades;
+    els.avgWin.textContent = '$' + MONEY_FMT.format(stats.avg_win);
+    els.avgLoss.textContent = '$' + MONEY_FMT.format(stats.avg_loss);
+    
+    const expectancyEl = els.expectancy;
+    expectancyEl.textContent = '$' + MONEY_FMT.format(stats.expectancy);
+    expectancyEl.className = 'stat-value ' + (stats.expectancy >= 0 ? 'positive' : 'negative');
+}
+
+// Show trades (renders the active tab)
+function showTrades(trades) {
+    allTrades = trades;
+    openTrades = [];
+    closedTrades = [];
+    tradesById = new Map();
+    for (const t of allTrades) {
+        (t.is_closed ? closedTrades : openTrades).push(t);
+        tradesById.set(t.id, t);
+    }
+    tradesVersion++;
+    console.log('Loaded', allTrades.length, 'trades');
+    renderTrades();
+}
+
+// Render trades based on active tab
+function renderTrades() {
+    // Nothing loaded yet, or this tab already shows the current data
+    if (!tradesVersion || renderedVersion[activeTab] === tradesVersion) return;
+    renderedVersion[activeTab] = tradesVersion;
+
+    if (activeTab === 'open') {
+        renderOpenTrades();
+    } else if (activeTab === 'closed') {
+        renderClosedTrades();
+    } else {
+        renderAllTrades();
+    }
+}
+
+// Row skeletons come from the <template>s under each table: they are
+// parsed once, and rendering only clones them and sets text/classes.
+const ROW_TPL = {
+    all: document.getElementById('allRowTpl').content.firstElementChild,
+    open: document.getElementById('openRowTpl').content.firstElementChild,
+    closed: document.getElementById('closedRowTpl').content.firstElementChild,
+};
+
+function money(value) {
+    return '$' + MONEY_FMT.format(value);
+}
+
+function signClass(value) {
+    return value !== null && value >= 0 ? 'positive' : 'negative';
+}
+
+function cloneRow(tab, trade) {
+    const row = ROW_TPL[tab].cloneNode(true);
+    row.dataset.id = trade.id;
+    return row;
+}
+
+function emptyRow(colspan, text) {
+    const td = document.createElement('td');
+    td.colSpan = colspan;
+    td.style.cssText = 'text-align: center; padding: 40px; color: #888;';
+    td.textContent = text;
+    const tr = document.createElement('tr');
+    tr.appendChild(td);
+    return tr;
+}
+
+// Placeholder rows for empty tables, built once and cloned when shown
+const EMPTY_ROWS = {
+    all: emptyRow(13, 'No trades yet. Add your first trade above!'),
+    open: emptyRow(12, 'No open positions'),
+    closed: emptyRow(9, 'No closed positions'),
+};
+
+function showEmptyTable(tbody, tab) {
+    tbody.replaceChildren(EMPTY_ROWS[tab].cloneNode(true));
+}
+
+// The ticker..warnings cells shared by the "all" and "open" tables,
+// starting at cells[i]
+function fillPositionCells(cells, i, trade, pnl, pnlPct) {
+    cells[i].textContent = trade.ticker;
+    cells[i + 1].textContent = trade.trade_date;
+    cells[i + 2].textContent = '$' + trade.buy_price.toFixed(2);
+    cells[i + 3].textContent = trade.quantity.toFixed(4);
+    cells[i + 4].textContent = money(trade.position_size);
+    cells[i + 5].textContent = money(trade.risk_amount);
+    cells[i + 6].textContent = trade.risk_pct + '%';
+    if (trade.risk_pct > 2) cells[i + 6].className = 'negative';
+    cells[i + 7].textContent = trade.rr_ratio !== null ? trade.rr_ratio.toFixed(2) : 'N/A';
+    cells[i + 7].className = trade.rr_ratio !== null && trade.rr_ratio < 1.5 ? 'negative' : 'positive';
+    cells[i + 8].textContent = pnl !== null ? money(pnl) : 'N/A';
+    cells[i + 8].className = signClass(pnl);
+    cells[i + 9].textContent = pnlPct !== null ? pnlPct.toFixed(2) + '%' : 'N/A';
+    cells[i + 9].className = signClass(pnlPct);
+    // Badge markup is built (and escaped) server-side
+    cells[i + 10].innerHTML = trade.warnings_html || '-';
+}
+
+// Render all trades
+function renderAllTrades() {
+    const tbody = els.allTradesBody;
+    
+    if (allTrades.length === 0) {
+        showEmptyTable(tbody, 'all');
+        return;
+    }
+
+    const frag = document.createDocumentFragment();
+    for (const trade of allTrades) {
+        const row = cloneRow('all', trade);
+        const cells = row.cells;
+        const status = trade.is_closed ? 'closed' : 'open';
+        const badge = cells[0].firstElementChild;
+        badge.classList.add(status);
+        badge.textContent = status.toUpperCase();
+        if (trade.is_closed) {
+            fillPositionCells(cells, 1, trade, trade.realized_pnl, trade.realized_pnl_pct);
+            cells[12].querySelector('.btn-close').remove();
+        } else {
+            fillPositionCells(cells, 1, trade, trade.unrealized_pnl, trade.unrealized_pnl_pct);
+        }
+        frag.appendChild(row);
+    }
+    tbody.replaceChildren(frag);
+}
+
+// Render open trades
+function renderOpenTrades() {
+    const tbody = els.openTradesBody;
+    
+    if (openTrades.length === 0) {
+        showEmptyTable(tbody, 'open');
+        return;
+    }
+
+    const frag = document.createDocumentFragment();
+    for (const trade of openTrades) {
+        const row = cloneRow('open', trade);
+        fillPositionCells(row.cells, 0, trade, trade.unrealized_pnl, trade.unrealized_pnl_pct);
+        frag.appendChild(row);
+    }
+    tbody.replaceChildren(frag);
+}
+
+// Render closed trades
+function renderClosedTrades() {
+    const tbody = els.closedTradesBody;
+    
+    if (closedTrades.length === 0) {
+        showEmptyTable(tbody, 'closed');
+        return;
+    }
+
+    const frag = document.createDocumentFragment();
+    for (const trade of closedTrades) {
+        const row = cloneRow('closed', trade);
+        const cells = row.cells;
+        cells[0].textContent = trade.ticker;
+        cells[1].textContent = trade.trade_date;
+        cells[2].textContent = trade.close_date || 'N/A';
+        cells[3].textContent = '$' + trade.buy_price.toFixed(2);
+        cells[4].textContent = '$' + trade.close_price.toFixed(2);
+        cells[5].textContent = trade.quantity.toFixed(4);
+        cells[6].textContent = money(trade.realized_pnl);
+        cells[6].className = signClass(trade.realized_pnl);
+        cells[7].textContent = trade.realized_pnl_pct.toFixed(2) + '%';
+        cells[7].className = signClass(trade.realized_pnl_pct);
+        frag.appendChild(row);
+    }
+    tbody.replaceChildren(frag);
+}
+
+// Row buttons have no handlers of their own; one listener per table
+// dispatches on the button's data-action and the row's data-id.
+const TRADE_ACTIONS = { close: openCloseModal, edit: editTrade, delete: deleteTrade };
+
+function onTradeAction(event) {
+    const btn = event.target.closest('button[data-action]');
+    if (!btn) return;
+    TRADE_ACTIONS[btn.dataset.action](Number(btn.closest('tr').dataset.id));
+}
+for (const tab of ['all', 'open', 'closed']) {
+    els[tab + 'TradesBody'].addEventListener('click', onTradeAction);
+}
+
+// Save trade (add or update)
+async function saveTrade() {
+    const ticker = els.ticker.value.toUpperCase().trim();
+    const buyPrice = parseFloat(els.buyPrice.value);
+    const quantity = parseFloat(els.quantity.value);
+    const stopLoss = els.stopLoss.value ? parseFloat(els.stopLoss.value) : null;
+    const takeProfit = els.takeProfit.value ? parseFloat(els.takeProfit.value) : null;
+    const timeframe = els.timeframe.value;
+    const tradeDate = els.tradeDate.value;
+    const notes = els.notes.value.trim();
+
+    if (!ticker || isNaN(buyPrice) || isNaN(quantity) || !tradeDate) {
+        showMessage('Please fill in all required fields (Ticker, Buy Price, Quantity, Date)', 'error');
+        return;
+    }
+
+    if (buyPrice <= 0 || quantity <= 0) {
+        showMessage('Buy price and quantity must be positive', 'error');
+        return;
+    }
+
+    const payload = {
+        ticker,
+        buy_price: buyPrice,
+        quantity,
+        timeframe,
+        trade_date: tradeDate,
+        stop_loss: stopLoss,
+        take_profit: takeProfit,
+        notes: notes || null
+    };
+
+    console.log('Saving trade:', payload);
+
+    try {
+        const saveBtn = els.saveTradeBtn;
+        saveBtn.disabled = true;
+        saveBtn.textContent = editingTradeId ? 'Updating...' : 'Adding...';
+        
+        const url = editingTradeId ? `/api/trades/${editingTradeId}` : '/api/trades';
+        const method = editingTradeId ? 'PUT' : 'POST';
+        
+        const res = await fetch(url, {
+            method: method,
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload)
+        });
+        
+        const data = await res.json();
+        console.log('Save response:', data);
+        
+        if (data.success) {
+            showMessage(editingTradeId ? 'Trade updated!' : 'Trade added!', 'success');
+            clearForm();
+            
+            // Reload all data
+            await loadPortfolioData();
+        } else {
+            showMessage('Failed to save trade: ' + (data.error || 'Unknown error'), 'error');
+        }
+    } catch (error) {
+        console.error('Error saving trade:', error);
+        showMessage('Failed to save trade: ' + error.message, 'error');
+    } finally {
+        const saveBtn = els.saveTradeBtn;
+        saveBtn.disabled = false;
+        saveBtn.textContent = editingTradeId ? 'Update Trade' : 'Add Trade';
+    }
+}
+
+// Edit trade
+function editTrade(id) {
+    const trade = tradesById.get(id);
+    if (!trade) {
+        console.error('Trade not found:', id);
+        return;
+    }
+
+    console.log('Editing trade:', trade);
+
+    els.ticker.value = trade.ticker;
+    els.buyPrice.value = trade.buy_price;
+    els.quantity.value = trade.quantity;
+    els.stopLoss.value = trade.stop_loss || '';
+    els.takeProfit.value = trade.take_profit || '';
+    els.timeframe.value = trade.timeframe;
+    els.tradeDate.value = trade.trade_date;
+    els.notes.value = trade.notes || '';
+
+    calculateValues();
+
+    editingTradeId = id;
+    els.formTitle.textContent = '✏️ Edit Trade';
+    els.saveTradeBtn.textContent = 'Update Trade';
+    els.cancelBtn.style.display = 'inline-block';
+    
+    // Scroll to form
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+
+// Delete trade
+async function deleteTrade(id) {
+    if (!confirm('Delete this trade? This cannot be undone.')) return;
+
+    try {
+        const res = await fetch(`/api/trades/${id}`, { method: 'DELETE' });
+        const data = await res.json();
+        
+        if (data.success) {
+            showMessage('Trade deleted', 'success');
+            await loadPortfolioData();
+        } else {
+            showMessage('Failed to delete trade: ' + data.error, 'error');
+        }
+    } catch (error) {
+        console.error('Error deleting trade:', error);
+        showMessage('Failed to delete trade: ' + error.message, 'error');
+    }
+}
+
+// Open close modal
+function openCloseModal(id) {
+    closingTradeId = id;
+    els.closeModal.classList.add('active');
+    els.closeDate.value = new Date().toISOString().split('T')[0];
+}
+
+// Close modal
+function closeModal() {
+    closingTradeId = null;
+    els.closeModal.classList.remove('active');
+    els.closePrice.value = '';
+}
+
+// Confirm close trade
+async function confirmCloseTrade() {
+    const closePrice = parseFloat(els.closePrice.value);
+    const closeDate = els.closeDate.value;
+
+    if (isNaN(closePrice) || !closeDate) {
+        showMessage('Please enter close price and date', 'error');
+        return;
+    }
+
+    try {
+        const res = await fetch(`/api/trades/${closingTradeId}/close`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ close_price: closePrice, close_date: closeDate })
+        });
+        
+        const data = await res.json();
+        if (data.success) {
+            showMessage('Trade closed successfully!', 'success');
+            closeModal();
+            await loadPortfolioData();
+        } else {
+            showMessage('Failed to close trade: ' + data.error, 'error');
+        }
+    } catch (error) {
+        console.error('Error closing trade:', error);
+        showMessage('Failed to close trade: ' + error.message, 'error');
+    }
+}
+
+// Clear form
+function clearForm() {
+    els.ticker.value = '';
+    els.buyPrice.value = '';
+    els.quantity.value = '';
+    els.stopLoss.value = '';
+    els.takeProfit.value = '';
+    els.timeframe.value = 'Long';
+    els.tradeDate.value = new Date().toISOString().split('T')[0];
+    els.notes.value = '';
+    
+    calculateValues();
+    
+    editingTradeId = null;
+    els.formTitle.textContent = '➕ Add New Trade';
+    els.saveTradeBtn.textContent = 'Add Trade';
+    els.cancelBtn.style.display = 'none';
+}
+
+// Show message
+function showMessage(text, type) {
+    const msgEl = els.message;
+    msgEl.innerHTML = `<div class="message ${type}">${text}</div>`;
+    setTimeout(() => msgEl.innerHTML = '', 5000);
+}
+
+// Logout
+async function logout() {
+    await fetch('/api/logout');
+    window.location.href = '/login';
+}
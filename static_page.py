@@ -0,0 +1,94 @@
+"""
+Pre-encoded responses for pages whose HTML never changes at runtime.
+
+The HTML is minified, encoded and brotli/gzip-compressed once when the page is
+built (module import), so serving it is just picking the right byte string for
+the client's Accept-Encoding. Assets those pages link to are referenced through
+asset_url(), which fingerprints them so they can be cached indefinitely.
+"""
+import gzip
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import Optional
+
+import brotli
+from flask import Response, request
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+
+_SCRIPT_BLOCK = re.compile(r'(<script\b.*?</script>)', re.S | re.I)
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.S)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_STYLE_BLOCK = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.S | re.I)
+
+
+def minify_html(html: str) -> str:
+    """Cheap, safe size reduction for hand-indented pages.
+
+    Drops indentation and blank lines everywhere, HTML comments outside
+    <script> and CSS comments inside <style>. Line breaks are kept so inline
+    JS never depends on semicolon insertion changing.
+    """
+    parts = _SCRIPT_BLOCK.split(html)
+    for i, part in enumerate(parts):
+        if i % 2 == 0:  # markup between scripts
+            part = _HTML_COMMENT.sub('', part)
+            part = _STYLE_BLOCK.sub(
+                lambda m: m.group(1) + _CSS_COMMENT.sub('', m.group(2)) + m.group(3), part)
+        parts[i] = '\n'.join(line.strip() for line in part.splitlines() if line.strip())
+    return '\n'.join(p for p in parts if p)
+
+
+@lru_cache(maxsize=None)
+def asset_url(filename: str) -> str:
+    """URL for a file under static/ with a content-hash version parameter.
+
+    The hash changes whenever the file does, so responses for versioned URLs
+    can be marked immutable (see the static cache headers in app.py).
+    """
+    with open(os.path.join(STATIC_DIR, filename), 'rb') as f:
+        digest = hashlib.md5(f.read()).hexdigest()[:10]
+    return f'/static/{filename}?v={digest}'
+
+
+class StaticPage:
+    """Immutable HTML page encoded once and served without templating."""
+
+    def __init__(self, html: str):
+        self.body = minify_html(html).encode('utf-8')
+        self.body_gzip = gzip.compress(self.body, compresslevel=9)
+        # Max quality is too slow per request but fine once at build time
+        self.body_br = brotli.compress(self.body, quality=11)
+        # One strong validator per representation, since the bytes differ.
+        self.etag = hashlib.md5(self.body).hexdigest()
+        self.etag_gzip = self.etag + '-gz'
+        self.etag_br = self.etag + '-br'
+
+    def response(self, max_age: Optional[int] = None) -> Response:
+        """Build a response for the current request (fresh headers each call).
+
+        Answers with 304 when If-None-Match matches. Without max_age the
+        browser revalidates on every load; with it, it may reuse its copy
+        for that many seconds first.
+        """
+        if 'br' in request.accept_encodings:
+            resp = Response(self.body_br, mimetype='text/html')
+            resp.headers['Content-Encoding'] = 'br'
+            resp.set_etag(self.etag_br)
+        elif 'gzip' in request.accept_encodings:
+            resp = Response(self.body_gzip, mimetype='text/html')
+            resp.headers['Content-Encoding'] = 'gzip'
+            resp.set_etag(self.etag_gzip)
+        else:
+            resp = Response(self.body, mimetype='text/html')
+            resp.set_etag(self.etag)
+        resp.vary.add('Accept-Encoding')
+        resp.cache_control.private = True
+        if max_age:
+            resp.cache_control.max_age = max_age
+        else:
+            resp.cache_control.no_cache = True
+        return resp.make_conditional(request)
@@ -0,0 +1,103 @@
+"""
+Unit tests for EventBus in event_bus.py
+
+Run with:
+    cd /path/to/stock-alerts-multiuser
+    python -m pytest tests/test_event_bus.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import queue
+
+import pytest
+from event_bus import EventBus
+
+
+@pytest.fixture
+def bus():
+    return EventBus(max_queue=2)
+
+
+def drain(q):
+    items = []
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
+
+
+class TestSubscribe:
+    def test_subscriber_receives_own_events(self, bus):
+        q = bus.subscribe(1)
+        bus.publish(1, 'prices', {'AAPL': 187.5})
+        assert drain(q) == [('prices', {'AAPL': 187.5})]
+
+    def test_every_subscriber_of_a_user_gets_the_event(self, bus):
+        tabs = [bus.subscribe(1), bus.subscribe(1)]
+        bus.publish(1, 'trades')
+        assert [drain(q) for q in tabs] == [[('trades', None)], [('trades', None)]]
+
+    def test_other_users_do_not_see_the_event(self, bus):
+        mine, theirs = bus.subscribe(1), bus.subscribe(2)
+        bus.publish(1, 'alerts')
+        assert drain(mine) == [('alerts', None)]
+        assert drain(theirs) == []
+
+
+class TestPublish:
+    def test_without_subscribers_is_a_no_op(self, bus):
+        bus.publish(42, 'prices')
+        assert not bus._subscribers
+
+    def test_full_queue_drops_new_events_without_blocking(self, bus):
+        q = bus.subscribe(1)
+        for n in range(5):
+            bus.publish(1, 'tick', n)
+        assert drain(q) == [('tick', 0), ('tick', 1)]
+
+    def test_full_queue_does_not_starve_other_subscribers(self, bus):
+        stalled, live = bus.subscribe(1), bus.subscribe(1)
+        bus.publish(1, 'tick', 0)
+        bus.publish(1, 'tick', 1)
+        drain(live)
+        bus.publish(1, 'tick', 2)
+        assert drain(live) == [('tick', 2)]
+        assert drain(stalled) == [('tick', 0), ('tick', 1)]
+
+    def test_broadcast_reaches_every_user(self, bus):
+        a, b = bus.subscribe(1), bus.subscribe(2)
+        bus.broadcast('amd', {'scans': 3})
+        assert drain(a) == [('amd', {'scans': 3})]
+        assert drain(b) == [('amd', {'scans': 3})]
+
+
+class TestUnsubscribe:
+    def test_stops_delivery(self, bus):
+        q = bus.subscribe(1)
+        bus.unsubscribe(1, q)
+        bus.publish(1, 'prices')
+        assert drain(q) == []
+
+    def test_keeps_other_subscribers_of_the_user(self, bus):
+        closed, open_ = bus.subscribe(1), bus.subscribe(1)
+        bus.unsubscribe(1, closed)
+        bus.publish(1, 'prices')
+        assert drain(open_) == [('prices', None)]
+        assert 1 in bus._subscribers
+
+    def test_last_subscriber_removes_the_user(self, bus):
+        q = bus.subscribe(1)
+        bus.unsubscribe(1, q)
+        assert 1 not in bus._subscribers
+
+    def test_unknown_user_or_queue_is_ignored(self, bus):
+        q = bus.subscribe(1)
+        bus.unsubscribe(2, q)
+        bus.unsubscribe(1, queue.Queue())
+        bus.unsubscribe(1, q)
+        bus.unsubscribe(1, q)
+        assert not bus._subscribers
@@ -0,0 +1,71 @@
+"""
+Unit tests for PortfolioCalculator in portfolio_calculator.py
+
+Run with:
+    cd /path/to/stock-alerts-multiuser
+    python -m pytest tests/test_portfolio_calculator.py -v
+"""
+
+import sys
+import os
+from datetime import date, datetime
+from decimal import Decimal
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+from portfolio_calculator import PortfolioCalculator
+
+
+def trade_row(**overrides):
+    row = {
+        'id': 7, 'ticker': 'AAPL', 'buy_price': Decimal('100.00'), 'quantity': Decimal('10'),
+        'position_size': Decimal('1000.00'), 'risk_amount': Decimal('50.00'),
+        'timeframe': 'Swing', 'trade_date': date(2024, 1, 2), 'stop_loss': Decimal('95.00'),
+        'take_profit': Decimal('115.00'), 'is_closed': False, 'close_price': None,
+        'close_date': None, 'notes': None, 'created_at': datetime(2024, 1, 2, 9, 30),
+    }
+    row.update(overrides)
+    return row
+
+
+class TestEnrichTrade:
+    def test_normalizes_types_for_json(self):
+        enriched = PortfolioCalculator.enrich_trade_with_calculations(trade_row(), 10000, 110.0)
+        assert enriched['buy_price'] == 100.0 and type(enriched['buy_price']) is float
+        assert type(enriched['quantity']) is float
+        assert enriched['close_price'] is None
+        assert enriched['trade_date'] == '2024-01-02'
+        assert enriched['created_at'] == '2024-01-02T09:30:00'
+        assert enriched['id'] == 7 and enriched['is_closed'] is False
+
+    def test_open_trade_pnl(self):
+        enriched = PortfolioCalculator.enrich_trade_with_calculations(trade_row(), 10000, 110.0)
+        assert enriched['unrealized_pnl'] == pytest.approx(100.0)
+        assert enriched['realized_pnl'] is None
+        assert enriched['risk_pct'] == 0.5
+        assert enriched['rr_ratio'] == 3.0
+
+    def test_closed_trade_pnl(self):
+        row = trade_row(is_closed=True, close_price=Decimal('90.00'), close_date=date(2024, 2, 1))
+        enriched = PortfolioCalculator.enrich_trade_with_calculations(row, 10000)
+        assert enriched['realized_pnl'] == pytest.approx(-100.0)
+        assert enriched['close_date'] == '2024-02-01'
+        assert enriched['unrealized_pnl'] is None
+
+    def test_does_not_mutate_input(self):
+        row = trade_row()
+        PortfolioCalculator.enrich_trade_with_calculations(row, 10000, 110.0)
+        assert row['buy_price'] == Decimal('100.00')
+        assert row['trade_date'] == date(2024, 1, 2)
+
+    def test_warnings_html(self):
+        row = trade_row(risk_amount=Decimal('100.00'), stop_loss=Decimal('90.00'), take_profit=Decimal('110.00'))
+        enriched = PortfolioCalculator.enrich_trade_with_calculations(row, 1000, 110.0)
+        assert enriched['warnings_html'] == (
+            '<span class="warning-badge error">high risk</span>'
+            '<span class="warning-badge warning">low rr</span>'
+        )
+
+    def test_warnings_html_escapes(self):
+        html = PortfolioCalculator.render_warnings_html([{'type': '<b>', 'severity': '"x'}])
+        assert html == '<span class="warning-badge &quot;x">&lt;b&gt;</span>'
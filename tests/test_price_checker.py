@@ -0,0 +1,147 @@
+"""
+Unit tests for PriceChecker in price_checker.py (network calls are faked)
+
+Run with:
+    cd /path/to/stock-alerts-multiuser
+    python -m pytest tests/test_price_checker.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+import price_checker as pc_module
+from price_checker import PriceChecker
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def chart(closes, market_price=None):
+    meta = {} if market_price is None else {'regularMarketPrice': market_price}
+    return {'chart': {'result': [{
+        'meta': meta,
+        'indicators': {'quote': [{'close': closes}]},
+    }]}}
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    pc_module.invalidate_price_cache()
+    calls = []
+
+    def install(response):
+        def get(url, **kwargs):
+            calls.append((url, kwargs))
+            return response
+        monkeypatch.setattr(pc_module._SESSION, 'get', get)
+        return calls
+    return install
+
+
+class TestGetPriceAndMA:
+    def test_single_request_returns_price_and_ma(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0, None, 2.0, 3.0, 4.0], market_price=4.5)))
+        price, ma = PriceChecker.get_price_and_ma('AAPL', 3)
+        assert price == 4.5
+        assert ma == pytest.approx(3.0)
+        assert len(calls) == 1
+
+    def test_falls_back_to_last_close_without_meta_price(self, fake_get):
+        fake_get(FakeResponse(chart([10.0, 20.0])))
+        assert PriceChecker.get_price_and_ma('AAPL', 2) == (20.0, 15.0)
+
+    def test_not_enough_history_keeps_price(self, fake_get):
+        fake_get(FakeResponse(chart([10.0, 20.0], market_price=21.0)))
+        assert PriceChecker.get_price_and_ma('AAPL', 50) == (21.0, None)
+
+    def test_rate_limited(self, fake_get):
+        fake_get(FakeResponse({}, status_code=429))
+        assert PriceChecker.get_price_and_ma('AAPL', 20) == (None, None)
+
+    def test_malformed_payload(self, fake_get):
+        fake_get(FakeResponse({'chart': {'result': []}}))
+        assert PriceChecker.get_price_and_ma('AAPL', 20) == (None, None)
+
+
+class TestGetCachedPrice:
+    def test_reuses_recent_quote(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0], market_price=101.0)))
+        assert PriceChecker.get_cached_price('MSFT') == 101.0
+        assert PriceChecker.get_cached_price('MSFT') == 101.0
+        assert len(calls) == 1
+
+    def test_expired_quote_is_refetched(self, fake_get, monkeypatch):
+        calls = fake_get(FakeResponse(chart([1.0], market_price=101.0)))
+        PriceChecker.get_cached_price('MSFT')
+        monkeypatch.setattr(pc_module, '_PRICE_TTL', -1)
+        pc_module.invalidate_price_cache()
+        PriceChecker.get_cached_price('MSFT')
+        PriceChecker.get_cached_price('MSFT')
+        assert len(calls) == 3
+
+    def test_failures_are_not_cached(self, fake_get):
+        calls = fake_get(FakeResponse({}, status_code=429))
+        assert PriceChecker.get_cached_price('MSFT') is None
+        assert PriceChecker.get_cached_price('MSFT') is None
+        assert len(calls) == 2
+
+    def test_ma_fetch_seeds_price_cache(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0, 2.0], market_price=3.0)))
+        PriceChecker.get_price_and_ma('MSFT', 2)
+        assert PriceChecker.get_cached_price('MSFT') == 3.0
+        assert len(calls) == 1
+
+
+class TestGetCachedMovingAverage:
+    def test_reuses_recent_value(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0, 2.0, 3.0], market_price=3.0)))
+        assert PriceChecker.get_cached_moving_average('MSFT', 2) == 2.5
+        assert PriceChecker.get_cached_moving_average('MSFT', 2) == 2.5
+        assert len(calls) == 1
+
+    def test_keyed_by_period(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0, 2.0, 3.0], market_price=3.0)))
+        PriceChecker.get_cached_moving_average('MSFT', 2)
+        assert PriceChecker.get_cached_moving_average('MSFT', 3) == 2.0
+        assert len(calls) == 2
+
+    def test_price_and_ma_fetch_seeds_cache(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0, 2.0], market_price=3.0)))
+        PriceChecker.get_price_and_ma('MSFT', 2)
+        assert PriceChecker.get_cached_moving_average('MSFT', 2) == 1.5
+        assert len(calls) == 1
+
+
+class TestGetCachedPrices:
+    def test_fetches_each_distinct_ticker_once(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0], market_price=10.0)))
+        prices = PriceChecker.get_cached_prices(['AAPL', 'MSFT', 'AAPL'])
+        assert prices == {'AAPL': 10.0, 'MSFT': 10.0}
+        assert sorted(url.rsplit('/', 1)[1] for url, _ in calls) == ['AAPL', 'MSFT']
+
+    def test_cached_tickers_skip_the_network(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0], market_price=10.0)))
+        PriceChecker.get_cached_price('AAPL')
+        prices = PriceChecker.get_cached_prices(['AAPL', 'MSFT'])
+        assert prices == {'AAPL': 10.0, 'MSFT': 10.0}
+        assert len(calls) == 2
+
+    def test_failed_lookups_map_to_none(self, fake_get):
+        fake_get(FakeResponse({}, status_code=429))
+        assert PriceChecker.get_cached_prices(['AAPL', 'MSFT']) == {'AAPL': None, 'MSFT': None}
+
+    def test_empty(self, fake_get):
+        calls = fake_get(FakeResponse(chart([1.0], market_price=10.0)))
+        assert PriceChecker.get_cached_prices([]) == {}
+        assert calls == []
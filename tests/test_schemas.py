@@ -0,0 +1,95 @@
+"""
+Unit tests for the request payload schemas in schemas.py
+
+Run with:
+    cd /path/to/stock-alerts-multiuser
+    python -m pytest tests/test_schemas.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+from schemas import CreateAlertRequest, TradeInput
+
+
+class TestCreateAlertRequest:
+    def test_price_alert_defaults(self):
+        req = CreateAlertRequest.from_json({'ticker': ' aapl ', 'target_price': '187.5'})
+        assert req.ticker == 'AAPL'
+        assert req.target_price == 187.5
+        assert req.alert_type == 'price'
+        assert req.ma_period is None
+        assert req.direction == 'up'
+
+    def test_ma_alert(self):
+        req = CreateAlertRequest.from_json(
+            {'ticker': 'MSFT', 'alert_type': 'ma', 'ma_period': 50, 'target_price': 0}
+        )
+        assert req.alert_type == 'ma'
+        assert req.ma_period == 50
+
+    def test_price_alert_drops_ma_period(self):
+        req = CreateAlertRequest.from_json({'ticker': 'MSFT', 'ma_period': 50, 'target_price': 1})
+        assert req.ma_period is None
+
+    @pytest.mark.parametrize('payload, message', [
+        ({}, 'Ticker required'),
+        ({'ticker': '   '}, 'Ticker required'),
+        ({'ticker': 'AAPL', 'alert_type': 'rsi'}, 'Invalid alert type'),
+        ({'ticker': 'AAPL', 'alert_type': 'ma', 'ma_period': 30}, 'Invalid MA period'),
+        ({'ticker': 'AAPL', 'alert_type': 'ma'}, 'Invalid MA period'),
+        ({'ticker': 'AAPL', 'direction': 'sideways'}, 'Invalid direction'),
+        ({'ticker': 'AAPL', 'target_price': 'abc'}, 'Invalid target price'),
+        (['AAPL'], 'Invalid request body'),
+    ])
+    def test_rejects_invalid_payloads(self, payload, message):
+        with pytest.raises(ValueError, match=message):
+            CreateAlertRequest.from_json(payload)
+
+
+class TestTradeInput:
+    BODY = {'ticker': 'aapl', 'buy_price': '100', 'quantity': 10,
+            'timeframe': 'Swing', 'trade_date': '2024-01-02'}
+
+    def test_parses_and_derives_sizes(self):
+        trade = TradeInput.from_json({**self.BODY, 'stop_loss': '95', 'notes': '  breakout '})
+        assert trade.ticker == 'AAPL'
+        assert trade.stop_loss == 95.0
+        assert trade.take_profit is None
+        assert trade.notes == 'breakout'
+        assert trade.position_size == 1000.0
+        assert trade.risk_amount == 50.0
+        assert trade.as_trade_args() == (
+            'AAPL', 100.0, 10.0, 1000.0, 50.0, 'Swing', '2024-01-02', 95.0, None, 'breakout')
+
+    def test_default_risk_without_stop_loss(self):
+        trade = TradeInput.from_json({**self.BODY, 'stop_loss': '', 'notes': '   '})
+        assert trade.stop_loss is None
+        assert trade.notes is None
+        assert trade.risk_amount == 20.0
+
+    @pytest.mark.parametrize('overrides, message', [
+        ({'quantity': 'ten'}, 'Invalid quantity'),
+        ({'buy_price': 'abc'}, 'Invalid buy price'),
+        ({'buy_price': None}, 'Invalid buy price'),
+        ({'buy_price': ''}, 'Invalid buy price'),
+        ({'buy_price': 0}, 'Invalid buy price'),
+        ({'buy_price': '-5'}, 'Invalid buy price'),
+        ({'quantity': None}, 'Invalid quantity'),
+        ({'quantity': '  '}, 'Invalid quantity'),
+        ({'quantity': 0}, 'Invalid quantity'),
+        ({'quantity': -1}, 'Invalid quantity'),
+        ({'quantity': 'nan'}, 'Invalid quantity'),
+        ({'take_profit': 'x'}, 'Invalid take profit'),
+    ])
+    def test_rejects_invalid_numbers(self, overrides, message):
+        with pytest.raises(ValueError, match=message):
+            TradeInput.from_json({**self.BODY, **overrides})
+
+    def test_missing_required_field(self):
+        body = dict(self.BODY)
+        del body['timeframe']
+        with pytest.raises(ValueError, match="Missing required field: 'timeframe'"):
+            TradeInput.from_json(body)
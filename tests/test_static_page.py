@@ -0,0 +1,93 @@
+"""
+Unit tests for the pre-encoded page responses in static_page.py
+
+Run with:
+    cd /path/to/stock-alerts-multiuser
+    python -m pytest tests/test_static_page.py -v
+"""
+
+import sys
+import os
+import gzip
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import brotli
+import pytest
+from flask import Flask
+from static_page import StaticPage, minify_html
+
+HTML = '<!DOCTYPE html><html><body>' + 'portfolio ' * 200 + '</body></html>'
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+class TestMinifyHtml:
+    def test_strips_indentation_blank_lines_and_comments(self):
+        html = '<div>\n    <!-- note -->\n\n    <p>Hi</p>\n</div>\n'
+        assert minify_html(html) == '<div>\n<p>Hi</p>\n</div>'
+
+    def test_css_comments_removed_only_inside_style(self):
+        html = '<style>\n  /* x */ .a { color: red; }\n</style>\n<p>/* text */</p>'
+        assert minify_html(html) == '<style>\n.a { color: red; }\n</style>\n<p>/* text */</p>'
+
+    def test_script_keeps_line_breaks_and_comment_like_text(self):
+        html = "<script>\n    const a = '<!-- x -->'\n    const b = 2\n</script>"
+        assert minify_html(html) == "<script>\nconst a = '<!-- x -->'\nconst b = 2\n</script>"
+
+
+class TestStaticPageResponse:
+    def test_brotli_preferred(self, app):
+        page = StaticPage(HTML)
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate, br'}):
+            resp = page.response()
+        assert resp.headers['Content-Encoding'] == 'br'
+        assert brotli.decompress(resp.get_data()) == page.body
+        assert resp.get_etag() == (page.etag_br, False)
+        assert len(page.body_br) < len(page.body_gzip)
+
+    def test_gzip_when_accepted(self, app):
+        page = StaticPage(HTML)
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            resp = page.response()
+        assert resp.status_code == 200
+        assert resp.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(resp.get_data()) == page.body
+        assert resp.get_etag() == (page.etag_gzip, False)
+        assert 'Accept-Encoding' in resp.vary
+
+    def test_identity_without_gzip(self, app):
+        page = StaticPage(HTML)
+        with app.test_request_context():
+            resp = page.response()
+        assert 'Content-Encoding' not in resp.headers
+        assert resp.get_data() == page.body
+        assert resp.get_etag() == (page.etag, False)
+
+    def test_not_modified_on_matching_etag(self, app):
+        page = StaticPage(HTML)
+        headers = {'Accept-Encoding': 'gzip', 'If-None-Match': f'"{page.etag_gzip}"'}
+        with app.test_request_context(headers=headers):
+            resp = page.response()
+        assert resp.status_code == 304
+
+    def test_identity_etag_does_not_match_gzip_body(self, app):
+        page = StaticPage(HTML)
+        headers = {'Accept-Encoding': 'gzip', 'If-None-Match': f'"{page.etag}"'}
+        with app.test_request_context(headers=headers):
+            resp = page.response()
+        assert resp.status_code == 200
+
+    def test_cache_control(self, app):
+        page = StaticPage(HTML)
+        with app.test_request_context():
+            revalidate = page.response()
+            cached = page.response(max_age=300)
+        assert revalidate.cache_control.private
+        assert revalidate.cache_control.no_cache
+        assert cached.cache_control.private
+        assert cached.cache_control.max_age == 300
+        assert not cached.cache_control.no_cache
+